@@ -6,7 +6,6 @@ different Qdrant vector database configurations.
 
 import os
 import sys
-import json
 
 # Add the parent directory to the path so we can import the package
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
@@ -14,6 +13,8 @@ sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')
 from src.qdrant_evaluation import (
     get_client,
     get_embedding,
+    load_test_dataset,
+    convert_json_query_set,
     evaluate_ann,
     evaluate_hnsw_ef,
     evaluate_ann_quantized,
@@ -33,11 +34,12 @@ def main():
     # Collection name
     collection_name = 'arxiv_papers'
 
-    # Load test dataset
+    # Load test dataset, converting the JSON file to a memory-mapped query set once
     try:
-        with open("queries_embeddings.json", 'r', encoding='utf-8') as file:
-            embeddings = json.load(file)
-            print(f"Loaded {len(embeddings)} embeddings from test dataset")
+        if not os.path.exists("queries_embeddings.npy"):
+            convert_json_query_set("queries_embeddings.json", "queries_embeddings")
+        embeddings = load_test_dataset("queries_embeddings.npy")
+        print(f"Loaded {len(embeddings)} embeddings from test dataset")
     except FileNotFoundError:
         print("Test dataset not found. Creating a sample embedding...")
         # Create a sample embedding if the dataset is not available
@@ -9,11 +9,17 @@ setup(
         "qdrant-client>=1.1.0",
         "openai>=1.0.0",
         "python-dotenv>=1.0.0",
-        "pandas>=1.3.0",
+        "numpy>=1.21.0",
+        "pandas>=1.5.0",
         "faiss-cpu>=1.7.4",
         "sentence-transformers>=2.2.2",
         "requests>=2.28.0",
     ],
+    entry_points={
+        "console_scripts": [
+            "qdrant-bench=qdrant_evaluation.cli:main",
+        ],
+    },
     author="Daniel Wirth",
     author_email="dnlwrthstr@gmail.com",
     description="Evaluation and benchmarking of Qdrant vector database configurations",
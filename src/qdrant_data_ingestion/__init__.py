@@ -1 +1,11 @@
-from .data_ingestion import DataIngestion, ingest_from_file
+from .data_ingestion import (
+    DataIngestion,
+    ingest_from_file,
+    primary_category,
+    FULL_VECTOR,
+    REDUCED_VECTOR,
+    CATEGORY_SHARD_KEYS
+)
+from .columnar import ColumnarBatch, decode_batch, stream_columnar, point_ids, PAYLOAD_FIELDS
+from .pca import PcaProjection
+from .pipeline import PipelinedUploader, IngestionError, BatchError
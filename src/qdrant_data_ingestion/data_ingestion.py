@@ -5,16 +5,24 @@ This module provides functionality to ingest data into a Qdrant vector database.
 It handles streaming data from JSON files, creating collections, and uploading vectors with payloads.
 """
 
+import itertools
 import json
 import logging
 import os
+import threading
+import time
 import uuid
-from typing import Any, Dict, Generator, List, Optional, Union
+from typing import Any, Dict, Generator, Iterable, Iterator, List, Optional, Union
 
+import numpy as np
 from qdrant_client import QdrantClient, models
 from qdrant_client.models import Distance, PointStruct, VectorParams
 from tqdm import tqdm
 
+from .columnar import PAYLOAD_FIELDS, ColumnarBatch, stream_columnar
+from .pca import PcaProjection
+from .pipeline import IngestionError, PipelinedUploader
+
 # Configure logging
 logging.basicConfig(
     level=logging.INFO,
@@ -22,6 +30,40 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Named vectors of collections that store a PCA-reduced vector next to the full embedding
+FULL_VECTOR = "full"
+REDUCED_VECTOR = "reduced"
+
+# arXiv archives grouped under their top-level category; other archives are their own group
+PHYSICS_ARCHIVES = {
+    "astro-ph", "cond-mat", "gr-qc", "hep-ex", "hep-lat", "hep-ph", "hep-th", "math-ph",
+    "nlin", "nucl-ex", "nucl-th", "physics", "quant-ph"
+}
+CATEGORY_SHARD_KEYS = ["cs", "econ", "eess", "math", "physics", "q-bio", "q-fin", "stat", "other"]
+
+# Server defaults restored after a bulk load when the collection reports no explicit value
+DEFAULT_HNSW_M = 16
+DEFAULT_INDEXING_THRESHOLD = 20000
+
+
+def primary_category(categories: Optional[str]) -> str:
+    """
+    Get the top-level arXiv category of a paper, used as its shard key.
+
+    Args:
+        categories: Space separated arXiv categories, primary first, e.g. 'hep-th math.QA'
+
+    Returns:
+        str: One of `CATEGORY_SHARD_KEYS`, e.g. 'physics' for 'hep-th math.QA'
+    """
+    if not categories or not categories.split():
+        return "other"
+
+    archive = categories.split()[0].split(".")[0]
+    if archive in PHYSICS_ARCHIVES:
+        return "physics"
+    return archive if archive in CATEGORY_SHARD_KEYS else "other"
+
 
 def stream_json(file_path: str) -> Generator[Dict[str, Any], None, None]:
     """
@@ -89,6 +131,8 @@ class DataIngestion:
             timeout=timeout
         )
         self.batch_size = batch_size
+        # Point count and timings of the last `ingest_data` call
+        self.last_ingestion: Dict[str, Any] = {}
         logger.info(f"Initialized DataIngestion with batch size {batch_size}")
 
     def create_collection_if_not_exists(
@@ -96,7 +140,9 @@ class DataIngestion:
         collection_name: str,
         vector_size: int = 1536,
         distance: Distance = Distance.COSINE,
-        hnsw_config: Optional[Dict[str, Any]] = None
+        hnsw_config: Optional[Dict[str, Any]] = None,
+        reduced_vector_size: Optional[int] = None,
+        shard_keys: Optional[List[str]] = None
     ) -> None:
         """
         Create a collection if it doesn't exist.
@@ -106,18 +152,29 @@ class DataIngestion:
             vector_size: Size of the vectors
             distance: Distance metric to use
             hnsw_config: HNSW index configuration
+            reduced_vector_size: Store named 'full' and 'reduced' vectors of this size
+                instead of a single unnamed vector
+            shard_keys: Create a custom-sharded collection with these shard keys
         """
         vectors_config = VectorParams(
             size=vector_size,
             distance=distance
         )
+        if reduced_vector_size:
+            vectors_config = {
+                FULL_VECTOR: vectors_config,
+                REDUCED_VECTOR: VectorParams(size=reduced_vector_size, distance=distance)
+            }
 
         if not self.client.collection_exists(collection_name=collection_name):
             logger.info(f"Creating collection: {collection_name}")
             self.client.create_collection(
                 collection_name=collection_name,
-                vectors_config=vectors_config
+                vectors_config=vectors_config,
+                sharding_method=models.ShardingMethod.CUSTOM if shard_keys else None
             )
+            for shard_key in shard_keys or []:
+                self.client.create_shard_key(collection_name=collection_name, shard_key=shard_key)
 
             if hnsw_config:
                 logger.info(f"Updating collection with HNSW config: {hnsw_config}")
@@ -138,29 +195,16 @@ class DataIngestion:
         Returns:
             Dict[str, Any]: Prepared payload
         """
-        return {
-            "id": record.get("id"),
-            "submitter": record.get("submitter"),
-            "title": record.get("title"),
-            "abstract": record.get("abstract"),
-            "authors": record.get("authors"),
-            "categories": record.get("categories"),
-            "comments": record.get("comments"),
-            "license": record.get("license"),
-            "versions": record.get("versions"),
-            "doi": record.get("doi"),
-            "update_date": record.get("update_date"),
-            "journal-ref": record.get("journal-ref"),
-            "report-no": record.get("report-no"),
-            "authors_parsed": record.get("authors_parsed")
-        }
+        return {field: record.get(field) for field in PAYLOAD_FIELDS}
 
-    def create_point(self, record: Dict[str, Any]) -> Optional[PointStruct]:
+    def create_point(self, record: Dict[str, Any], projection: Optional[PcaProjection] = None) -> Optional[PointStruct]:
         """
         Create a point from a record.
 
         Args:
             record: Record containing data for the point
+            projection: PCA projection for the 'reduced' named vector, if the
+                collection stores one
 
         Returns:
             Optional[PointStruct]: Created point or None if embedding is missing
@@ -171,13 +215,280 @@ class DataIngestion:
             return None
 
         payload = self.prepare_payload(record)
+        vector = embedding
+        if projection is not None:
+            vector = {FULL_VECTOR: embedding, REDUCED_VECTOR: projection.transform(embedding).tolist()}
 
         return PointStruct(
             id=str(uuid.uuid5(namespace=uuid.NAMESPACE_DNS, name=record["id"])),
-            vector=embedding,
+            vector=vector,
             payload=payload,
         )
 
+    @staticmethod
+    def _shard_rows(batch: Union[List[PointStruct], ColumnarBatch],
+                    shard_by_category: bool = False) -> Dict[Optional[str], List[int]]:
+        """Group the rows of a batch by the shard key they are written to, None without sharding."""
+        if not shard_by_category:
+            return {None: list(range(len(batch)))}
+
+        payloads = batch.payloads if isinstance(batch, ColumnarBatch) else [point.payload for point in batch]
+        shards: Dict[Optional[str], List[int]] = {}
+        for row, payload in enumerate(payloads):
+            shards.setdefault(primary_category(payload.get("categories")), []).append(row)
+        return shards
+
+    def upload_batch(self, collection_name: str, batch: Union[List[PointStruct], ColumnarBatch],
+                     shard_by_category: bool = False, wait: bool = True) -> None:
+        """
+        Upsert a batch of points, split by shard key for category-sharded collections.
+
+        Args:
+            collection_name: Name of the collection
+            batch: Points or columnar batch to upload
+            shard_by_category: Write every point to the shard of its top-level arXiv category
+            wait: Wait until the points are applied instead of only accepted by the server
+        """
+        columnar = isinstance(batch, ColumnarBatch)
+        for shard_key, rows in self._shard_rows(batch, shard_by_category).items():
+            if columnar:
+                points = (batch if shard_key is None else batch.select(rows)).to_batch(FULL_VECTOR, REDUCED_VECTOR)
+            else:
+                points = batch if shard_key is None else [batch[row] for row in rows]
+            self.client.upsert(collection_name=collection_name, points=points, shard_key_selector=shard_key, wait=wait)
+
+    def verify_points(self, collection_name: str, point_ids: List[Any], timeout: float = 60.0, poll_interval: float = 0.5) -> None:
+        """
+        Wait until points uploaded with `wait=False` can be read back.
+
+        Args:
+            collection_name: Name of the collection
+            point_ids: IDs of the points to check, e.g. the last point of every upsert
+            timeout: Maximum time in seconds to wait
+            poll_interval: Seconds between checks
+
+        Raises:
+            IngestionError: If points are still missing after the timeout
+        """
+        missing = list(dict.fromkeys(point_ids))
+        deadline = time.perf_counter() + timeout
+        while missing:
+            found = set()
+            for start in range(0, len(missing), 1000):
+                points = self.client.retrieve(
+                    collection_name=collection_name,
+                    ids=missing[start:start + 1000],
+                    with_payload=False,
+                    with_vectors=False
+                )
+                found.update(str(point.id) for point in points)
+            missing = [point_id for point_id in missing if str(point_id) not in found]
+
+            if missing and time.perf_counter() > deadline:
+                raise IngestionError(f"{len(missing)} uploaded points of {collection_name} are not visible after {timeout}s, e.g. {missing[:5]}")
+            if missing:
+                time.sleep(poll_interval)
+
+    def _vectors_on_disk(self, collection_name: str, on_disk: Dict[str, Optional[bool]]) -> None:
+        self.client.update_collection(
+            collection_name=collection_name,
+            vectors_config={name: models.VectorParamsDiff(on_disk=value) for name, value in on_disk.items()}
+        )
+
+    def begin_bulk_load(self, collection_name: str, on_disk: bool = False) -> Dict[str, Any]:
+        """
+        Disable indexing of a collection until `end_bulk_load`.
+
+        The HNSW graph is disabled with `m=0` and the optimizer's indexing
+        threshold is set to 0, so upserted segments are not indexed while
+        more points keep arriving and are indexed once at the end instead.
+
+        Args:
+            collection_name: Name of the collection
+            on_disk: Stage the vectors on disk during the load to keep memory bounded
+
+        Returns:
+            Dict[str, Any]: Configuration to restore with `end_bulk_load`
+        """
+        info = self.client.get_collection(collection_name)
+        vectors = info.config.params.vectors
+        # The unnamed default vector is addressed as '' in updates
+        vector_params = vectors if isinstance(vectors, dict) else {"": vectors}
+        m = info.config.hnsw_config.m
+        indexing_threshold = info.config.optimizer_config.indexing_threshold
+        original = {
+            # Unset values would read as 'no change' on restore, so save the defaults explicitly
+            "m": DEFAULT_HNSW_M if m is None else m,
+            "indexing_threshold": DEFAULT_INDEXING_THRESHOLD if indexing_threshold is None else indexing_threshold,
+            "on_disk": {name: params.on_disk for name, params in vector_params.items()} if on_disk else None
+        }
+
+        logger.info(f"Disabling indexing of {collection_name} for bulk load")
+        self.client.update_collection(
+            collection_name=collection_name,
+            hnsw_config=models.HnswConfigDiff(m=0),
+            optimizers_config=models.OptimizersConfigDiff(indexing_threshold=0)
+        )
+        if on_disk:
+            self._vectors_on_disk(collection_name, {name: True for name in vector_params})
+        return original
+
+    def end_bulk_load(self, collection_name: str, original: Dict[str, Any]) -> None:
+        """
+        Restore the configuration saved by `begin_bulk_load`, which starts the optimizer.
+
+        Missing values are restored as `DEFAULT_HNSW_M` and
+        `DEFAULT_INDEXING_THRESHOLD`, since leaving them out of the update
+        would keep indexing disabled.
+
+        Args:
+            collection_name: Name of the collection
+            original: Configuration returned by `begin_bulk_load`
+        """
+        m = DEFAULT_HNSW_M if original.get("m") is None else original["m"]
+        indexing_threshold = original.get("indexing_threshold")
+        indexing_threshold = DEFAULT_INDEXING_THRESHOLD if indexing_threshold is None else indexing_threshold
+
+        logger.info(f"Restoring HNSW m={m} and indexing threshold {indexing_threshold} of {collection_name}")
+        if original.get("on_disk") is not None:
+            self._vectors_on_disk(collection_name, original["on_disk"])
+        self.client.update_collection(
+            collection_name=collection_name,
+            hnsw_config=models.HnswConfigDiff(m=m),
+            optimizers_config=models.OptimizersConfigDiff(indexing_threshold=indexing_threshold)
+        )
+
+    @staticmethod
+    def expected_indexed_vectors(info: models.CollectionInfo) -> int:
+        """
+        Estimate how many vectors the optimizer indexes in a collection.
+
+        Segments whose vectors stay below the indexing threshold keep a plain
+        index, so a vector only counts if the average segment of its points
+        exceeds the threshold. HNSW with `m=0` indexes nothing. This is a rough
+        estimate for progress display: small or appendable segments may stay
+        unindexed, so the actual count can stay below it.
+
+        Args:
+            info: Collection info, e.g. from `client.get_collection`
+
+        Returns:
+            int: Expected indexed vector count once optimization finished
+        """
+        if info.config.hnsw_config.m == 0:
+            return 0
+        threshold_kb = info.config.optimizer_config.indexing_threshold
+        threshold_kb = DEFAULT_INDEXING_THRESHOLD if threshold_kb is None else threshold_kb
+        if threshold_kb == 0:
+            return 0
+
+        points = info.points_count or 0
+        vectors = info.config.params.vectors
+        vector_params = vectors.values() if isinstance(vectors, dict) else [vectors]
+        segments = max(info.segments_count or 1, 1)
+        # float32 vectors, 4 bytes per dimension
+        return sum(points for params in vector_params if points * params.size * 4 / 1024 / segments >= threshold_kb)
+
+    def wait_for_index(self, collection_name: str, expected_vectors: Optional[int] = None, timeout: float = 3600.0,
+                       poll_interval: float = 1.0, stable_polls: int = 3, show_progress: bool = True) -> float:
+        """
+        Wait until the optimizer has indexed a collection.
+
+        The collection counts as indexed once the optimizer has started and the
+        collection is green with an unchanged indexed vector count for
+        `stable_polls` polls. Green alone is not enough: right after indexing
+        is enabled again, the collection is still green until the optimizer
+        has picked up the change. The optimizer counts as started once the
+        collection left green, or its indexed vector or segment count changed.
+        The indexed count is not compared with an expected total, since
+        segments below the indexing threshold stay unindexed for good.
+
+        Args:
+            collection_name: Name of the collection
+            expected_vectors: Total of the progress bar (default: `expected_indexed_vectors`)
+            timeout: Maximum wait time in seconds; after it a warning is logged instead of raising,
+                since all points are loaded and searchable without the index
+            poll_interval: Seconds between status polls
+            stable_polls: Polls the indexed vector count must stay unchanged
+            show_progress: Whether to show a progress bar of indexed vectors
+
+        Returns:
+            float: Seconds until the poll that first saw the final indexed vector count,
+            or until the timeout
+        """
+        start_time = time.perf_counter()
+        progress = tqdm(desc=f"Indexing {collection_name}", unit=" vectors", disable=not show_progress)
+        initial = None
+        started = False
+        last_indexed = None
+        settled_at = None
+        unchanged = 0
+        try:
+            while True:
+                info = self.client.get_collection(collection_name)
+                elapsed = time.perf_counter() - start_time
+                expected = self.expected_indexed_vectors(info) if expected_vectors is None else expected_vectors
+                indexed = info.indexed_vectors_count or 0
+                progress.total = max(expected, indexed)
+                progress.n = indexed
+                progress.set_postfix(status=getattr(info.status, "value", info.status), segments=info.segments_count)
+
+                green = info.status == models.CollectionStatus.GREEN
+                if initial is None:
+                    initial = (indexed, info.segments_count)
+                started = started or not green or (indexed, info.segments_count) != initial or indexed >= expected
+
+                if green and started and indexed == last_indexed and settled_at is not None:
+                    unchanged += 1
+                else:
+                    unchanged = 0
+                    settled_at = elapsed if green and started else None
+                last_indexed = indexed
+
+                if unchanged >= stable_polls:
+                    return settled_at
+                if elapsed > timeout:
+                    logger.warning(f"Indexing of {collection_name} did not settle within {timeout} seconds "
+                                   f"({indexed} of about {expected} vectors indexed)")
+                    return elapsed
+                time.sleep(poll_interval)
+        finally:
+            progress.close()
+
+    def _embedding_sample(self, file_path: str, sample_size: int) -> np.ndarray:
+        """Read the embeddings of the first `sample_size` records into a float32 matrix."""
+        records = (record for record in stream_json(file_path) if record.get("embedding") is not None)
+        vectors = [np.asarray(record["embedding"], dtype=np.float32) for record in itertools.islice(records, sample_size)]
+        return np.stack(vectors) if vectors else np.empty((0, 0), dtype=np.float32)
+
+    def _fit_projection(self, vectors: Any, reduced_vector_size: int, collection_name: str,
+                        pca_path: Optional[str]) -> PcaProjection:
+        """Fit the PCA projection of the reduced vector and save it next to the collection."""
+        projection = PcaProjection.fit(vectors, reduced_vector_size)
+        pca_path = pca_path or f"{collection_name}.pca.npz"
+        projection.save(pca_path)
+        logger.info(f"Fitted PCA projection to {reduced_vector_size} dimensions on {len(vectors)} vectors, saved to {pca_path}")
+        return projection
+
+    def _point_batches(self, records: Iterable[Dict[str, Any]],
+                       projection: Optional[PcaProjection] = None) -> Generator[List[PointStruct], None, None]:
+        """Group the points created from a record stream into batches of `batch_size`."""
+        batch: List[PointStruct] = []
+        for record in records:
+            point = self.create_point(record, projection)
+            if point is None:
+                continue
+
+            batch.append(point)
+            if len(batch) >= self.batch_size:
+                yield batch
+                # Queued batches are uploaded later, so start a new list instead of clearing
+                batch = []
+
+        # Upload remaining points
+        if batch:
+            yield batch
+
     def ingest_data(
         self,
         file_path: str,
@@ -185,11 +496,57 @@ class DataIngestion:
         vector_size: int = 1536,
         distance: Distance = Distance.COSINE,
         hnsw_config: Optional[Dict[str, Any]] = None,
-        show_progress: bool = True
+        show_progress: bool = True,
+        reduced_vector_size: Optional[int] = None,
+        pca_sample_size: int = 10000,
+        pca_path: Optional[str] = None,
+        max_points_per_second: Optional[float] = None,
+        stop_event: Optional[threading.Event] = None,
+        shard_by_category: bool = False,
+        upload_workers: int = 1,
+        queue_size: int = 8,
+        consistency_timeout: float = 60.0,
+        columnar: bool = False,
+        bulk_load: bool = False,
+        bulk_load_on_disk: bool = False,
+        index_timeout: float = 3600.0
     ) -> int:
         """
         Ingest data from a file into a collection.
 
+        With `reduced_vector_size`, a PCA projection is fitted on the embeddings
+        of the first `pca_sample_size` records, read in a first pass over the
+        file, and every point stores the projected vector as 'reduced' next to
+        the original embedding as 'full'. The projection is saved to
+        `pca_path`, queries must be projected with it.
+
+        With `max_points_per_second`, uploads are paced to that write rate, e.g.
+        to simulate background updates while the collection serves queries.
+        Setting `stop_event` ends the ingestion after the current batch.
+
+        With `shard_by_category`, the collection is created with custom sharding
+        and every point is written to the shard of its top-level arXiv category,
+        see `primary_category`, so searches can be routed to one category.
+
+        With `upload_workers` > 1, ingestion is pipelined: the file is parsed
+        on the calling thread while that many workers upload batches with
+        `wait=False`. At most `queue_size` parsed batches wait for a worker,
+        so memory stays bounded when the server is the bottleneck. After the
+        last batch, the last point of every batch is read back to confirm the
+        uploads were applied. Failed batches stop the parsing and are reported
+        in file order.
+
+        With `columnar`, every batch of lines is decoded at once into a float32
+        matrix and payloads (with orjson when installed) and uploaded as one
+        batch upsert, without a `PointStruct` per point. This cuts the parsing
+        CPU and the memory held per batch; `create_point` is not called.
+
+        With `bulk_load`, indexing is disabled while the points are uploaded
+        instead of re-indexing segments over and over as they grow. Afterwards
+        the HNSW configuration is restored, even if the upload failed, and the
+        ingestion waits until the collection is indexed. Load and index time
+        are logged and kept in `last_ingestion`.
+
         Args:
             file_path: Path to the JSON file
             collection_name: Name of the collection
@@ -197,45 +554,119 @@ class DataIngestion:
             distance: Distance metric to use
             hnsw_config: HNSW index configuration
             show_progress: Whether to show progress bar
+            reduced_vector_size: Dimension of the PCA-reduced named vector, None for a single vector
+            pca_sample_size: Number of records the projection is fitted on
+            pca_path: Path the projection is saved to (default: '<collection_name>.pca.npz')
+            max_points_per_second: Maximum write rate, None for no limit
+            stop_event: Event that stops the ingestion when set
+            shard_by_category: Shard the collection by top-level arXiv category
+            upload_workers: Number of concurrent upload workers, 1 uploads sequentially
+            queue_size: Maximum number of parsed batches waiting for an upload worker
+            consistency_timeout: Seconds to wait for pipelined uploads to become visible
+            columnar: Decode and upload batches column-wise instead of point by point
+            bulk_load: Defer HNSW indexing until all points are uploaded
+            bulk_load_on_disk: Stage the vectors on disk during a bulk load
+            index_timeout: Maximum seconds to wait for the index after a bulk load
 
         Returns:
             int: Number of points ingested
+
+        Raises:
+            IngestionError: If batches failed to upload or did not become visible
         """
         # Ensure the collection exists
         self.create_collection_if_not_exists(
             collection_name=collection_name,
             vector_size=vector_size,
             distance=distance,
-            hnsw_config=hnsw_config
+            hnsw_config=hnsw_config,
+            reduced_vector_size=reduced_vector_size,
+            shard_keys=CATEGORY_SHARD_KEYS if shard_by_category else None
         )
 
-        # Stream data from file
-        generator = stream_json(file_path)
-        batch: List[PointStruct] = []
-        total_ingested = 0
-
-        # Wrap with tqdm if progress should be shown
-        if show_progress:
-            generator = tqdm(generator, desc=f"Uploading points to {collection_name}")
+        projection = None
+        if reduced_vector_size:
+            # Only the sample's vectors are kept, the file is streamed again for the upload
+            projection = self._fit_projection(
+                self._embedding_sample(file_path, pca_sample_size), reduced_vector_size, collection_name, pca_path
+            )
 
-        for record in generator:
-            point = self.create_point(record)
-            if point is None:
-                continue
+        batches: Iterator[Union[List[PointStruct], ColumnarBatch]]
+        if columnar:
+            batches = stream_columnar(file_path, self.batch_size)
+            if projection is not None:
+                batches = (ColumnarBatch(b.ids, b.vectors, b.payloads, projection.transform(b.vectors)) for b in batches)
+        else:
+            # Stream data from file
+            batches = self._point_batches(stream_json(file_path), projection)
 
-            batch.append(point)
+        total_ingested = 0
+        start_time = time.perf_counter()
+
+        uploader = None
+        last_point_ids: List[Any] = []
+        if upload_workers > 1:
+            uploader = PipelinedUploader(
+                lambda points: self.upload_batch(collection_name, points, shard_by_category, wait=False),
+                workers=upload_workers,
+                queue_size=queue_size
+            )
 
-            if len(batch) >= self.batch_size:
-                self.client.upsert(collection_name=collection_name, points=batch)
+        # Progress is counted in uploaded points
+        progress = tqdm(desc=f"Uploading points to {collection_name}", unit=" points", disable=not show_progress)
+
+        bulk_load_config = self.begin_bulk_load(collection_name, on_disk=bulk_load_on_disk) if bulk_load else None
+        try:
+            for batch in batches:
+                if stop_event is not None and stop_event.is_set():
+                    logger.info(f"Ingestion into {collection_name} stopped")
+                    break
+                if uploader is not None and uploader.failed.is_set():
+                    break
+
+                if uploader is None:
+                    self.upload_batch(collection_name, batch, shard_by_category)
+                else:
+                    uploader.submit(batch)
+                    # Sharded batches are split into one upsert per shard key, so check one point of each
+                    last_point_ids.extend(
+                        batch.ids[rows[-1]] if isinstance(batch, ColumnarBatch) else batch[rows[-1]].id
+                        for rows in self._shard_rows(batch, shard_by_category).values()
+                    )
                 total_ingested += len(batch)
-                batch.clear()
-
-        # Upload remaining points
-        if batch:
-            self.client.upsert(collection_name=collection_name, points=batch)
-            total_ingested += len(batch)
+                progress.update(len(batch))
+
+                if max_points_per_second:
+                    # Sleep until the points written so far match the target rate
+                    delay = start_time + total_ingested / max_points_per_second - time.perf_counter()
+                    if delay > 0:
+                        if stop_event is not None:
+                            stop_event.wait(delay)
+                        else:
+                            time.sleep(delay)
+        finally:
+            progress.close()
+            try:
+                errors = uploader.close() if uploader is not None else []
+            finally:
+                # Never leave the collection with indexing disabled
+                if bulk_load_config is not None:
+                    self.end_bulk_load(collection_name, bulk_load_config)
+
+        if errors:
+            for error in errors:
+                logger.error(f"Batch {error.index} (points {error.first_id} to {error.last_id}) failed: {error.error}")
+            raise IngestionError(f"{len(errors)} batches failed to upload into {collection_name}", errors)
+        if uploader is not None:
+            self.verify_points(collection_name, last_point_ids, timeout=consistency_timeout)
+
+        load_time = time.perf_counter() - start_time
+        index_time = self.wait_for_index(collection_name, timeout=index_timeout, show_progress=show_progress) if bulk_load else None
+        self.last_ingestion = {"points": total_ingested, "load_time_s": load_time, "index_time_s": index_time}
 
         logger.info(f"Ingested {total_ingested} points into collection {collection_name}")
+        if bulk_load:
+            logger.info(f"Load time {load_time:.1f}s, index time {index_time:.1f}s, total {load_time + index_time:.1f}s")
         return total_ingested
 
 
@@ -248,7 +679,10 @@ def ingest_from_file(
     batch_size: int = 1000,
     vector_size: int = 1536,
     distance: Union[Distance, str] = Distance.COSINE,
-    show_progress: bool = True
+    show_progress: bool = True,
+    upload_workers: int = 1,
+    columnar: bool = False,
+    bulk_load: bool = False
 ) -> int:
     """
     Convenience function to ingest data from a file into a collection.
@@ -263,6 +697,9 @@ def ingest_from_file(
         vector_size: Size of the vectors
         distance: Distance metric to use
         show_progress: Whether to show progress bar
+        upload_workers: Number of concurrent upload workers, see `DataIngestion.ingest_data`
+        columnar: Decode and upload batches column-wise, see `DataIngestion.ingest_data`
+        bulk_load: Defer HNSW indexing until all points are uploaded, see `DataIngestion.ingest_data`
 
     Returns:
         int: Number of points ingested
@@ -283,5 +720,8 @@ def ingest_from_file(
         collection_name=collection_name,
         vector_size=vector_size,
         distance=distance,
-        show_progress=show_progress
+        show_progress=show_progress,
+        upload_workers=upload_workers,
+        columnar=columnar,
+        bulk_load=bulk_load
     )
@@ -0,0 +1,98 @@
+"""
+PCA Projection Module
+
+This module provides a PCA projection used to store a reduced vector next to
+the full embedding, so searches can traverse the HNSW graph in fewer dimensions.
+"""
+
+from typing import List, Union
+
+import numpy as np
+
+ArrayLike = Union[np.ndarray, List[List[float]], List[float]]
+
+
+class PcaProjection:
+    """
+    Linear projection onto the principal components of a vector sample.
+
+    Projected vectors are L2-normalized, so they can be stored in a collection
+    with cosine or dot product distance.
+    """
+
+    def __init__(self, mean: np.ndarray, components: np.ndarray):
+        """
+        Initialize the projection.
+
+        Args:
+            mean: Mean of the fitted sample, shape (dimension,)
+            components: Principal components as rows, shape (n_components, dimension)
+        """
+        self.mean = np.asarray(mean, dtype=np.float32)
+        self.components = np.asarray(components, dtype=np.float32)
+
+    @property
+    def n_components(self) -> int:
+        """Dimension of the projected vectors."""
+        return self.components.shape[0]
+
+    @classmethod
+    def fit(cls, vectors: ArrayLike, n_components: int) -> "PcaProjection":
+        """
+        Fit the projection on a sample of vectors.
+
+        Args:
+            vectors: Sample of shape (n_samples, dimension)
+            n_components: Dimension of the projected vectors
+
+        Returns:
+            PcaProjection: Fitted projection
+
+        Raises:
+            ValueError: If the sample is too small for the requested dimension
+        """
+        sample = np.asarray(vectors, dtype=np.float32)
+        if sample.ndim != 2 or n_components > min(sample.shape):
+            raise ValueError(f"Cannot fit {n_components} components on a sample of shape {sample.shape}")
+
+        mean = sample.mean(axis=0)
+        _, _, vt = np.linalg.svd(sample - mean, full_matrices=False)
+        return cls(mean, vt[:n_components])
+
+    def transform(self, vectors: ArrayLike) -> np.ndarray:
+        """
+        Project one vector or a matrix of vectors.
+
+        Args:
+            vectors: Vector of shape (dimension,) or matrix of shape (n, dimension)
+
+        Returns:
+            np.ndarray: Normalized float32 projections of shape (n_components,) or (n, n_components)
+        """
+        projected = (np.asarray(vectors, dtype=np.float32) - self.mean) @ self.components.T
+        norms = np.linalg.norm(projected, axis=-1, keepdims=True)
+        return projected / np.where(norms == 0, 1, norms)
+
+    def save(self, path: str) -> None:
+        """
+        Save the projection to a '.npz' file.
+
+        Args:
+            path: Path of the file
+        """
+        with open(path, "wb") as f:
+            np.savez(f, mean=self.mean, components=self.components)
+
+    @classmethod
+    def load(cls, path: str) -> "PcaProjection":
+        """
+        Load a projection written by `save`.
+
+        Args:
+            path: Path of the file
+
+        Returns:
+            PcaProjection: Loaded projection
+        """
+        with np.load(path) as data:
+            return cls(data["mean"], data["components"])
@@ -0,0 +1,112 @@
+"""
+Pipelined Upload Module
+
+This module provides a bounded queue between the parsing stage of an ingestion
+and concurrent upload workers, so parsing and network transfer overlap.
+"""
+
+import logging
+import queue
+import threading
+from typing import Any, Callable, List, NamedTuple, Optional
+
+logger = logging.getLogger(__name__)
+
+
+class BatchError(NamedTuple):
+    """Failed upload of one batch."""
+
+    index: int
+    first_id: Any
+    last_id: Any
+    error: Exception
+
+
+class IngestionError(Exception):
+    """
+    Raised when batches of an ingestion failed to upload or did not become visible.
+
+    Attributes:
+        errors: Failed batches in submission order
+    """
+
+    def __init__(self, message: str, errors: Optional[List[BatchError]] = None):
+        super().__init__(message)
+        self.errors = errors or []
+
+
+class PipelinedUploader:
+    """
+    Upload batches on worker threads fed through a bounded queue.
+
+    `submit` blocks while `queue_size` batches are waiting, so the parsing
+    stage never runs further ahead of the uploads than that (backpressure).
+    Failed batches are collected with their submission index; after the first
+    failure `failed` is set, so the producer can stop submitting.
+    """
+
+    def __init__(self, upload: Callable[[List[Any]], None], workers: int = 4, queue_size: int = 8):
+        """
+        Start the upload workers.
+
+        Args:
+            upload: Function uploading one batch of points
+            workers: Number of concurrent upload workers
+            queue_size: Maximum number of batches waiting for a worker
+        """
+        self.upload = upload
+        self.queue: "queue.Queue[Optional[tuple]]" = queue.Queue(maxsize=max(1, queue_size))
+        self.errors: List[BatchError] = []
+        self.failed = threading.Event()
+        self._lock = threading.Lock()
+        self._submitted = 0
+        self._closed = False
+        self._threads = [threading.Thread(target=self._work, daemon=True) for _ in range(max(1, workers))]
+        for thread in self._threads:
+            thread.start()
+
+    def _work(self) -> None:
+        while True:
+            item = self.queue.get()
+            if item is None:
+                return
+            index, batch = item
+            try:
+                self.upload(batch)
+            except Exception as e:
+                # Columnar batches carry their IDs as a column, point lists per point
+                ids = getattr(batch, "ids", None) or [getattr(batch[0], "id", None), getattr(batch[-1], "id", None)]
+                with self._lock:
+                    self.errors.append(BatchError(index, ids[0], ids[-1], e))
+                self.failed.set()
+
+    def submit(self, batch: List[Any]) -> None:
+        """
+        Queue a batch for upload, blocking while the queue is full.
+
+        Args:
+            batch: Points to upload; the list must not be modified afterwards
+        """
+        self.queue.put((self._submitted, batch))
+        self._submitted += 1
+
+    def close(self) -> List[BatchError]:
+        """
+        Wait for all queued batches to be uploaded and stop the workers.
+
+        Returns:
+            List[BatchError]: Failed batches ordered by submission
+        """
+        if not self._closed:
+            self._closed = True
+            for _ in self._threads:
+                self.queue.put(None)
+            for thread in self._threads:
+                thread.join()
+        return sorted(self.errors, key=lambda error: error.index)
+
+    def __enter__(self) -> "PipelinedUploader":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
@@ -5,16 +5,25 @@ This package provides tools for evaluating and benchmarking
 different configurations of the Qdrant vector database.
 """
 
-from .client import get_client, load_environment, update_collection_config
-from .embedding import get_embedding, load_test_dataset
-from .collection import wait_for_collection_green
+from .client import get_client, get_async_client, load_environment, update_collection_config, build_quantization_config
+from .embedding import get_embedding, get_openai_client, load_test_dataset
+from .collection import wait_for_collection_green, monitor_index_build
+from .ground_truth import GroundTruthCache, collection_fingerprint, query_set_hash
+from .brute_force import LocalExactSearch, export_collection_vectors
+from .timing import LatencyHistogram, timed_runs
+from .query_set import QuerySet, query_vectors, save_query_set, store_ground_truth, convert_json_query_set
+from .metrics import compute_metrics, ids_to_matrices, default_cutoffs
 from .evaluator import (
     precision_k,
+    get_search_points,
     get_ann_points,
     get_hnsw_points,
     get_knn_points,
     get_ann_points_quantized,
     get_knn_points_ignoring_quantization,
+    get_batch_points,
+    get_points_in_batches,
+    get_ground_truth,
     evaluate_ann,
     evaluate_hnsw_ef,
     evaluate_ann_quantized,
@@ -23,25 +32,149 @@ from .evaluator import (
     results_to_dataframe,
     evaluate_collection_with_config
 )
+from .load_test import (
+    search_params_from_setting,
+    run_load_test,
+    summarize_load_test,
+    evaluate_under_load
+)
+from .sweep import (
+    variant_name,
+    estimate_memory_mb,
+    build_variant_collection,
+    pareto_frontier,
+    run_hnsw_sweep
+)
+from .tuner import tune_hnsw_ef
+from .transport import (
+    RestTransport,
+    GrpcTransport,
+    query_with_breakdown,
+    measure_latency_breakdown,
+    compare_transports
+)
+from .multi_collection import evaluate_collections
+from .projection import PointIdLookup, register_id_lookup, id_lookup, search_payload, result_ids, arxiv_point_id
+from .query_set_builder import EmbeddingCache, embed_texts, build_query_set, sample_query_set, copy_without_points
+from .two_stage import build_reduced_collection, get_two_stage_points, evaluate_two_stage
+from .mixed_workload import BackgroundIngestion, evaluate_under_ingestion
+from .storage import storage_label, storage_grid, apply_storage_config, evaluate_storage_configs
+from .sharding import result_shard_keys, infer_query_shard_keys, evaluate_shard_routing
+from .telemetry import TelemetrySampler, take_telemetry_sample, summarize_telemetry, parse_prometheus
+from .results_store import ResultsStore, compare_runs, setting_key
+from .benchmark import load_config, benchmark_settings, environment_metadata, run_benchmark
+from .filtering import (
+    payload_distribution,
+    selectivity_filters,
+    create_payload_indexes,
+    evaluate_filtered_search
+)
+from .quantization import (
+    quantization_label,
+    quantized_vector_bytes,
+    apply_quantization,
+    evaluate_quantization_configs
+)
 
 __all__ = [
     'get_client',
+    'get_async_client',
     'load_environment',
     'update_collection_config',
+    'build_quantization_config',
     'get_embedding',
+    'get_openai_client',
     'load_test_dataset',
     'wait_for_collection_green',
+    'monitor_index_build',
+    'GroundTruthCache',
+    'collection_fingerprint',
+    'query_set_hash',
+    'LocalExactSearch',
+    'export_collection_vectors',
+    'LatencyHistogram',
+    'timed_runs',
+    'QuerySet',
+    'query_vectors',
+    'save_query_set',
+    'store_ground_truth',
+    'convert_json_query_set',
+    'compute_metrics',
+    'ids_to_matrices',
+    'default_cutoffs',
     'precision_k',
+    'get_search_points',
     'get_ann_points',
     'get_hnsw_points',
     'get_knn_points',
     'get_ann_points_quantized',
     'get_knn_points_ignoring_quantization',
+    'get_batch_points',
+    'get_points_in_batches',
+    'get_ground_truth',
     'evaluate_ann',
     'evaluate_hnsw_ef',
     'evaluate_ann_quantized',
     'evaluate_with_quantization',
     'compute_avg_metrics',
     'results_to_dataframe',
-    'evaluate_collection_with_config'
+    'evaluate_collection_with_config',
+    'search_params_from_setting',
+    'run_load_test',
+    'summarize_load_test',
+    'evaluate_under_load',
+    'variant_name',
+    'estimate_memory_mb',
+    'build_variant_collection',
+    'pareto_frontier',
+    'run_hnsw_sweep',
+    'tune_hnsw_ef',
+    'RestTransport',
+    'GrpcTransport',
+    'query_with_breakdown',
+    'measure_latency_breakdown',
+    'compare_transports',
+    'evaluate_collections',
+    'PointIdLookup',
+    'register_id_lookup',
+    'id_lookup',
+    'search_payload',
+    'result_ids',
+    'arxiv_point_id',
+    'EmbeddingCache',
+    'embed_texts',
+    'build_query_set',
+    'sample_query_set',
+    'copy_without_points',
+    'build_reduced_collection',
+    'get_two_stage_points',
+    'evaluate_two_stage',
+    'BackgroundIngestion',
+    'evaluate_under_ingestion',
+    'storage_label',
+    'storage_grid',
+    'apply_storage_config',
+    'evaluate_storage_configs',
+    'result_shard_keys',
+    'infer_query_shard_keys',
+    'evaluate_shard_routing',
+    'TelemetrySampler',
+    'take_telemetry_sample',
+    'summarize_telemetry',
+    'parse_prometheus',
+    'ResultsStore',
+    'compare_runs',
+    'setting_key',
+    'load_config',
+    'benchmark_settings',
+    'environment_metadata',
+    'run_benchmark',
+    'payload_distribution',
+    'selectivity_filters',
+    'create_payload_indexes',
+    'evaluate_filtered_search',
+    'quantization_label',
+    'quantized_vector_bytes',
+    'apply_quantization',
+    'evaluate_quantization_configs'
 ]
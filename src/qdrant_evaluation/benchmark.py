@@ -0,0 +1,214 @@
+import contextlib
+import json
+import platform
+import socket
+import subprocess
+import time
+import uuid
+from importlib import metadata
+from typing import List, Dict, Any, Optional, Tuple
+
+from qdrant_client import QdrantClient
+
+from qdrant_evaluation.client import get_client
+from qdrant_evaluation.embedding import load_test_dataset
+from qdrant_evaluation.evaluator import get_ground_truth, _measure_search, _search_results
+from qdrant_evaluation.ground_truth import GroundTruthCache
+from qdrant_evaluation.load_test import search_params_from_setting
+from qdrant_evaluation.query_set import query_vectors
+from qdrant_evaluation.results_store import ResultsStore
+from qdrant_evaluation.telemetry import TelemetrySampler
+
+DEFAULT_CONFIG = {
+    "name": "benchmark",
+    "host": "localhost",
+    "port": 6333,
+    "prefer_grpc": False,
+    "collections": [],
+    "query_set": "queries_embeddings.json",
+    "k": 10,
+    "hnsw_ef": [],
+    "quantization": [],
+    "batch_size": None,
+    "warmup": 0,
+    "repetitions": 1,
+    "ground_truth_cache": ".ground_truth_cache",
+    "telemetry": False,
+    "telemetry_interval": 1.0,
+}
+
+PACKAGES = ("qdrant-client", "numpy", "pandas")
+
+
+def load_config(path: str) -> Dict[str, Any]:
+    """
+    Load a benchmark configuration from a JSON file.
+
+    Missing keys are filled from `DEFAULT_CONFIG`. Example:
+
+        {
+            "name": "ef-check",
+            "collections": ["arxiv_papers"],
+            "query_set": "queries_embeddings.npy",
+            "k": 10,
+            "hnsw_ef": [32, 64, 128],
+            "quantization": [{"rescore": true, "oversampling": 2.0}],
+            "warmup": 1,
+            "repetitions": 3
+        }
+
+    Args:
+        path (str): Path of the configuration file
+
+    Returns:
+        Dict[str, Any]: Complete benchmark configuration
+    """
+    with open(path, 'r', encoding='utf-8') as file:
+        config = {**DEFAULT_CONFIG, **json.load(file)}
+
+    if not config["collections"]:
+        raise ValueError(f"Benchmark configuration {path} lists no collections")
+    return config
+
+
+def benchmark_settings(config: Dict[str, Any]) -> List[Dict[str, Any]]:
+    """
+    Expand a benchmark configuration into the search settings to evaluate.
+
+    Plain ANN search is always evaluated, followed by one setting per hnsw_ef
+    value and one per quantization search setting.
+
+    Args:
+        config (Dict[str, Any]): Benchmark configuration
+
+    Returns:
+        List[Dict[str, Any]]: Search settings as understood by `search_params_from_setting`
+    """
+    return [{}, *({"hnsw_ef": hnsw_ef} for hnsw_ef in config["hnsw_ef"]), *config["quantization"]]
+
+
+def _package_version(package: str) -> Optional[str]:
+    try:
+        return metadata.version(package)
+    except metadata.PackageNotFoundError:
+        return None
+
+
+def _git_commit() -> Optional[str]:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "HEAD"], capture_output=True, text=True, check=True, timeout=5
+        ).stdout.strip()
+    except (OSError, subprocess.SubprocessError):
+        return None
+
+
+def environment_metadata(client: QdrantClient, collections: List[str]) -> Dict[str, Any]:
+    """
+    Collect the environment a benchmark runs in.
+
+    Args:
+        client (QdrantClient): Qdrant client
+        collections (List[str]): Collections evaluated in the run
+
+    Returns:
+        Dict[str, Any]: Host, Python and package versions, git commit, Qdrant server version
+        and the configuration and size of every collection
+    """
+    try:
+        server_version = client.info().version
+    except Exception as e:
+        print(f"❌ Error: {str(e)}")
+        server_version = None
+
+    collection_info = {}
+    for collection_name in collections:
+        info = client.get_collection(collection_name)
+        collection_info[collection_name] = {
+            "points_count": info.points_count,
+            "segments_count": info.segments_count,
+            "config": info.config.model_dump(mode="json"),
+        }
+
+    return {
+        "hostname": socket.gethostname(),
+        "platform": platform.platform(),
+        "python": platform.python_version(),
+        "packages": {package: _package_version(package) for package in PACKAGES},
+        "git_commit": _git_commit(),
+        "qdrant_version": server_version,
+        "collections": collection_info,
+    }
+
+
+def run_benchmark(config: Dict[str, Any], store: Optional[ResultsStore] = None) -> Tuple[str, List[Dict[str, Any]]]:
+    """
+    Run every search setting of a configuration on every collection and store the run.
+
+    Ground truth is computed once per collection and search mode: exact search
+    for plain and hnsw_ef settings, search on the original vectors for
+    quantization settings. Every result row carries the collection's
+    quantization config next to its search setting, since search-time
+    quantization parameters alone do not say how the vectors were quantized.
+    With 'telemetry' enabled every result row also carries the server memory,
+    CPU and storage sampled while it was measured.
+
+    Args:
+        config (Dict[str, Any]): Benchmark configuration, see `load_config`
+        store (Optional[ResultsStore]): Store the run is written to
+
+    Returns:
+        Tuple[str, List[Dict[str, Any]]]: Run ID and result rows
+    """
+    run_id = f"{time.strftime('%Y%m%d-%H%M%S')}-{config['name']}-{uuid.uuid4().hex[:6]}"
+    created_at = time.strftime("%Y-%m-%dT%H:%M:%S")
+    k = config["k"]
+
+    client = get_client(host=config["host"], port=config["port"], prefer_grpc=config["prefer_grpc"])
+    embeddings = load_test_dataset(config["query_set"])
+    if not embeddings:
+        raise ValueError(f"Query set {config['query_set']} is empty or missing")
+    vectors = query_vectors(embeddings)
+    cache = GroundTruthCache(config["ground_truth_cache"]) if config["ground_truth_cache"] else None
+
+    environment = environment_metadata(client, config["collections"])
+    results_list = []
+
+    for collection_name in config["collections"]:
+        quantization_config = environment["collections"][collection_name]["config"].get("quantization_config")
+        ground_truth = {}
+        for setting in benchmark_settings(config):
+            ignore_quantization = "rescore" in setting or "oversampling" in setting
+            if ignore_quantization not in ground_truth:
+                ground_truth[ignore_quantization], _ = get_ground_truth(
+                    client, collection_name, vectors,
+                    k=k,
+                    ignore_quantization=ignore_quantization,
+                    batch_size=config["batch_size"],
+                    ground_truth_cache=cache
+                )
+
+            print(f"Benchmarking {collection_name} with {setting or 'default search'}...")
+            sampler = TelemetrySampler(client, collection_name, interval=config["telemetry_interval"]) if config["telemetry"] else None
+            with sampler or contextlib.nullcontext():
+                result_ids, histogram, server_histogram = _measure_search(
+                    client, collection_name, vectors,
+                    search_params=search_params_from_setting(setting),
+                    k=k,
+                    batch_size=config["batch_size"],
+                    warmup=config["warmup"],
+                    repetitions=config["repetitions"]
+                )
+            results = _search_results(result_ids, ground_truth[ignore_quantization], histogram, server_histogram, config["batch_size"], k)
+            results.pop("latency_histogram")
+            if sampler is not None:
+                results.update(sampler.summary())
+                results.pop("telemetry_samples")
+            results_list.append({"collection": collection_name, "setting": setting,
+                                 "quantization_config": quantization_config, **results})
+
+    if store is not None:
+        store.save_run(run_id, config["name"], created_at, config, environment, results_list)
+        print(f"Stored run {run_id} in {store.path}")
+
+    return run_id, results_list
@@ -0,0 +1,221 @@
+import json
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Tuple, Optional
+
+import numpy as np
+from qdrant_client import QdrantClient
+
+from qdrant_evaluation.collection import _vector_params
+
+
+def export_collection_vectors(client: QdrantClient, collection_name: str, path: str, batch_size: int = 1000,
+                              using: Optional[str] = None) -> int:
+    """
+    Export the vectors of a collection to a memory-mapped float32 matrix.
+
+    Writes `<path>.npy` with one row per point, `<path>.ids.json` with the
+    payload 'id' of every row and `<path>.meta.json` with the distance metric.
+    Vectors are streamed into the memory map page by page, so the collection
+    never has to fit into RAM.
+
+    Args:
+        client (QdrantClient): Qdrant client
+        collection_name (str): Name of the collection to export
+        path (str): Output path without extension
+        batch_size (int): Number of points fetched per scroll request
+        using (Optional[str]): Named vector to export, None for the default vector
+
+    Returns:
+        int: Number of exported vectors
+    """
+    info = client.get_collection(collection_name)
+    vector_params = _vector_params(info, using)
+    total = info.points_count
+
+    matrix = np.lib.format.open_memmap(
+        f"{path}.npy", mode="w+", dtype=np.float32, shape=(total, vector_params.size)
+    )
+    ids = []
+    offset = None
+
+    while len(ids) < total:
+        points, offset = client.scroll(
+            collection_name=collection_name,
+            limit=batch_size,
+            offset=offset,
+            with_payload=['id'],
+            with_vectors=[using] if using else True
+        )
+        if not points:
+            break
+
+        points = points[:total - len(ids)]
+        matrix[len(ids):len(ids) + len(points)] = np.asarray(
+            [point.vector[using] if using else point.vector for point in points], dtype=np.float32
+        )
+        ids.extend(point.payload['id'] for point in points)
+
+        if offset is None:
+            break
+
+    matrix.flush()
+    del matrix
+
+    if len(ids) != total:
+        # Points were deleted while exporting, so shrink the matrix to the rows written
+        written = np.load(f"{path}.npy", mmap_mode="r")
+        np.save(f"{path}.tmp.npy", written[:len(ids)])
+        del written
+        os.replace(f"{path}.tmp.npy", f"{path}.npy")
+
+    with open(f"{path}.ids.json", 'w', encoding='utf-8') as file:
+        json.dump(ids, file)
+    with open(f"{path}.meta.json", 'w', encoding='utf-8') as file:
+        json.dump({"collection": collection_name, "vector": using,
+                   "distance": str(vector_params.distance.value).lower()}, file)
+
+    print(f"Exported {len(ids)} vectors of {collection_name} to {path}.npy")
+    return len(ids)
+
+
+class LocalExactSearch:
+    """
+    Client-side exact top-k search over a memory-mapped vector matrix.
+
+    Scores are computed with blocked matrix multiplication: the database is
+    split into row blocks that are scored in parallel threads (NumPy releases
+    the GIL inside BLAS), and the per-block top-k candidates are merged into
+    the global top-k. Only one block per thread is resident at a time.
+    """
+
+    SUPPORTED_DISTANCES = ("cosine", "dot", "euclid")
+
+    def __init__(self, vectors: np.ndarray, ids: Optional[List] = None, distance: str = "cosine",
+                 block_size: int = 16384, query_block_size: int = 1024, num_threads: Optional[int] = None):
+        """
+        Initialize the search engine.
+
+        Args:
+            vectors (np.ndarray): Matrix of database vectors, typically a read-only memory map
+            ids (Optional[List]): Identifier of every row; row indices are used if omitted
+            distance (str): Distance metric ('cosine', 'dot' or 'euclid')
+            block_size (int): Number of database rows scored per block
+            query_block_size (int): Number of queries scored per block
+            num_threads (Optional[int]): Number of worker threads (default: CPU count)
+        """
+        distance = distance.lower()
+        if distance not in self.SUPPORTED_DISTANCES:
+            raise ValueError(f"Unsupported distance '{distance}', expected one of {self.SUPPORTED_DISTANCES}")
+        if ids is not None and len(ids) != len(vectors):
+            raise ValueError(f"Got {len(ids)} ids for {len(vectors)} vectors")
+
+        self.vectors = vectors
+        self.ids = ids
+        self.distance = distance
+        self.block_size = block_size
+        self.query_block_size = query_block_size
+        self.num_threads = num_threads or os.cpu_count() or 1
+
+    @classmethod
+    def from_files(cls, path: str, distance: Optional[str] = None, **kwargs) -> "LocalExactSearch":
+        """
+        Open vectors written by `export_collection_vectors` as a memory map.
+
+        Args:
+            path (str): Export path without extension
+            distance (Optional[str]): Distance metric, read from the metadata file if omitted
+            **kwargs: Further arguments passed to the constructor
+
+        Returns:
+            LocalExactSearch: Search engine over the exported vectors
+        """
+        vectors = np.load(f"{path}.npy", mmap_mode="r")
+
+        ids = None
+        if os.path.exists(f"{path}.ids.json"):
+            with open(f"{path}.ids.json", 'r', encoding='utf-8') as file:
+                ids = json.load(file)
+
+        if distance is None:
+            with open(f"{path}.meta.json", 'r', encoding='utf-8') as file:
+                distance = json.load(file)["distance"]
+
+        return cls(vectors, ids=ids, distance=distance, **kwargs)
+
+    def _prepare_queries(self, queries) -> np.ndarray:
+        queries = np.asarray(queries, dtype=np.float32)
+        if queries.ndim == 1:
+            queries = queries[np.newaxis, :]
+        if self.distance == "cosine":
+            norms = np.linalg.norm(queries, axis=1, keepdims=True)
+            queries = queries / np.where(norms == 0, 1, norms)
+        return queries
+
+    def _score_block(self, queries: np.ndarray, start: int, k: int) -> Tuple[np.ndarray, np.ndarray]:
+        block = np.asarray(self.vectors[start:start + self.block_size], dtype=np.float32)
+        scores = queries @ block.T
+
+        if self.distance == "cosine":
+            norms = np.linalg.norm(block, axis=1)
+            scores /= np.where(norms == 0, 1, norms)
+        elif self.distance == "euclid":
+            # Larger is better: -||q - b||^2 without the constant ||q||^2 term
+            scores = 2 * scores - np.einsum("ij,ij->i", block, block)
+
+        block_k = min(k, scores.shape[1])
+        top = np.argpartition(-scores, block_k - 1, axis=1)[:, :block_k]
+        return np.take_along_axis(scores, top, axis=1), top + start
+
+    def search(self, queries, k: int = 10) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Find the exact top-k rows for every query.
+
+        Args:
+            queries: Query vectors as a matrix or a list of vectors
+            k (int): Number of results per query
+
+        Returns:
+            Tuple[np.ndarray, np.ndarray]: Row indices and scores of shape (n_queries, k),
+            sorted by descending score
+        """
+        queries = self._prepare_queries(queries)
+        k = min(k, len(self.vectors))
+        starts = range(0, len(self.vectors), self.block_size)
+
+        all_indices, all_scores = [], []
+        with ThreadPoolExecutor(max_workers=self.num_threads) as executor:
+            for q_start in range(0, len(queries), self.query_block_size):
+                query_block = queries[q_start:q_start + self.query_block_size]
+                blocks = list(executor.map(lambda start: self._score_block(query_block, start, k), starts))
+
+                scores = np.concatenate([block_scores for block_scores, _ in blocks], axis=1)
+                indices = np.concatenate([block_indices for _, block_indices in blocks], axis=1)
+
+                order = np.argsort(-scores, axis=1, kind="stable")[:, :k]
+                all_scores.append(np.take_along_axis(scores, order, axis=1))
+                all_indices.append(np.take_along_axis(indices, order, axis=1))
+
+        return np.concatenate(all_indices), np.concatenate(all_scores)
+
+    def search_ids(self, embeddings: List[List], k: int = 10) -> Tuple[List[List], List[float]]:
+        """
+        Find the exact top-k identifiers in the format of the evaluator helpers.
+
+        Args:
+            embeddings (List[List]): Query embedding vectors
+            k (int): Number of results per query
+
+        Returns:
+            Tuple[List[List], List[float]]: Result IDs and amortized search time per query
+        """
+        start_time = time.perf_counter()
+        indices, _ = self.search(embeddings, k)
+        elapsed = time.perf_counter() - start_time
+
+        if self.ids is None:
+            ids = indices.tolist()
+        else:
+            ids = [[self.ids[i] for i in row] for row in indices]
+        return ids, [elapsed / len(ids)] * len(ids)
@@ -0,0 +1,91 @@
+import argparse
+import sys
+from typing import List, Optional
+
+import pandas as pd
+
+from qdrant_evaluation.benchmark import load_config, run_benchmark
+from qdrant_evaluation.results_store import ResultsStore, compare_runs
+
+
+def _resolve_runs(store: ResultsStore, baseline: Optional[str], candidate: Optional[str]) -> List[str]:
+    """Default to comparing the two most recent runs, or the given run with the most recent other run."""
+    if baseline and candidate:
+        return [baseline, candidate]
+
+    runs = store.list_runs()["run_id"].tolist()
+    if candidate is None and baseline is None:
+        if len(runs) < 2:
+            raise ValueError("At least two stored runs are needed for a comparison")
+        return [runs[1], runs[0]]
+
+    given = baseline or candidate
+    others = [run for run in runs if run != given]
+    if not others:
+        raise ValueError(f"No stored run other than {given} to compare with")
+    return [baseline, others[0]] if baseline else [others[0], candidate]
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """
+    Entry point of the `qdrant-bench` command.
+
+    Commands:
+        run CONFIG: run a benchmark configuration and store the results
+        list: list the stored runs
+        compare [BASELINE] [CANDIDATE]: compare two runs, exits with 1 on regressions
+
+    Args:
+        argv (Optional[List[str]]): Command line arguments (default: sys.argv)
+
+    Returns:
+        int: Exit code
+    """
+    parser = argparse.ArgumentParser(prog="qdrant-bench", description="Benchmark Qdrant collections and compare runs.")
+    parser.add_argument("--store", default="benchmark_results.sqlite", help="SQLite results store")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    run_parser = commands.add_parser("run", help="Run a benchmark configuration")
+    run_parser.add_argument("config", help="JSON benchmark configuration")
+
+    commands.add_parser("list", help="List stored runs")
+
+    compare_parser = commands.add_parser("compare", help="Compare two runs (default: the two most recent)")
+    compare_parser.add_argument("baseline", nargs="?", help="Reference run ID")
+    compare_parser.add_argument("candidate", nargs="?", help="Run ID to check (default: most recent other run)")
+    compare_parser.add_argument("--quality-threshold", type=float, default=0.01,
+                                help="Largest tolerated absolute drop of precision, recall, MRR or nDCG")
+    compare_parser.add_argument("--latency-threshold", type=float, default=0.10,
+                                help="Largest tolerated relative latency increase")
+
+    args = parser.parse_args(argv)
+    store = ResultsStore(args.store)
+
+    if args.command == "run":
+        run_id, results = run_benchmark(load_config(args.config), store)
+        print(pd.DataFrame(results).to_string(index=False))
+        return 0
+
+    if args.command == "list":
+        print(store.list_runs().to_string(index=False))
+        return 0
+
+    baseline, candidate = _resolve_runs(store, args.baseline, args.candidate)
+    comparison = compare_runs(
+        store, baseline, candidate,
+        quality_threshold=args.quality_threshold,
+        latency_threshold=args.latency_threshold
+    )
+    print(f"Comparing {candidate} against {baseline}")
+    print(comparison.to_string(index=False))
+
+    regressions = comparison[comparison["regression"]]
+    if not regressions.empty:
+        print(f"❌ {len(regressions)} regressions found")
+        return 1
+    print("No regressions found.")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,19 +1,37 @@
-from qdrant_client import QdrantClient, models
+from qdrant_client import QdrantClient, AsyncQdrantClient, models
 import os
+from typing import Any, Dict, Optional
 from utils.environment import load_environment, get_environment_variable
 
-def get_client(host="localhost", port=6333):
+def get_client(host="localhost", port=6333, prefer_grpc=False, grpc_port=6334):
     """
     Initialize and return a Qdrant client.
 
     Args:
         host (str): Qdrant server host
-        port (int): Qdrant server port
+        port (int): Qdrant server REST port
+        prefer_grpc (bool): Use gRPC instead of REST for the requests that support it
+        grpc_port (int): Qdrant server gRPC port
 
     Returns:
         QdrantClient: Initialized Qdrant client
     """
-    return QdrantClient(host=host, port=port)
+    return QdrantClient(host=host, port=port, grpc_port=grpc_port, prefer_grpc=prefer_grpc)
+
+def get_async_client(host="localhost", port=6333, prefer_grpc=False, grpc_port=6334):
+    """
+    Initialize and return an asynchronous Qdrant client.
+
+    Args:
+        host (str): Qdrant server host
+        port (int): Qdrant server REST port
+        prefer_grpc (bool): Use gRPC instead of REST for the requests that support it
+        grpc_port (int): Qdrant server gRPC port
+
+    Returns:
+        AsyncQdrantClient: Initialized asynchronous Qdrant client
+    """
+    return AsyncQdrantClient(host=host, port=port, grpc_port=grpc_port, prefer_grpc=prefer_grpc)
 
 def update_collection_config(client, collection_name, m=16, ef_construct=32):
     """
@@ -29,3 +47,45 @@ def update_collection_config(client, collection_name, m=16, ef_construct=32):
         collection_name=collection_name,
         hnsw_config=models.HnswConfigDiff(m=m, ef_construct=ef_construct)
     )
+
+def build_quantization_config(spec: Optional[Dict[str, Any]]) -> Optional[models.QuantizationConfig]:
+    """
+    Build a quantization configuration from a plain settings dictionary.
+
+    Supported types are 'scalar' (int8, optional 'quantile'), 'product'
+    (optional 'compression' such as 'x16') and 'binary'. All types accept
+    'always_ram'. Search-time keys like 'rescore' or 'oversampling' are ignored.
+
+    Args:
+        spec (Optional[Dict[str, Any]]): Quantization settings, e.g. {"type": "scalar", "always_ram": True}
+
+    Returns:
+        Optional[models.QuantizationConfig]: Quantization configuration or None if spec is empty
+    """
+    if not spec:
+        return None
+
+    quantization_type = spec["type"].lower()
+    always_ram = spec.get("always_ram")
+
+    if quantization_type == "scalar":
+        return models.ScalarQuantization(
+            scalar=models.ScalarQuantizationConfig(
+                type=models.ScalarType.INT8,
+                quantile=spec.get("quantile"),
+                always_ram=always_ram
+            )
+        )
+    if quantization_type == "product":
+        return models.ProductQuantization(
+            product=models.ProductQuantizationConfig(
+                compression=models.CompressionRatio(spec.get("compression", "x16")),
+                always_ram=always_ram
+            )
+        )
+    if quantization_type == "binary":
+        return models.BinaryQuantization(
+            binary=models.BinaryQuantizationConfig(always_ram=always_ram)
+        )
+
+    raise ValueError(f"Unknown quantization type: {spec['type']}")
@@ -1,26 +1,116 @@
 from qdrant_client import QdrantClient
 import time
-from typing import Optional
+from typing import Optional, Dict, Any, List
 
+from qdrant_evaluation.timing import now
 
-def wait_for_collection_green(client: QdrantClient, collection_name: str, timeout: int = 600) -> None:
+
+def _progress_sample(client: QdrantClient, collection_name: str, start_time: float) -> Dict[str, Any]:
+    info = client.get_collection(collection_name)
+    return {
+        "elapsed_s": now() - start_time,
+        "status": str(getattr(info.status, "value", info.status)),
+        "indexed_vectors_count": info.indexed_vectors_count or 0,
+        "points_count": info.points_count or 0,
+        "segments_count": info.segments_count
+    }
+
+
+def _vector_params(info, using: Optional[str] = None):
+    """Get the parameters of the default vector, or of the named vector `using`."""
+    vectors = info.config.params.vectors
+    if not isinstance(vectors, dict):
+        if using:
+            raise ValueError(f"Collection has no named vectors, got vector name '{using}'")
+        return vectors
+    if using not in vectors:
+        raise ValueError(f"Collection has named vectors {sorted(vectors)}, got vector name {using!r}")
+    return vectors[using]
+
+
+def monitor_index_build(client: QdrantClient, collection_name: str, timeout: int = 600, min_interval: float = 0.1,
+                        max_interval: float = 5.0, backoff: float = 1.5, start_timeout: float = 0.0) -> Dict[str, Any]:
     """
-    Waits until the collection status is 'Green' or until timeout.
+    Wait until the collection is green and record how the index build progressed.
+
+    Polling is adaptive: it starts every `min_interval` seconds and slows down
+    by `backoff` while nothing changes, up to `max_interval`. As soon as the
+    indexed vector count, segment count or status changes it returns to
+    `min_interval`, so short builds are timed precisely and long builds are
+    not flooded with requests.
+
+    Right after a configuration update the collection is often still green,
+    since the optimizer has not picked up the change yet. With `start_timeout`
+    a green collection is polled for up to that many seconds until the build
+    starts, i.e. the collection leaves green. A build counts from the call,
+    so call this right after the update. If no build was observed, the build
+    time and throughput are None.
 
     Args:
-        client: Qdrant client
-        collection_name: Name of the collection
-        timeout: Maximum wait time in seconds (default: 600 seconds / 10 minutes)
+        client (QdrantClient): Qdrant client
+        collection_name (str): Name of the collection
+        timeout (int): Maximum wait time in seconds
+        min_interval (float): Shortest polling interval in seconds
+        max_interval (float): Longest polling interval in seconds
+        backoff (float): Factor the interval grows by while the build makes no visible progress
+        start_timeout (float): Maximum seconds to wait for a green collection to start building
+
+    Returns:
+        Dict[str, Any]: 'build_time_s' until green, final 'indexed_vectors_count',
+        'points_count' and 'segments_count', 'max_segments_count' during the build,
+        'vectors_indexed_per_s' (points per second of build time) and the polled 'build_progress' samples
     """
-    start_time = time.time()
+    start_time = now()
+    interval = min_interval
+    samples: List[Dict[str, Any]] = [_progress_sample(client, collection_name, start_time)]
+    started = samples[-1]["status"] != "green"
 
-    while True:
-        status = client.get_collection(collection_name).status
-        if status == "green":
-            print(f"Collection {collection_name} is ready.")
+    while not started or samples[-1]["status"] != "green":
+        if not started and samples[-1]["elapsed_s"] >= start_timeout:
             break
-
-        if time.time() - start_time > timeout:
+        if samples[-1]["elapsed_s"] > timeout:
             raise TimeoutError(f"Collection {collection_name} did not become ready in {timeout} seconds.")
 
-        time.sleep(0.5)  # Poll every 500ms
+        time.sleep(interval)
+        sample = _progress_sample(client, collection_name, start_time)
+        changed = any(sample[key] != samples[-1][key] for key in ("status", "indexed_vectors_count", "segments_count"))
+        interval = min_interval if changed else min(interval * backoff, max_interval)
+        samples.append(sample)
+        started = started or sample["status"] != "green"
+
+    last = samples[-1]
+    build_time = last["elapsed_s"] if started else None
+    segments = [sample["segments_count"] for sample in samples if sample["segments_count"] is not None]
+
+    return {
+        "build_time_s": build_time,
+        "indexed_vectors_count": last["indexed_vectors_count"],
+        "points_count": last["points_count"],
+        "segments_count": last["segments_count"],
+        "max_segments_count": max(segments) if segments else None,
+        # A rebuild re-indexes every point, while old segments keep their indexed count until swapped out
+        "vectors_indexed_per_s": last["points_count"] / build_time if build_time else None,
+        "build_progress": samples
+    }
+
+
+def wait_for_collection_green(client: QdrantClient, collection_name: str, timeout: int = 600,
+                              start_timeout: float = 0.0) -> Dict[str, Any]:
+    """
+    Waits until the collection status is 'Green' or until timeout.
+
+    Args:
+        client: Qdrant client
+        collection_name: Name of the collection
+        timeout: Maximum wait time in seconds (default: 600 seconds / 10 minutes)
+        start_timeout: Maximum seconds to wait for a green collection to start an index build
+
+    Returns:
+        Build metrics as returned by `monitor_index_build`
+    """
+    build_metrics = monitor_index_build(client, collection_name, timeout=timeout, start_timeout=start_timeout)
+    build_time = build_metrics['build_time_s']
+    ready = f"after {build_time:.1f}s" if build_time is not None else "without an index build"
+    print(f"Collection {collection_name} is ready {ready} "
+          f"({build_metrics['indexed_vectors_count']} vectors indexed, {build_metrics['segments_count']} segments).")
+    return build_metrics
@@ -1,12 +1,36 @@
 from openai import OpenAI
 import os
-from typing import Union, List
+from functools import lru_cache
+from typing import Union, List, Optional
 import json
 from utils.environment import load_environment, get_environment_variable
+from qdrant_evaluation.query_set import QuerySet
 
 # Load environment variables
 load_environment()
 
+EMBEDDING_MODEL = "text-embedding-ada-002"
+
+@lru_cache(maxsize=None)
+def _cached_openai_client(api_key: str, max_retries: int) -> OpenAI:
+    return OpenAI(api_key=api_key, max_retries=max_retries)
+
+def get_openai_client(max_retries: int = 2) -> Optional[OpenAI]:
+    """
+    Return a shared OpenAI client, created once per API key.
+
+    Args:
+        max_retries (int): Retries of the OpenAI client itself
+
+    Returns:
+        Optional[OpenAI]: The client or None if the API key is missing
+    """
+    api_key = get_environment_variable("OPENAI_API_KEY")
+    if not api_key or api_key == "your-openai-api-key":
+        print("❌ Error: OpenAI API key is missing or invalid. Please set the OPENAI_API_KEY environment variable.")
+        return None
+    return _cached_openai_client(api_key, max_retries)
+
 def get_embedding(text: str) -> Union[List[float], None]:
     """
     Generate an embedding for the given text using OpenAI's API.
@@ -17,31 +41,39 @@ def get_embedding(text: str) -> Union[List[float], None]:
     Returns:
         Union[List[float], None]: The embedding vector or None if an error occurs
     """
-    api_key = get_environment_variable("OPENAI_API_KEY")
-    if not api_key or api_key == "your-openai-api-key":
-        print("❌ Error: OpenAI API key is missing or invalid. Please set the OPENAI_API_KEY environment variable.")
+    client_qa = get_openai_client()
+    if client_qa is None:
         return None
 
-    client_qa = OpenAI(api_key=api_key)
     text = text.replace("\n", " ")
     try:
-        response = client_qa.embeddings.create(input=[text], model="text-embedding-ada-002")
+        response = client_qa.embeddings.create(input=[text], model=EMBEDDING_MODEL)
         embedding = response.data[0].embedding
         return embedding
     except Exception as e:
         print(f"❌ Error: {str(e)}")
         return None
 
-def load_test_dataset(file_path="queries_embeddings.json") -> dict:
+def load_test_dataset(file_path="queries_embeddings.json") -> Union[dict, QuerySet]:
     """
-    Load test dataset from a JSON file.
+    Load test dataset from a JSON file or a binary query set.
+
+    Paths ending in '.npy' are loaded as memory-mapped `QuerySet`, see
+    `convert_json_query_set` for converting an existing JSON file.
 
     Args:
-        file_path (str): Path to the JSON file containing test data
+        file_path (str): Path to the JSON file or '.npy' query set containing test data
 
     Returns:
-        dict: The loaded test dataset
+        Union[dict, QuerySet]: The loaded test dataset
     """
+    if file_path.endswith(".npy"):
+        try:
+            return QuerySet.load(file_path[:-len(".npy")])
+        except FileNotFoundError:
+            print(f"Error: File {file_path} not found.")
+            return {}
+
     try:
         with open(file_path, 'r', encoding='utf-8') as file:
             test_dataset = json.load(file)
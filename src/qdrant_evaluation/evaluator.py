@@ -1,12 +1,23 @@
+import contextlib
+import hashlib
 from qdrant_client import QdrantClient, models
-import time
-from typing import List, Set, Dict, Tuple, Any
+from typing import List, Set, Dict, Tuple, Any, Optional, Union
 import pandas as pd
 from qdrant_evaluation.collection import wait_for_collection_green
+from qdrant_evaluation.ground_truth import GroundTruthCache
+from qdrant_evaluation.brute_force import LocalExactSearch
+from qdrant_evaluation.query_set import query_vectors
+from qdrant_evaluation.timing import now, timed_runs, LatencyHistogram
+from qdrant_evaluation.metrics import compute_metrics
+from qdrant_evaluation.telemetry import TelemetrySampler
+from qdrant_evaluation.projection import search_payload, result_ids
 
 def precision_k(ann_results: Set, exact_results: Set, k: int = 10) -> float:
     """
-    Calculate precision@k metric.
+    Calculate precision@k metric of a single query.
+
+    Shortcut for `compute_metrics` on one query, which computes it for a
+    whole query set. At most k IDs of each set are considered.
 
     Args:
         ann_results (Set): Set of IDs from approximate nearest neighbor search
@@ -16,30 +27,55 @@ def precision_k(ann_results: Set, exact_results: Set, k: int = 10) -> float:
     Returns:
         float: Precision@k value
     """
-    return len(ann_results.intersection(exact_results)) / k
+    return compute_metrics([list(ann_results)], [list(exact_results)], k, cutoffs=[])["avg_precision"]
 
-def get_ann_points(client: QdrantClient, collection_name: str, embedding: List, k: int = 10) -> Tuple[List, float]:
+def get_search_points(client: QdrantClient, collection_name: str, embedding: List, search_params: Optional[models.SearchParams] = None, k: int = 10, query_filter: Optional[models.Filter] = None, using: Optional[str] = None, shard_key_selector: Optional[Union[str, List[str]]] = None) -> Tuple[List, float]:
     """
-    Get approximate nearest neighbor points.
+    Get search results for a single query vector.
 
     Args:
         client (QdrantClient): Qdrant client
         collection_name (str): Name of the collection to query
         embedding (List): Query embedding vector
+        search_params (Optional[models.SearchParams]): Search parameters of the query
         k (int): Number of results to return
+        query_filter (Optional[models.Filter]): Payload filter of the query
+        using (Optional[str]): Named vector to search, None for the default vector
+        shard_key_selector (Optional[Union[str, List[str]]]): Shard keys the query is routed to,
+            None to search all shards
 
     Returns:
         Tuple[List, float]: List of result IDs and query execution time
     """
-    start_time_ann = time.time()
-    ann_result = client.query_points(
+    start_time = now()
+    result = client.query_points(
         collection_name=collection_name,
         query=embedding,
-        limit=k
+        using=using,
+        query_filter=query_filter,
+        limit=k,
+        search_params=search_params,
+        shard_key_selector=shard_key_selector,
+        with_payload=search_payload(client, collection_name)
     ).points
-    ann_time = time.time() - start_time_ann
-    ids = [res.payload['id'] for res in ann_result]
-    return ids, ann_time
+    query_time = now() - start_time
+    ids = result_ids(client, collection_name, result)
+    return ids, query_time
+
+def get_ann_points(client: QdrantClient, collection_name: str, embedding: List, k: int = 10) -> Tuple[List, float]:
+    """
+    Get approximate nearest neighbor points.
+
+    Args:
+        client (QdrantClient): Qdrant client
+        collection_name (str): Name of the collection to query
+        embedding (List): Query embedding vector
+        k (int): Number of results to return
+
+    Returns:
+        Tuple[List, float]: List of result IDs and query execution time
+    """
+    return get_search_points(client, collection_name, embedding, k=k)
 
 def get_hnsw_points(client: QdrantClient, collection_name: str, embedding: List, hnsw_ef: int, k: int = 10) -> Tuple[List, float]:
     """
@@ -55,16 +91,7 @@ def get_hnsw_points(client: QdrantClient, collection_name: str, embedding: List,
     Returns:
         Tuple[List, float]: List of result IDs and query execution time
     """
-    start_time_hnsw = time.time()
-    hnsw_result = client.query_points(
-        collection_name=collection_name,
-        query=embedding,
-        limit=k,
-        search_params=models.SearchParams(hnsw_ef=hnsw_ef)
-    ).points
-    hnsw_time = time.time() - start_time_hnsw
-    ids = [res.payload['id'] for res in hnsw_result]
-    return ids, hnsw_time
+    return get_search_points(client, collection_name, embedding, models.SearchParams(hnsw_ef=hnsw_ef), k)
 
 def get_knn_points(client: QdrantClient, collection_name: str, embedding: List, k: int = 10) -> Tuple[List, float]:
     """
@@ -79,16 +106,7 @@ def get_knn_points(client: QdrantClient, collection_name: str, embedding: List,
     Returns:
         Tuple[List, float]: List of result IDs and query execution time
     """
-    start_time_knn = time.time()
-    knn_result = client.query_points(
-        collection_name=collection_name,
-        query=embedding,
-        limit=k,
-        search_params=models.SearchParams(exact=True),
-    ).points
-    knn_time = time.time() - start_time_knn
-    ids = [res.payload['id'] for res in knn_result]
-    return ids, knn_time
+    return get_search_points(client, collection_name, embedding, models.SearchParams(exact=True), k)
 
 def get_ann_points_quantized(client: QdrantClient, collection_name: str, embedding: List, k: int = 10) -> Tuple[List, float]:
     """
@@ -103,21 +121,13 @@ def get_ann_points_quantized(client: QdrantClient, collection_name: str, embeddi
     Returns:
         Tuple[List, float]: List of result IDs and query execution time
     """
-    start_time_ann = time.time()
-    ann_result = client.query_points(
-        collection_name=collection_name,
-        query=embedding,
-        limit=k,
-        search_params=models.SearchParams(
-            quantization=models.QuantizationSearchParams(
-                rescore=False,
-                oversampling=2.0,
-            )
+    search_params = models.SearchParams(
+        quantization=models.QuantizationSearchParams(
+            rescore=False,
+            oversampling=2.0,
         )
-    ).points
-    ann_time = time.time() - start_time_ann
-    ids = [res.payload['id'] for res in ann_result]
-    return ids, ann_time
+    )
+    return get_search_points(client, collection_name, embedding, search_params, k)
 
 def get_knn_points_ignoring_quantization(client: QdrantClient, collection_name: str, embedding: List, k: int = 10) -> Tuple[List, float]:
     """
@@ -132,56 +142,252 @@ def get_knn_points_ignoring_quantization(client: QdrantClient, collection_name:
     Returns:
         Tuple[List, float]: List of result IDs and query execution time
     """
-    start_time_knn = time.time()
-    knn_result = client.query_points(
-        collection_name=collection_name,
-        query=embedding,
-        limit=k,
-        search_params=models.SearchParams(
-            quantization=models.QuantizationSearchParams(ignore=True)
-        ),
-    ).points
-    knn_time = time.time() - start_time_knn
-    ids = [res.payload['id'] for res in knn_result]
-    return ids, knn_time
+    search_params = models.SearchParams(
+        quantization=models.QuantizationSearchParams(ignore=True)
+    )
+    return get_search_points(client, collection_name, embedding, search_params, k)
 
-def evaluate_ann(client: QdrantClient, collection_name: str, embeddings: Dict) -> Dict:
+def get_batch_points(client: QdrantClient, collection_name: str, embeddings: List[List], search_params: Optional[models.SearchParams] = None, k: int = 10, query_filter: Optional[models.Filter] = None, using: Optional[str] = None) -> Tuple[List[List], float, Optional[float]]:
     """
-    Evaluate ANN search performance.
+    Get search results for several query vectors with a single batch request.
 
     Args:
         client (QdrantClient): Qdrant client
         collection_name (str): Name of the collection to query
-        embeddings (Dict): Dictionary of embeddings to evaluate
+        embeddings (List[List]): Query embedding vectors
+        search_params (Optional[models.SearchParams]): Search parameters applied to every query
+        k (int): Number of results to return per query
+        query_filter (Optional[models.Filter]): Payload filter applied to every query
+        using (Optional[str]): Named vector to search, None for the default vector
 
     Returns:
-        Dict: Evaluation results
+        Tuple[List[List], float, Optional[float]]: Result IDs per query, client-side batch
+        execution time and server-reported batch processing time (None if unavailable)
+    """
+    requests = [
+        models.QueryRequest(query=embedding, using=using, filter=query_filter, limit=k, params=search_params, with_payload=search_payload(client, collection_name))
+        for embedding in embeddings
+    ]
+
+    start_time_batch = now()
+    try:
+        # The raw REST API exposes the server-side processing time of the request
+        response = client.http.search_api.query_batch_points(
+            collection_name=collection_name,
+            query_request_batch=models.QueryRequestBatch(searches=requests)
+        )
+        batch_result, server_time = response.result, response.time
+    except NotImplementedError:
+        batch_result, server_time = client.query_batch_points(
+            collection_name=collection_name,
+            requests=requests
+        ), None
+    batch_time = now() - start_time_batch
+
+    ids = [result_ids(client, collection_name, result.points) for result in batch_result]
+    return ids, batch_time, server_time
+
+def get_points_in_batches(client: QdrantClient, collection_name: str, embeddings: List[List], search_params: Optional[models.SearchParams] = None, k: int = 10, batch_size: int = 64, query_filter: Optional[models.Filter] = None, using: Optional[str] = None) -> Tuple[List[List], List[float], List[Optional[float]]]:
+    """
+    Run all query vectors through batch requests of a fixed size.
+
+    Batch execution times are amortized over the queries of the batch, so the
+    per-query times are comparable with those of the single-query helpers.
+
+    Args:
+        client (QdrantClient): Qdrant client
+        collection_name (str): Name of the collection to query
+        embeddings (List[List]): Query embedding vectors
+        search_params (Optional[models.SearchParams]): Search parameters applied to every query
+        k (int): Number of results to return per query
+        batch_size (int): Number of queries sent in one request
+        query_filter (Optional[models.Filter]): Payload filter applied to every query
+        using (Optional[str]): Named vector to search, None for the default vector
+
+    Returns:
+        Tuple[List[List], List[float], List[Optional[float]]]: Result IDs, amortized client
+        time and amortized server time for every query
+    """
+    ids, client_times, server_times = [], [], []
+
+    for offset in range(0, len(embeddings), batch_size):
+        batch = embeddings[offset:offset + batch_size]
+        batch_ids, batch_time, server_time = get_batch_points(client, collection_name, batch, search_params, k, query_filter, using)
+
+        ids.extend(batch_ids)
+        client_times.extend([batch_time / len(batch)] * len(batch))
+        server_times.extend([None if server_time is None else server_time / len(batch)] * len(batch))
+
+    return ids, client_times, server_times
+
+def _measure_search(client: QdrantClient, collection_name: str, embeddings: List[List], search_params: Optional[models.SearchParams] = None, k: int = 10, batch_size: Optional[int] = None, warmup: int = 0, repetitions: int = 1, name: str = "query_time", query_filter: Optional[models.Filter] = None, using: Optional[str] = None) -> Tuple[List[List], LatencyHistogram, Optional[LatencyHistogram]]:
+    """
+    Run all query vectors with warmup passes and repetitions.
+
+    Args:
+        client (QdrantClient): Qdrant client
+        collection_name (str): Name of the collection to query
+        embeddings (List[List]): Query embedding vectors
+        search_params (Optional[models.SearchParams]): Search parameters applied to every query
+        k (int): Number of results to return per query
+        batch_size (Optional[int]): Send queries in batches of this size instead of one by one
+        warmup (int): Number of discarded passes over the query set
+        repetitions (int): Number of measured passes over the query set
+        name (str): Metric name of the client latency histogram
+        query_filter (Optional[models.Filter]): Payload filter applied to every query
+        using (Optional[str]): Named vector to search, None for the default vector
+
+    Returns:
+        Tuple[List[List], LatencyHistogram, Optional[LatencyHistogram]]: Result IDs per query,
+        client latency histogram and server latency histogram (None if unavailable)
     """
-    ann_results = [get_ann_points(client, collection_name, vector) for _, vector in embeddings.items()]
-    knn_results = [get_knn_points(client, collection_name, vector) for _, vector in embeddings.items()]
+    server_times = []
 
-    results = [(precision_k(set(ann_id_list), set(knn_id_list)), ann_execution_time)
-               for (ann_id_list, ann_execution_time), (knn_id_list, knn_execution_time)
-               in zip(ann_results, knn_results)]
+    def run_pass() -> Tuple[List[List], List[float]]:
+        if batch_size:
+            ids, times, pass_server_times = get_points_in_batches(client, collection_name, embeddings, search_params, k, batch_size, query_filter, using)
+            server_times.extend(t for t in pass_server_times if t is not None)
+            return ids, times
 
-    precisions, exec_time = zip(*results)
-    avg_precision = sum(precisions) / len(precisions)
-    avg_query_time_ms = sum(exec_time) / len(exec_time) * 1000
+        results = [get_search_points(client, collection_name, vector, search_params, k, query_filter, using) for vector in embeddings]
+        return [ids for ids, _ in results], [exec_time for _, exec_time in results]
 
-    return {
-        "avg_precision": avg_precision,
-        "avg_query_time_ms": avg_query_time_ms
+    for _ in range(warmup):
+        run_pass()
+    server_times.clear()
+
+    ids, histogram = timed_runs(run_pass, repetitions=repetitions, name=name)
+
+    server_histogram = None
+    if server_times:
+        server_histogram = LatencyHistogram(name="server_time")
+        server_histogram.record_all(server_times)
+
+    return ids, histogram, server_histogram
+
+def _search_results(result_ids: List[List], exact_ids: List[List], histogram: LatencyHistogram, server_histogram: Optional[LatencyHistogram] = None, batch_size: Optional[int] = None, k: int = 10) -> Dict:
+    """
+    Aggregate quality metrics and latency distribution of an evaluation run.
+
+    Args:
+        result_ids (List[List]): Result IDs of the evaluated search per query
+        exact_ids (List[List]): Ground truth IDs per query
+        histogram (LatencyHistogram): Client latency histogram
+        server_histogram (Optional[LatencyHistogram]): Server latency histogram
+        batch_size (Optional[int]): Batch size used for the run
+        k (int): Number of results considered for precision
+
+    Returns:
+        Dict: Evaluation results
+    """
+    results = {
+        **compute_metrics(result_ids, exact_ids, k),
+        **histogram.summary(),
+        "latency_histogram": histogram
     }
 
-def evaluate_hnsw_ef(client: QdrantClient, collection_name: str, embeddings: Dict, hnsw_ef_values: List[int] = None) -> List[Dict]:
+    if batch_size:
+        results["avg_server_time_ms"] = server_histogram.mean * 1000 if server_histogram else None
+        results["batch_size"] = batch_size
+
+    return results
+
+def get_ground_truth(client: QdrantClient, collection_name: str, embeddings: List[List], k: int = 10, ignore_quantization: bool = False, batch_size: Optional[int] = None, ground_truth_cache: Optional[GroundTruthCache] = None, ground_truth_source: Optional[LocalExactSearch] = None, query_filter: Optional[models.Filter] = None, using: Optional[str] = None) -> Tuple[List[List], List[float]]:
+    """
+    Get ground truth results for a set of query vectors.
+
+    Results come from exact search, or from search on the original vectors when
+    `ignore_quantization` is set. With a local ground truth source, exact search
+    runs client-side and the server is not queried at all. If a ground truth
+    cache is given, results are read from it and only computed when the
+    collection or query set changed.
+
+    Args:
+        client (QdrantClient): Qdrant client
+        collection_name (str): Name of the collection to query
+        embeddings (List[List]): Query embedding vectors
+        k (int): Number of results to return per query
+        ignore_quantization (bool): Search the original vectors instead of running exact search
+        batch_size (Optional[int]): Send queries in batches of this size instead of one by one
+        ground_truth_cache (Optional[GroundTruthCache]): Cache for ground truth results
+        ground_truth_source (Optional[LocalExactSearch]): Client-side exact search engine
+        query_filter (Optional[models.Filter]): Payload filter, ground truth is then the filtered exact search
+        using (Optional[str]): Named vector to search, None for the default vector
+
+    Returns:
+        Tuple[List[List], List[float]]: Result IDs and query execution time per query
+    """
+    if query_filter is not None and ground_truth_source is not None:
+        raise ValueError("A client-side ground truth source cannot evaluate payload filters")
+
+    def compute() -> Tuple[List[List], List[float]]:
+        if ground_truth_source is not None:
+            return ground_truth_source.search_ids(embeddings, k)
+
+        search_params = models.SearchParams(
+            quantization=models.QuantizationSearchParams(ignore=True)
+        ) if ignore_quantization else models.SearchParams(exact=True)
+
+        if batch_size:
+            ids, times, _ = get_points_in_batches(client, collection_name, embeddings, search_params, k, batch_size, query_filter, using)
+            return ids, times
+
+        results = [get_search_points(client, collection_name, vector, search_params, k, query_filter, using) for vector in embeddings]
+        return [ids for ids, _ in results], [exec_time for _, exec_time in results]
+
+    if ground_truth_cache is None:
+        return compute()
+
+    mode = "ignore_quantization" if ignore_quantization and ground_truth_source is None else "exact"
+    if query_filter is not None:
+        # Filtered ground truth is cached per filter next to the unfiltered entries
+        mode += "_filter_" + hashlib.sha256(query_filter.model_dump_json().encode("utf-8")).hexdigest()[:16]
+    if using is not None:
+        mode += f"_vector_{using}"
+    return ground_truth_cache.get_or_compute(client, collection_name, embeddings, k, mode, compute)
+
+def evaluate_ann(client: QdrantClient, collection_name: str, embeddings: Dict, batch_size: Optional[int] = None, ground_truth_cache: Optional[GroundTruthCache] = None, ground_truth_source: Optional[LocalExactSearch] = None, warmup: int = 0, repetitions: int = 1) -> Dict:
+    """
+    Evaluate ANN search performance.
+
+    Args:
+        client (QdrantClient): Qdrant client
+        collection_name (str): Name of the collection to query
+        embeddings (Dict): Dictionary of embeddings or QuerySet to evaluate
+        batch_size (Optional[int]): Send queries in batches of this size instead of one by one
+        ground_truth_cache (Optional[GroundTruthCache]): Cache for exact search results
+        ground_truth_source (Optional[LocalExactSearch]): Client-side exact search engine used for ground truth
+        warmup (int): Number of discarded passes over the query set before measuring
+        repetitions (int): Number of measured passes over the query set
+
+    Returns:
+        Dict: Evaluation results with precision and latency distribution
+    """
+    vectors = query_vectors(embeddings)
+    knn_ids, _ = get_ground_truth(client, collection_name, vectors, batch_size=batch_size, ground_truth_cache=ground_truth_cache, ground_truth_source=ground_truth_source)
+
+    ann_ids, histogram, server_histogram = _measure_search(
+        client, collection_name, vectors,
+        batch_size=batch_size,
+        warmup=warmup,
+        repetitions=repetitions
+    )
+    return _search_results(ann_ids, knn_ids, histogram, server_histogram, batch_size)
+
+def evaluate_hnsw_ef(client: QdrantClient, collection_name: str, embeddings: Dict, hnsw_ef_values: List[int] = None, batch_size: Optional[int] = None, ground_truth_cache: Optional[GroundTruthCache] = None, ground_truth_source: Optional[LocalExactSearch] = None, warmup: int = 0, repetitions: int = 1) -> List[Dict]:
     """
     Evaluate HNSW ef parameter performance.
 
     Args:
         client (QdrantClient): Qdrant client
         collection_name (str): Name of the collection to query
-        embeddings (Dict): Dictionary of embeddings to evaluate
+        embeddings (Dict): Dictionary of embeddings or QuerySet to evaluate
         hnsw_ef_values (List[int]): List of ef values to evaluate
+        batch_size (Optional[int]): Send queries in batches of this size instead of one by one
+        ground_truth_cache (Optional[GroundTruthCache]): Cache for exact search results
+        ground_truth_source (Optional[LocalExactSearch]): Client-side exact search engine used for ground truth
+        warmup (int): Number of discarded passes over the query set before measuring each ef value
+        repetitions (int): Number of measured passes over the query set per ef value
 
     Returns:
         List[Dict]: Evaluation results for each ef value
@@ -189,70 +395,87 @@ def evaluate_hnsw_ef(client: QdrantClient, collection_name: str, embeddings: Dic
     if hnsw_ef_values is None:
         hnsw_ef_values = [10, 20, 50, 100, 200]
 
-    knn_results = [get_knn_points(client, collection_name, vector) for _, vector in embeddings.items()]
+    vectors = query_vectors(embeddings)
+    knn_ids, _ = get_ground_truth(client, collection_name, vectors, batch_size=batch_size, ground_truth_cache=ground_truth_cache, ground_truth_source=ground_truth_source)
 
     results_list = []
     for hnsw_ef in hnsw_ef_values:
-        hnsw_results = [get_hnsw_points(client, collection_name, vector, hnsw_ef) for _, vector in embeddings.items()]
-
-        result_hnsw = [
-            (precision_k(set(hnsw_id_list), set(knn_id_list)), hnsw_execution_time)
-            for (hnsw_id_list, hnsw_execution_time), (knn_id_list, knn_execution_time)
-            in zip(hnsw_results, knn_results)]
-
-        prec, hnsw_exe_time = zip(*result_hnsw)
-        avg_precision = sum(prec) / len(prec)
-        avg_query_time_ms = sum(hnsw_exe_time) / len(hnsw_exe_time) * 1000
+        hnsw_ids, histogram, server_histogram = _measure_search(
+            client, collection_name, vectors,
+            search_params=models.SearchParams(hnsw_ef=hnsw_ef),
+            batch_size=batch_size,
+            warmup=warmup,
+            repetitions=repetitions
+        )
 
         results_list.append({
             "hnsw_ef": hnsw_ef,
-            "avg_precision": avg_precision,
-            "avg_query_time_ms": avg_query_time_ms
+            **_search_results(hnsw_ids, knn_ids, histogram, server_histogram, batch_size)
         })
 
     return results_list
 
-def evaluate_ann_quantized(client: QdrantClient, collection_name: str, embeddings: Dict) -> Dict:
+def evaluate_ann_quantized(client: QdrantClient, collection_name: str, embeddings: Dict, batch_size: Optional[int] = None, ground_truth_cache: Optional[GroundTruthCache] = None, ground_truth_source: Optional[LocalExactSearch] = None, warmup: int = 0, repetitions: int = 1) -> Dict:
     """
     Evaluate ANN search performance with quantization.
 
     Args:
         client (QdrantClient): Qdrant client
         collection_name (str): Name of the collection to query
-        embeddings (Dict): Dictionary of embeddings to evaluate
+        embeddings (Dict): Dictionary of embeddings or QuerySet to evaluate
+        batch_size (Optional[int]): Send queries in batches of this size instead of one by one
+        ground_truth_cache (Optional[GroundTruthCache]): Cache for ground truth results
+        ground_truth_source (Optional[LocalExactSearch]): Client-side exact search engine used for ground truth
+        warmup (int): Number of discarded passes over the query set before measuring
+        repetitions (int): Number of measured passes over the query set
 
     Returns:
-        Dict: Evaluation results
+        Dict: Evaluation results with precision and latency distribution
     """
-    ann_results = [get_ann_points_quantized(client, collection_name, vector) for _, vector in embeddings.items()]
-    knn_results = [get_knn_points_ignoring_quantization(client, collection_name, vector) for _, vector in embeddings.items()]
-
-    results = [(precision_k(set(ann_id_list), set(knn_id_list)), ann_execution_time)
-               for (ann_id_list, ann_execution_time), (knn_id_list, knn_execution_time)
-               in zip(ann_results, knn_results)]
-
-    precisions, exec_time = zip(*results)
-    avg_precision = sum(precisions) / len(precisions)
-    avg_query_time_ms = sum(exec_time) / len(exec_time) * 1000
+    vectors = query_vectors(embeddings)
+    knn_ids, _ = get_ground_truth(
+        client, collection_name, vectors,
+        ignore_quantization=True,
+        batch_size=batch_size,
+        ground_truth_cache=ground_truth_cache,
+        ground_truth_source=ground_truth_source
+    )
 
-    return {
-        "avg_precision": avg_precision,
-        "avg_query_time_ms": avg_query_time_ms
-    }
+    ann_ids, histogram, server_histogram = _measure_search(
+        client, collection_name, vectors,
+        search_params=models.SearchParams(
+            quantization=models.QuantizationSearchParams(rescore=False, oversampling=2.0)
+        ),
+        batch_size=batch_size,
+        warmup=warmup,
+        repetitions=repetitions
+    )
+    return _search_results(ann_ids, knn_ids, histogram, server_histogram, batch_size)
 
-def evaluate_with_quantization(client: QdrantClient, collection_name: str, embeddings: Dict, rescore: bool, k: int = 10) -> Dict:
+def evaluate_with_quantization(client: QdrantClient, collection_name: str, embeddings: Dict, rescore: bool, k: int = 10, batch_size: Optional[int] = None, ground_truth_cache: Optional[GroundTruthCache] = None, ground_truth_source: Optional[LocalExactSearch] = None, warmup: int = 0, repetitions: int = 1) -> Dict:
     """
     Evaluate the collection with quantization settings.
 
+    'speedup_factor' compares the quantized search with search on the
+    original vectors, both measured here with the same warmup, repetitions
+    and batch size. Ground truth timings are not used for it, since they are
+    near zero for cached results and client-side for a local source.
+
     Args:
         client (QdrantClient): Qdrant client
         collection_name (str): Name of the collection to query
-        embeddings (Dict): Dictionary of embeddings to evaluate
+        embeddings (Dict): Dictionary of embeddings or QuerySet to evaluate
         rescore (bool): Whether to use rescoring in quantization search params
         k (int): Number of results to return (default: 10)
+        batch_size (Optional[int]): Send queries in batches of this size instead of one by one
+        ground_truth_cache (Optional[GroundTruthCache]): Cache for ground truth results
+        ground_truth_source (Optional[LocalExactSearch]): Client-side exact search engine used for ground truth
+        warmup (int): Number of discarded passes over the query set before measuring
+        repetitions (int): Number of measured passes over the query set
 
     Returns:
-        Dict: Results including average precision and query time
+        Dict: Results including average precision, query time distribution and speedup
+        over unquantized search
     """
     search_params = models.SearchParams(
         quantization=models.QuantizationSearchParams(
@@ -260,82 +483,97 @@ def evaluate_with_quantization(client: QdrantClient, collection_name: str, embed
             oversampling=2.0,
         )
     )
+    vectors = query_vectors(embeddings)
 
     # Get ground truth results (without quantization)
-    ground_truth_results = []
-    ground_truth_times = []
-
-    for query_text, query_vector in embeddings.items():
-        start_time = time.time()
-        result = client.query_points(
-            collection_name=collection_name,
-            query=query_vector,
-            limit=k,
-            search_params=models.SearchParams(
-                quantization=models.QuantizationSearchParams(ignore=True)
-            ),
-        ).points
-        query_time = (time.time() - start_time) * 1000  # Convert to ms
-        ground_truth_results.append([point.id for point in result])
-        ground_truth_times.append(query_time)
+    ground_truth_results, ground_truth_times = get_ground_truth(
+        client, collection_name, vectors,
+        k=k,
+        ignore_quantization=True,
+        batch_size=batch_size,
+        ground_truth_cache=ground_truth_cache,
+        ground_truth_source=ground_truth_source
+    )
 
     # Get quantized search results
-    quantized_results = []
-    quantized_times = []
+    quantized_results, histogram, server_histogram = _measure_search(
+        client, collection_name, vectors,
+        search_params=search_params,
+        k=k,
+        batch_size=batch_size,
+        warmup=warmup,
+        repetitions=repetitions,
+        name="quantized_time"
+    )
 
-    for query_text, query_vector in embeddings.items():
-        start_time = time.time()
-        result = client.query_points(
-            collection_name=collection_name,
-            query=query_vector,
-            limit=k,
-            search_params=search_params,
-        ).points
-        query_time = (time.time() - start_time) * 1000  # Convert to ms
-        quantized_results.append([point.id for point in result])
-        quantized_times.append(query_time)
-
-    # Calculate precision
-    precisions = []
-    for gt_ids, quant_ids in zip(ground_truth_results, quantized_results):
-        precision = len(set(gt_ids) & set(quant_ids)) / len(gt_ids)
-        precisions.append(precision)
-
-    avg_precision = sum(precisions) / len(precisions)
-    avg_ground_truth_time = sum(ground_truth_times) / len(ground_truth_times)
-    avg_quantized_time = sum(quantized_times) / len(quantized_times)
-
-    return {
+    # Uncached server-side search on the original vectors as baseline of the speedup
+    _, unquantized_histogram, _ = _measure_search(
+        client, collection_name, vectors,
+        search_params=models.SearchParams(quantization=models.QuantizationSearchParams(ignore=True)),
+        k=k,
+        batch_size=batch_size,
+        warmup=warmup,
+        repetitions=repetitions,
+        name="unquantized_time"
+    )
+
+    avg_ground_truth_time = sum(ground_truth_times) / len(ground_truth_times) * 1000  # Convert to ms
+    avg_unquantized_time = unquantized_histogram.mean * 1000
+    avg_quantized_time = histogram.mean * 1000
+
+    results = {
         "rescore": rescore,
-        "avg_precision": avg_precision,
+        **compute_metrics(quantized_results, ground_truth_results, k),
         "avg_ground_truth_time_ms": avg_ground_truth_time,
-        "avg_quantized_time_ms": avg_quantized_time,
-        "speedup_factor": avg_ground_truth_time / avg_quantized_time
+        "avg_unquantized_time_ms": avg_unquantized_time,
+        **histogram.summary(),
+        "speedup_factor": avg_unquantized_time / avg_quantized_time if avg_quantized_time > 0 else None,
+        "latency_histogram": histogram
     }
 
+    if batch_size:
+        results["avg_server_time_ms"] = server_histogram.mean * 1000 if server_histogram else None
+        results["batch_size"] = batch_size
+
+    return results
+
 
 def compute_avg_metrics(data: List[Dict]) -> Dict[str, float]:
     """
     Compute the average of all keys starting with 'avg' across a list of dictionaries.
 
+    Percentiles cannot be averaged, so latency histograms contained in the
+    entries are merged and the distribution metrics (std, p50, p90, p99, max)
+    are computed from the merged histogram.
+
     Args:
         data (List[Dict]): List of dictionaries with metrics
 
     Returns:
-        Dict[str, float]: Dictionary with average values for 'avg*' keys
+        Dict[str, float]: Dictionary with average values for 'avg*' keys and
+        distribution metrics of the merged latency histograms
     """
     if not data:
         return {}
 
     totals = {}
+    histograms = {}
     count = len(data)
 
     for entry in data:
         for key, value in entry.items():
             if key.startswith('avg') and isinstance(value, (int, float)):
                 totals[key] = totals.get(key, 0.0) + value
+            elif isinstance(value, LatencyHistogram):
+                if key not in histograms:
+                    histograms[key] = LatencyHistogram(value.name, value.significant_digits, value.lowest)
+                histograms[key].merge(value)
 
-    return {key: total / count for key, total in totals.items()}
+    metrics = {key: total / count for key, total in totals.items()}
+    for histogram in histograms.values():
+        metrics.update({key: value for key, value in histogram.summary().items() if not key.startswith('avg')})
+
+    return metrics
 
 def results_to_dataframe(results: List[Dict], m: int = None, ef_construct: int = None) -> pd.DataFrame:
     """
@@ -351,6 +589,11 @@ def results_to_dataframe(results: List[Dict], m: int = None, ef_construct: int =
     """
     df = pd.DataFrame(results)
 
+    # Latency histograms, build progress and telemetry samples are already summarized in other columns
+    histogram_columns = [column for column in df.columns
+                         if df[column].map(lambda value: isinstance(value, LatencyHistogram)).any()]
+    df = df.drop(columns=histogram_columns + [column for column in ('build_progress', 'telemetry_samples') if column in df.columns])
+
     if m is not None:
         df['m'] = m
 
@@ -358,27 +601,39 @@ def results_to_dataframe(results: List[Dict], m: int = None, ef_construct: int =
         df['ef_construct'] = ef_construct
 
     # Round floating point numbers for better readability
-    if 'avg_precision' in df.columns:
-        df['avg_precision'] = df['avg_precision'].round(6)
-
-    if 'avg_query_time_ms' in df.columns:
-        df['avg_query_time_ms'] = df['avg_query_time_ms'].round(6)
+    quality_columns = {'avg_precision', 'avg_mrr', 'avg_ndcg'}
+    for column in df.columns:
+        is_metric = (column in quality_columns or column.startswith('avg_recall_at_')
+                     or column.endswith('_ms') or column.endswith('_s'))
+        if is_metric and pd.api.types.is_numeric_dtype(df[column]):
+            df[column] = df[column].round(6)
 
     return df
 
 
-def evaluate_collection_with_config(client: QdrantClient, collection_name: str, config: Dict[str, Any], test_dataset: Dict) -> Dict:
+def evaluate_collection_with_config(client: QdrantClient, collection_name: str, config: Dict[str, Any], test_dataset: Dict, batch_size: Optional[int] = None, ground_truth_cache: Optional[GroundTruthCache] = None, ground_truth_source: Optional[LocalExactSearch] = None, warmup: int = 0, repetitions: int = 1, telemetry: bool = False, telemetry_interval: float = 1.0) -> Dict:
     """
     Update a collection with a specific HNSW configuration and evaluate its performance.
 
+    With `telemetry`, server memory, CPU and the storage footprint of the
+    collection are sampled before, during and after the evaluation and added
+    to the results, so every configuration carries its resource cost.
+
     Args:
         client (QdrantClient): Qdrant client
         collection_name (str): Name of the collection to update and evaluate
         config (Dict[str, Any]): HNSW configuration (m and ef_construct values)
         test_dataset (Dict): Test dataset for evaluation
+        batch_size (Optional[int]): Send queries in batches of this size instead of one by one
+        ground_truth_cache (Optional[GroundTruthCache]): Cache for exact search results, reused across configurations
+        ground_truth_source (Optional[LocalExactSearch]): Client-side exact search engine used for ground truth
+        warmup (int): Number of discarded passes over the query set before measuring
+        repetitions (int): Number of measured passes over the query set
+        telemetry (bool): Sample server telemetry during the evaluation
+        telemetry_interval (float): Seconds between telemetry samples during the evaluation
 
     Returns:
-        Dict: Evaluation results
+        Dict: Evaluation results including index build metrics
     """
     print(f"Updating collection {collection_name} with m={config['m']}, ef_construct={config['ef_construct']}...")
 
@@ -391,16 +646,32 @@ def evaluate_collection_with_config(client: QdrantClient, collection_name: str,
         ef_construct=config['ef_construct']
     )
 
-    # Wait for the collection to be ready
-    wait_for_collection_green(client, collection_name)
+    # Wait for the collection to be ready and record how long the index build took. The collection
+    # may still be green until the optimizer picked up the update, so wait for the build to start
+    build_metrics = wait_for_collection_green(client, collection_name, start_timeout=10.0)
 
     # Evaluate the updated collection
     print(f"Evaluating collection {collection_name}...")
-    results = evaluate_ann(client, collection_name, test_dataset)
+    vectors = query_vectors(test_dataset)
+    knn_ids, _ = get_ground_truth(client, collection_name, vectors, batch_size=batch_size, ground_truth_cache=ground_truth_cache, ground_truth_source=ground_truth_source)
+
+    # Sampling starts after the ground truth, so exact search does not count towards the cost
+    sampler = TelemetrySampler(client, collection_name, interval=telemetry_interval) if telemetry else None
+    with sampler or contextlib.nullcontext():
+        ann_ids, histogram, server_histogram = _measure_search(
+            client, collection_name, vectors,
+            batch_size=batch_size,
+            warmup=warmup,
+            repetitions=repetitions
+        )
+    results = _search_results(ann_ids, knn_ids, histogram, server_histogram, batch_size)
 
     # Add configuration parameters to results
     results['m'] = config['m']
     results['ef_construct'] = config['ef_construct']
     results['collection'] = collection_name
+    results.update(build_metrics)
+    if sampler is not None:
+        results.update(sampler.summary())
 
     return results
@@ -0,0 +1,241 @@
+from collections import Counter
+from typing import List, Dict, Any, Optional, Sequence
+
+from qdrant_client import QdrantClient, models
+
+from qdrant_evaluation.collection import wait_for_collection_green
+from qdrant_evaluation.evaluator import get_ground_truth, _measure_search, _search_results
+from qdrant_evaluation.ground_truth import GroundTruthCache
+from qdrant_evaluation.query_set import query_vectors
+
+FILTER_FIELDS = ("categories", "update_date")
+
+DEFAULT_SELECTIVITIES = [0.5, 0.1, 0.01, 0.001]
+
+
+def payload_distribution(client: QdrantClient, collection_name: str, sample_size: int = 10000,
+                         batch_size: int = 1000) -> Dict[str, Any]:
+    """
+    Sample the distribution of the 'categories' and 'update_date' payload fields.
+
+    'categories' holds space separated arXiv categories such as 'cs.LG stat.ML',
+    so every category is counted on its own. Only the two payload fields are
+    fetched, the sample covers the first `sample_size` points of the collection.
+
+    Args:
+        client (QdrantClient): Qdrant client
+        collection_name (str): Name of the collection
+        sample_size (int): Maximum number of points sampled
+        batch_size (int): Number of points fetched per scroll request
+
+    Returns:
+        Dict[str, Any]: 'sampled' point count, 'categories' counts and sorted 'update_dates'
+    """
+    categories: Counter = Counter()
+    dates = []
+    sampled = 0
+    offset = None
+
+    while sampled < sample_size:
+        points, offset = client.scroll(
+            collection_name=collection_name,
+            limit=min(batch_size, sample_size - sampled),
+            offset=offset,
+            with_payload=list(FILTER_FIELDS),
+            with_vectors=False
+        )
+        for point in points:
+            payload = point.payload or {}
+            categories.update(set((payload.get("categories") or "").split()))
+            if payload.get("update_date"):
+                dates.append(payload["update_date"])
+        sampled += len(points)
+
+        if not points or offset is None:
+            break
+
+    return {"sampled": sampled, "categories": categories, "update_dates": sorted(dates)}
+
+
+def selectivity_filters(distribution: Dict[str, Any], selectivities: Sequence[float],
+                        fields: Sequence[str] = FILTER_FIELDS) -> List[Dict[str, Any]]:
+    """
+    Generate payload filters matching target selectivities.
+
+    For 'categories' the category whose sampled share is closest to the target
+    is chosen. For 'update_date' the filter keeps the most recent papers, with
+    the lower date bound placed at the matching quantile. Targets that resolve
+    to the same filter as a previous target are skipped.
+
+    Args:
+        distribution (Dict[str, Any]): Payload distribution from `payload_distribution`
+        selectivities (Sequence[float]): Target shares of matching points, e.g. [0.1, 0.01]
+        fields (Sequence[str]): Payload fields to filter on
+
+    Returns:
+        List[Dict[str, Any]]: One entry per field and target with 'field', 'target_selectivity',
+        the filter 'value' and the 'filter' itself
+    """
+    sampled = distribution["sampled"]
+    dates = distribution["update_dates"]
+    filters = []
+
+    for field in fields:
+        seen = set()
+        for selectivity in selectivities:
+            if field == "categories":
+                if not distribution["categories"]:
+                    continue
+                value = min(
+                    distribution["categories"],
+                    key=lambda category: abs(distribution["categories"][category] / sampled - selectivity)
+                )
+                query_filter = models.Filter(must=[
+                    models.FieldCondition(key="categories", match=models.MatchText(text=value))
+                ])
+            elif field == "update_date":
+                if not dates:
+                    continue
+                value = dates[min(int((1 - selectivity) * len(dates)), len(dates) - 1)]
+                query_filter = models.Filter(must=[
+                    models.FieldCondition(key="update_date", range=models.DatetimeRange(gte=value))
+                ])
+            else:
+                raise ValueError(f"Unsupported filter field: {field}")
+
+            if value in seen:
+                continue
+            seen.add(value)
+            filters.append({"field": field, "target_selectivity": selectivity, "value": value, "filter": query_filter})
+
+    return filters
+
+
+def create_payload_indexes(client: QdrantClient, collection_name: str, fields: Sequence[str] = FILTER_FIELDS,
+                           timeout: int = 3600) -> None:
+    """
+    Create payload indexes for the filter fields and wait until the collection is green.
+
+    'categories' gets a whitespace-tokenized full-text index, so single
+    categories can be matched, and 'update_date' a datetime index.
+
+    Args:
+        client (QdrantClient): Qdrant client
+        collection_name (str): Name of the collection
+        fields (Sequence[str]): Payload fields to index
+        timeout (int): Maximum time in seconds to wait for the collection to become green
+    """
+    schemas = {
+        "categories": models.TextIndexParams(
+            type=models.TextIndexType.TEXT,
+            tokenizer=models.TokenizerType.WHITESPACE,
+            lowercase=False
+        ),
+        "update_date": models.PayloadSchemaType.DATETIME,
+    }
+
+    for field in fields:
+        print(f"Creating payload index on {field} of {collection_name}...")
+        client.create_payload_index(
+            collection_name=collection_name,
+            field_name=field,
+            field_schema=schemas[field],
+            wait=True
+        )
+    wait_for_collection_green(client, collection_name, timeout=timeout)
+
+
+def evaluate_filtered_search(client: QdrantClient, collection_name: str, embeddings: Dict,
+                             selectivities: Optional[Sequence[float]] = None, fields: Sequence[str] = FILTER_FIELDS,
+                             hnsw_ef: Optional[int] = None, k: int = 10, create_indexes: bool = False,
+                             sample_size: int = 10000, batch_size: Optional[int] = None, warmup: int = 0,
+                             repetitions: int = 1, ground_truth_cache: Optional[GroundTruthCache] = None) -> List[Dict[str, Any]]:
+    """
+    Evaluate filtered ANN search for filters of controlled selectivity.
+
+    Filters on 'categories' and 'update_date' are generated from the sampled
+    payload distribution. Each filter is evaluated with filtered ANN search
+    against filtered exact search as ground truth, and the exact selectivity is
+    counted on the server. With `create_indexes` the collection is evaluated
+    in its current state first, then the payload indexes are created and every
+    filter is evaluated again, so both runs can be compared per bucket.
+
+    Category filters use text matching, which matches substrings without a
+    text index and whole tokens with one, so a filter can match different
+    points before and after indexing. Selectivity and ground truth are
+    therefore determined again for every index state.
+
+    Args:
+        client (QdrantClient): Qdrant client
+        collection_name (str): Name of the collection to query
+        embeddings (Dict): Dictionary of embeddings or QuerySet to evaluate
+        selectivities (Optional[Sequence[float]]): Target selectivities (default: 0.5, 0.1, 0.01, 0.001)
+        fields (Sequence[str]): Payload fields to filter on
+        hnsw_ef (Optional[int]): HNSW ef used for the filtered ANN search
+        k (int): Number of results considered for the quality metrics
+        create_indexes (bool): Create payload indexes and evaluate again afterwards
+        sample_size (int): Number of points sampled for the payload distribution
+        batch_size (Optional[int]): Send queries in batches of this size instead of one by one
+        warmup (int): Number of discarded passes over the query set before measuring
+        repetitions (int): Number of measured passes over the query set
+        ground_truth_cache (Optional[GroundTruthCache]): Cache for filtered exact search results
+
+    Returns:
+        List[Dict[str, Any]]: One row per filter and index state with selectivity, quality
+        metrics, ANN latency and filtered exact search latency (as recorded when the
+        ground truth was computed, so cached entries keep their original latency)
+    """
+    if selectivities is None:
+        selectivities = DEFAULT_SELECTIVITIES
+
+    vectors = query_vectors(embeddings)
+    distribution = payload_distribution(client, collection_name, sample_size=sample_size)
+    filters = selectivity_filters(distribution, selectivities, fields)
+    search_params = models.SearchParams(hnsw_ef=hnsw_ef) if hnsw_ef else None
+
+    def evaluate_all() -> List[Dict[str, Any]]:
+        info = client.get_collection(collection_name)
+        payload_schema = info.payload_schema or {}
+        rows = []
+        for entry in filters:
+            payload_index = entry["field"] in payload_schema
+            matching = client.count(collection_name, count_filter=entry["filter"], exact=True).count
+            selectivity = matching / info.points_count if info.points_count else 0.0
+            print(f"Evaluating filter on {entry['field']}={entry['value']} "
+                  f"(selectivity {selectivity:.4f}, payload index: {payload_index})...")
+
+            exact_ids, exact_times = get_ground_truth(
+                client, collection_name, vectors,
+                k=k,
+                batch_size=batch_size,
+                ground_truth_cache=ground_truth_cache,
+                query_filter=entry["filter"]
+            )
+            result_ids, histogram, server_histogram = _measure_search(
+                client, collection_name, vectors,
+                search_params=search_params,
+                k=k,
+                batch_size=batch_size,
+                warmup=warmup,
+                repetitions=repetitions,
+                query_filter=entry["filter"]
+            )
+            rows.append({
+                "field": entry["field"],
+                "value": entry["value"],
+                "target_selectivity": entry["target_selectivity"],
+                "selectivity": selectivity,
+                "matching_points": matching,
+                "payload_index": payload_index,
+                "hnsw_ef": hnsw_ef,
+                **_search_results(result_ids, exact_ids, histogram, server_histogram, batch_size, k),
+                "avg_exact_time_ms": sum(exact_times) / len(exact_times) * 1000 if exact_times else None
+            })
+        return rows
+
+    results_list = evaluate_all()
+    if create_indexes:
+        create_payload_indexes(client, collection_name, fields)
+        results_list.extend(evaluate_all())
+
+    return results_list
@@ -0,0 +1,261 @@
+import glob
+import hashlib
+import json
+import os
+import random
+import uuid
+from typing import List, Tuple, Optional, Callable
+
+import numpy as np
+from qdrant_client import QdrantClient
+
+
+def query_set_hash(embeddings: List[List]) -> str:
+    """
+    Calculate a stable hash of a set of query vectors.
+
+    Args:
+        embeddings (List[List]): Query embedding vectors
+
+    Returns:
+        str: Hex digest identifying the query set
+    """
+    matrix = np.ascontiguousarray(np.asarray(embeddings, dtype=np.float32))
+    digest = hashlib.sha256()
+    digest.update(str(matrix.shape).encode("utf-8"))
+    digest.update(matrix.tobytes())
+    return digest.hexdigest()
+
+
+def _probe_offsets(first_id, points_count: int, probes: int, seed: int = 0) -> List:
+    rng = random.Random(seed)
+    if isinstance(first_id, int):
+        # Integer IDs are assumed to be roughly dense from the first ID on
+        return sorted({first_id + rng.randrange(max(points_count, 1)) for _ in range(probes)})
+    return sorted(str(uuid.UUID(int=rng.getrandbits(128))) for _ in range(probes))
+
+
+def collection_fingerprint(client: QdrantClient, collection_name: str, sample_size: int = 32, include_index_config: bool = False,
+                           probes: int = 8, include_payload_schema: bool = False) -> str:
+    """
+    Calculate a fingerprint of the content of a collection.
+
+    The fingerprint covers the point count, the vector configuration and the
+    IDs and vectors of a sample of points: the first `sample_size` points in
+    ID order plus `sample_size` more points found from `probes` seeded random
+    offsets across the ID space (UUIDs, or integers from the first ID up to
+    the point count). Re-ingesting or deleting data therefore yields a new
+    fingerprint.
+
+    Known limitation: updating vectors in place outside the sample, without
+    changing the point count, keeps the fingerprint. Call
+    `GroundTruthCache.invalidate` after such updates.
+
+    Args:
+        client (QdrantClient): Qdrant client
+        collection_name (str): Name of the collection
+        sample_size (int): Number of points whose vectors are hashed from the start and across the ID space each
+        include_index_config (bool): Also hash the HNSW and quantization configuration,
+            needed when the ground truth itself is produced by an index search
+        probes (int): Number of random offsets the spread sample is read from
+        include_payload_schema (bool): Also hash the payload indexes, needed for filtered
+            ground truth since a text index changes what text conditions match
+
+    Returns:
+        str: Hex digest identifying the collection content
+    """
+    info = client.get_collection(collection_name)
+    digest = hashlib.sha256()
+    digest.update(str(info.points_count).encode("utf-8"))
+    digest.update(info.config.params.model_dump_json().encode("utf-8"))
+
+    if include_index_config:
+        digest.update(info.config.hnsw_config.model_dump_json().encode("utf-8"))
+        quantization = info.config.quantization_config
+        digest.update((quantization.model_dump_json() if quantization else "none").encode("utf-8"))
+
+    if include_payload_schema:
+        for field, schema in sorted((info.payload_schema or {}).items()):
+            digest.update(field.encode("utf-8"))
+            digest.update(schema.model_dump_json().encode("utf-8"))
+
+    if sample_size > 0:
+        points, _ = client.scroll(
+            collection_name=collection_name,
+            limit=sample_size,
+            with_payload=False,
+            with_vectors=True
+        )
+        points = list(points)
+        if points and probes > 0:
+            per_probe = max(1, sample_size // probes)
+            for offset in _probe_offsets(points[0].id, info.points_count or 0, probes):
+                points += client.scroll(
+                    collection_name=collection_name,
+                    limit=per_probe,
+                    offset=offset,
+                    with_payload=False,
+                    with_vectors=True
+                )[0]
+
+        for point in points:
+            digest.update(str(point.id).encode("utf-8"))
+            vectors = point.vector if isinstance(point.vector, dict) else {"": point.vector}
+            for name in sorted(vectors):
+                digest.update(name.encode("utf-8"))
+                digest.update(np.asarray(vectors[name], dtype=np.float32).tobytes())
+
+    return digest.hexdigest()
+
+
+class GroundTruthCache:
+    """
+    On-disk store for exact search results.
+
+    Entries are keyed by collection name, collection fingerprint, query-set
+    hash, k and search mode. Storing results for a new fingerprint removes the
+    stale entries of the same collection, so a changed collection never serves
+    outdated ground truth.
+    """
+
+    def __init__(self, cache_dir: str = ".ground_truth_cache", sample_size: int = 32):
+        """
+        Initialize the cache.
+
+        Args:
+            cache_dir (str): Directory the cache entries are written to
+            sample_size (int): Number of points hashed into the collection fingerprint
+        """
+        self.cache_dir = cache_dir
+        self.sample_size = sample_size
+        os.makedirs(cache_dir, exist_ok=True)
+
+    @staticmethod
+    def _safe_name(collection_name: str) -> str:
+        return "".join(c if c.isalnum() or c in "-_" else "_" for c in collection_name)
+
+    def _path(self, collection_name: str, fingerprint: str, query_hash: str, k: int, mode: str) -> str:
+        key = hashlib.sha256(f"{fingerprint}:{query_hash}:{k}:{mode}".encode("utf-8")).hexdigest()
+        return os.path.join(self.cache_dir, f"{self._safe_name(collection_name)}__{mode}__{key}.json")
+
+    def load(self, collection_name: str, fingerprint: str, query_hash: str, k: int, mode: str) -> Optional[Tuple[List[List], List[float]]]:
+        """
+        Load cached ground truth.
+
+        Args:
+            collection_name (str): Name of the collection
+            fingerprint (str): Collection fingerprint
+            query_hash (str): Query-set hash
+            k (int): Number of results per query
+            mode (str): Ground truth search mode
+
+        Returns:
+            Optional[Tuple[List[List], List[float]]]: Result IDs and query times per query,
+            or None if no entry exists
+        """
+        path = self._path(collection_name, fingerprint, query_hash, k, mode)
+        try:
+            with open(path, 'r', encoding='utf-8') as file:
+                entry = json.load(file)
+        except (FileNotFoundError, json.JSONDecodeError):
+            return None
+
+        if entry.get("fingerprint") != fingerprint or entry.get("query_hash") != query_hash:
+            return None
+        return entry["ids"], entry["times"]
+
+    def store(self, collection_name: str, fingerprint: str, query_hash: str, k: int, mode: str, ids: List[List], times: List[float]) -> None:
+        """
+        Store ground truth and drop entries of outdated collection states.
+
+        Args:
+            collection_name (str): Name of the collection
+            fingerprint (str): Collection fingerprint
+            query_hash (str): Query-set hash
+            k (int): Number of results per query
+            mode (str): Ground truth search mode
+            ids (List[List]): Result IDs per query
+            times (List[float]): Query execution time per query in seconds
+        """
+        self.invalidate(collection_name, mode=mode, keep_fingerprint=fingerprint)
+
+        path = self._path(collection_name, fingerprint, query_hash, k, mode)
+        entry = {
+            "collection": collection_name,
+            "fingerprint": fingerprint,
+            "query_hash": query_hash,
+            "k": k,
+            "mode": mode,
+            "ids": ids,
+            "times": times
+        }
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, 'w', encoding='utf-8') as file:
+            json.dump(entry, file)
+        os.replace(tmp_path, path)
+
+    def invalidate(self, collection_name: str, mode: Optional[str] = None, keep_fingerprint: Optional[str] = None) -> int:
+        """
+        Remove cached entries of a collection.
+
+        Args:
+            collection_name (str): Name of the collection
+            mode (Optional[str]): Only remove entries of this ground truth search mode
+            keep_fingerprint (Optional[str]): Keep entries with this fingerprint
+
+        Returns:
+            int: Number of removed entries
+        """
+        removed = 0
+        mode_pattern = glob.escape(mode) if mode else "*"
+        pattern = os.path.join(self.cache_dir, f"{glob.escape(self._safe_name(collection_name))}__{mode_pattern}__*.json")
+        for path in glob.glob(pattern):
+            try:
+                with open(path, 'r', encoding='utf-8') as file:
+                    entry = json.load(file)
+            except (OSError, json.JSONDecodeError):
+                entry = {}
+
+            if entry.get("collection") not in (None, collection_name):
+                continue
+            if mode is not None and entry.get("mode") not in (None, mode):
+                continue
+            if keep_fingerprint is not None and entry.get("fingerprint") == keep_fingerprint:
+                continue
+
+            os.remove(path)
+            removed += 1
+        return removed
+
+    def get_or_compute(self, client: QdrantClient, collection_name: str, embeddings: List[List], k: int, mode: str,
+                       compute: Callable[[], Tuple[List[List], List[float]]]) -> Tuple[List[List], List[float]]:
+        """
+        Return cached ground truth or compute and store it.
+
+        Args:
+            client (QdrantClient): Qdrant client
+            collection_name (str): Name of the collection
+            embeddings (List[List]): Query embedding vectors
+            k (int): Number of results per query
+            mode (str): Ground truth search mode ('exact' or 'ignore_quantization', with a filter suffix for filtered search)
+            compute (Callable): Function computing result IDs and query times on a cache miss
+
+        Returns:
+            Tuple[List[List], List[float]]: Result IDs and query times per query
+        """
+        fingerprint = collection_fingerprint(
+            client, collection_name,
+            sample_size=self.sample_size,
+            include_index_config=not mode.startswith("exact"),
+            include_payload_schema="_filter_" in mode
+        )
+        query_hash = query_set_hash(embeddings)
+
+        cached = self.load(collection_name, fingerprint, query_hash, k, mode)
+        if cached is not None:
+            print(f"Using cached {mode} ground truth for {collection_name}.")
+            return cached
+
+        ids, times = compute()
+        self.store(collection_name, fingerprint, query_hash, k, mode, ids, times)
+        return ids, times
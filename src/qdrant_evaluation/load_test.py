@@ -0,0 +1,226 @@
+import asyncio
+from typing import List, Dict, Any, Optional
+
+from qdrant_client import AsyncQdrantClient, models
+
+from qdrant_evaluation.client import get_client, get_async_client
+from qdrant_evaluation.evaluator import get_ground_truth
+from qdrant_evaluation.ground_truth import GroundTruthCache
+from qdrant_evaluation.brute_force import LocalExactSearch
+from qdrant_evaluation.query_set import query_vectors
+from qdrant_evaluation.timing import now, LatencyHistogram
+from qdrant_evaluation.metrics import compute_metrics
+from qdrant_evaluation.projection import PointIdLookup, register_id_lookup, search_payload, result_ids as resolve_ids
+
+
+def search_params_from_setting(setting: Dict[str, Any]) -> Optional[models.SearchParams]:
+    """
+    Build search parameters from a setting as used by the existing evaluators.
+
+    Supported keys are 'hnsw_ef' (like `evaluate_hnsw_ef`) and 'rescore' /
+    'oversampling' (like `evaluate_with_quantization`). An empty setting runs
+    plain ANN search like `evaluate_ann`.
+
+    Args:
+        setting (Dict[str, Any]): Search setting
+
+    Returns:
+        Optional[models.SearchParams]: Search parameters or None for default search
+    """
+    quantization = None
+    if "rescore" in setting or "oversampling" in setting:
+        quantization = models.QuantizationSearchParams(
+            rescore=setting.get("rescore", False),
+            oversampling=setting.get("oversampling", 2.0),
+        )
+
+    if setting.get("hnsw_ef") is None and quantization is None:
+        return None
+
+    return models.SearchParams(hnsw_ef=setting.get("hnsw_ef"), quantization=quantization)
+
+
+async def run_load_test(client: AsyncQdrantClient, collection_name: str, embeddings: List[List],
+                        search_params: Optional[models.SearchParams] = None, k: int = 10,
+                        concurrency: int = 8, target_qps: Optional[float] = None, repeat: int = 1) -> Dict[str, Any]:
+    """
+    Replay query vectors against a collection with concurrent requests.
+
+    Without a target rate the queries run closed-loop: `concurrency` requests are
+    in flight at any time. With a target rate requests are issued on a fixed
+    schedule and latency is measured from the scheduled start, so queueing delay
+    caused by an overloaded server shows up in the percentiles.
+
+    Args:
+        client (AsyncQdrantClient): Asynchronous Qdrant client
+        collection_name (str): Name of the collection to query
+        embeddings (List[List]): Query embedding vectors
+        search_params (Optional[models.SearchParams]): Search parameters applied to every query
+        k (int): Number of results to return per query
+        concurrency (int): Maximum number of requests in flight
+        target_qps (Optional[float]): Target request rate, None to run as fast as possible
+        repeat (int): Number of times the query set is replayed
+
+    Returns:
+        Dict[str, Any]: Achieved QPS, per-request latencies in seconds, result IDs
+        per request and the number of failed requests
+    """
+    total = len(embeddings) * repeat
+    semaphore = asyncio.Semaphore(concurrency)
+    latencies: List[Optional[float]] = [None] * total
+    result_ids: List[Optional[List]] = [None] * total
+    errors = 0
+    start_time = now()
+
+    async def send(index: int) -> None:
+        nonlocal errors
+        scheduled = None
+        if target_qps:
+            scheduled = start_time + index / target_qps
+            delay = scheduled - now()
+            if delay > 0:
+                await asyncio.sleep(delay)
+
+        async with semaphore:
+            issued = now()
+            try:
+                response = await client.query_points(
+                    collection_name=collection_name,
+                    query=embeddings[index % len(embeddings)],
+                    limit=k,
+                    search_params=search_params,
+                    with_payload=search_payload(client, collection_name)
+                )
+            except Exception as e:
+                errors += 1
+                print(f"❌ Error: {str(e)}")
+                return
+            finished = now()
+
+        latencies[index] = finished - (scheduled if scheduled is not None else issued)
+        result_ids[index] = resolve_ids(client, collection_name, response.points)
+
+    await asyncio.gather(*(send(index) for index in range(total)))
+    elapsed = now() - start_time
+
+    return {
+        "achieved_qps": (total - errors) / elapsed if elapsed > 0 else 0.0,
+        "elapsed_s": elapsed,
+        "latencies": latencies,
+        "result_ids": result_ids,
+        "errors": errors
+    }
+
+
+def summarize_load_test(load_result: Dict[str, Any], exact_ids: List[List], k: int = 10) -> Dict[str, Any]:
+    """
+    Summarize a load test run into throughput, latency percentiles and quality metrics.
+
+    Args:
+        load_result (Dict[str, Any]): Result of `run_load_test`
+        exact_ids (List[List]): Ground truth IDs for every query of the query set
+        k (int): Number of results considered for the quality metrics
+
+    Returns:
+        Dict[str, Any]: Summary with achieved QPS, latency percentiles in ms and quality metrics
+    """
+    histogram = LatencyHistogram()
+    histogram.record_all(t for t in load_result["latencies"] if t is not None)
+    answered = [index for index, ids in enumerate(load_result["result_ids"]) if ids is not None]
+
+    summary = {
+        "achieved_qps": load_result["achieved_qps"],
+        "num_queries": len(load_result["latencies"]),
+        "errors": load_result["errors"],
+        "avg_precision": None,
+    }
+    if answered:
+        summary.update(compute_metrics(
+            [load_result["result_ids"][index] for index in answered],
+            [exact_ids[index % len(exact_ids)] for index in answered],
+            k
+        ))
+    if histogram.count:
+        summary.update(histogram.summary())
+        summary["latency_histogram"] = histogram
+    return summary
+
+
+def evaluate_under_load(collection_name: str, embeddings: Dict, settings: Optional[List[Dict[str, Any]]] = None,
+                        host: str = "localhost", port: int = 6333, k: int = 10, concurrency: int = 8,
+                        target_qps: Optional[float] = None, repeat: int = 1,
+                        ground_truth_cache: Optional[GroundTruthCache] = None,
+                        ground_truth_source: Optional[LocalExactSearch] = None,
+                        id_lookup: Optional[PointIdLookup] = None) -> List[Dict[str, Any]]:
+    """
+    Measure throughput, tail latency and precision under concurrent load.
+
+    Every setting is replayed with the same load profile. Ground truth is
+    computed once per search mode before the load starts, so exact search does
+    not compete with the measured traffic.
+
+    Args:
+        collection_name (str): Name of the collection to query
+        embeddings (Dict): Dictionary of embeddings or QuerySet, e.g. from `load_test_dataset`
+        settings (Optional[List[Dict[str, Any]]]): Search settings, e.g. [{}, {"hnsw_ef": 64},
+            {"rescore": True, "oversampling": 2.0}] (default: plain ANN search)
+        host (str): Qdrant server host
+        port (int): Qdrant server port
+        k (int): Number of results to return per query
+        concurrency (int): Maximum number of requests in flight
+        target_qps (Optional[float]): Target request rate, None to run as fast as possible
+        repeat (int): Number of times the query set is replayed per setting
+        ground_truth_cache (Optional[GroundTruthCache]): Cache for ground truth results
+        ground_truth_source (Optional[LocalExactSearch]): Client-side exact search engine used for ground truth
+        id_lookup (Optional[PointIdLookup]): Lookup table used instead of the 'id' payload, see `register_id_lookup`
+
+    Returns:
+        List[Dict[str, Any]]: Load test results for each setting
+    """
+    if settings is None:
+        settings = [{}]
+
+    vectors = query_vectors(embeddings)
+    client = get_client(host=host, port=port)
+    # The clients are created here, so the lookup is registered for them only
+    register_id_lookup(client, collection_name, id_lookup)
+    ground_truth = {}
+
+    for setting in settings:
+        ignore_quantization = "rescore" in setting or "oversampling" in setting
+        if ignore_quantization not in ground_truth:
+            ground_truth[ignore_quantization], _ = get_ground_truth(
+                client, collection_name, vectors,
+                k=k,
+                ignore_quantization=ignore_quantization,
+                ground_truth_cache=ground_truth_cache,
+                ground_truth_source=ground_truth_source
+            )
+
+    async def run_all() -> List[Dict[str, Any]]:
+        async_client = get_async_client(host=host, port=port)
+        register_id_lookup(async_client, collection_name, id_lookup)
+        results_list = []
+        try:
+            for setting in settings:
+                print(f"Running load test on {collection_name} with {setting or 'default search'}...")
+                load_result = await run_load_test(
+                    async_client, collection_name, vectors,
+                    search_params=search_params_from_setting(setting),
+                    k=k,
+                    concurrency=concurrency,
+                    target_qps=target_qps,
+                    repeat=repeat
+                )
+                exact_ids = ground_truth["rescore" in setting or "oversampling" in setting]
+                results_list.append({
+                    **setting,
+                    "concurrency": concurrency,
+                    "target_qps": target_qps,
+                    **summarize_load_test(load_result, exact_ids, k)
+                })
+        finally:
+            await async_client.close()
+        return results_list
+
+    return asyncio.run(run_all())
@@ -0,0 +1,112 @@
+from typing import List, Dict, Tuple, Optional, Sequence, Union
+
+import numpy as np
+import pandas as pd
+
+# Padding codes for queries with fewer than k IDs; they never match each other or an
+# ID, since IDs are coded from 0 on, missing values included
+RESULT_PAD = -2
+TRUTH_PAD = -3
+
+IdMatrix = Union[np.ndarray, List[List]]
+
+
+def ids_to_matrices(result_ids: List[List], exact_ids: List[List], k: int = 10) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Encode result and ground truth ID lists as integer matrices.
+
+    IDs of any hashable type, None included, are mapped to shared integer
+    codes from 0 on. Rows with fewer than k IDs are padded with negative codes
+    that never match.
+
+    Args:
+        result_ids (List[List]): Result IDs per query, ordered by rank
+        exact_ids (List[List]): Ground truth IDs per query, ordered by rank
+        k (int): Number of columns of the matrices
+
+    Returns:
+        Tuple[np.ndarray, np.ndarray]: Result and ground truth matrices of shape (n_queries, k)
+    """
+    if len(result_ids) != len(exact_ids):
+        raise ValueError(f"Got {len(result_ids)} result rows for {len(exact_ids)} ground truth rows")
+
+    rows = [list(ids)[:k] for ids in result_ids] + [list(ids)[:k] for ids in exact_ids]
+    # Missing values get a code of their own instead of factorize's -1 sentinel
+    codes, _ = pd.factorize(pd.Series([value for row in rows for value in row], dtype=object), use_na_sentinel=False)
+
+    matrix = np.empty((len(rows), k), dtype=np.int64)
+    matrix[:len(result_ids)] = RESULT_PAD
+    matrix[len(result_ids):] = TRUTH_PAD
+    lengths = np.array([len(row) for row in rows], dtype=np.int64)
+    mask = np.arange(k) < lengths[:, None]
+    matrix[mask] = codes
+
+    return matrix[:len(result_ids)], matrix[len(result_ids):]
+
+
+def default_cutoffs(k: int) -> List[int]:
+    """
+    Get the recall cutoffs reported for a given k.
+
+    Args:
+        k (int): Number of results per query
+
+    Returns:
+        List[int]: Cutoffs 1, 5 and 10 that do not exceed k, plus k itself
+    """
+    return sorted({cutoff for cutoff in (1, 5, 10) if cutoff <= k} | {k})
+
+
+def compute_metrics(results: IdMatrix, ground_truth: IdMatrix, k: int = 10, cutoffs: Optional[Sequence[int]] = None,
+                    per_query: bool = False) -> Dict[str, Union[float, np.ndarray]]:
+    """
+    Compute precision@k, recall@cutoff, MRR and nDCG@k for a whole query set.
+
+    All metrics are computed from one boolean hit matrix, where entry (q, r)
+    tells whether the result at rank r of query q is part of its ground truth.
+
+    - precision@k: hits in the top k divided by k
+    - recall@c: share of the c exact nearest neighbours found in the top c results
+    - MRR: reciprocal rank of the exact nearest neighbour in the results
+    - nDCG@k: binary-relevance DCG of the results divided by the ideal DCG
+
+    Args:
+        results (IdMatrix): Result IDs as an integer matrix or a list of ID lists
+        ground_truth (IdMatrix): Ground truth IDs in the same format, ordered by rank
+        k (int): Number of results considered
+        cutoffs (Optional[Sequence[int]]): Recall cutoffs (default: 1, 5, 10 and k)
+        per_query (bool): Return the per-query arrays instead of their means
+
+    Returns:
+        Dict[str, Union[float, np.ndarray]]: 'avg_precision', 'avg_recall_at_<c>',
+        'avg_mrr' and 'avg_ndcg'
+    """
+    if not isinstance(results, np.ndarray) or not isinstance(ground_truth, np.ndarray):
+        results, ground_truth = ids_to_matrices(results, ground_truth, k)
+
+    results = results[:, :k]
+    if cutoffs is None:
+        cutoffs = default_cutoffs(k)
+
+    # hits[q, r]: result r of query q appears anywhere in the ground truth of query q
+    hits = (results[:, :, None] == ground_truth[:, None, :]).any(axis=2)
+    relevant = np.maximum((ground_truth != TRUTH_PAD).sum(axis=1), 1)
+
+    metrics = {"avg_precision": hits.sum(axis=1) / k}
+
+    for cutoff in cutoffs:
+        found = (results[:, :cutoff, None] == ground_truth[:, None, :cutoff]).any(axis=2).sum(axis=1)
+        metrics[f"avg_recall_at_{cutoff}"] = found / np.minimum(relevant, cutoff)
+
+    nearest = results == ground_truth[:, :1]
+    first_rank = np.where(nearest.any(axis=1), nearest.argmax(axis=1) + 1, 0)
+    metrics["avg_mrr"] = np.where(first_rank > 0, 1.0 / np.maximum(first_rank, 1), 0.0)
+
+    discounts = 1.0 / np.log2(np.arange(2, hits.shape[1] + 2))
+    dcg = (hits * discounts).sum(axis=1)
+    ideal = np.cumsum(discounts)[np.minimum(relevant, hits.shape[1]) - 1]
+    metrics["avg_ndcg"] = dcg / ideal
+
+    if per_query:
+        return metrics
+    return {key: float(values.mean()) if len(values) else 0.0 for key, values in metrics.items()}
@@ -0,0 +1,169 @@
+import contextlib
+import threading
+import time
+from typing import List, Dict, Any, Optional
+
+from qdrant_client import QdrantClient, models
+
+from qdrant_data_ingestion.data_ingestion import DataIngestion
+from qdrant_evaluation.evaluator import get_ground_truth, _measure_search, _search_results
+from qdrant_evaluation.ground_truth import GroundTruthCache
+from qdrant_evaluation.query_set import query_vectors
+from qdrant_evaluation.telemetry import TelemetrySampler
+from qdrant_evaluation.timing import now
+
+
+class BackgroundIngestion:
+    """
+    Re-ingest a data file into a collection at a paced write rate on a background thread.
+
+    The file is ingested over and over until the context is left, so the write
+    load lasts as long as the block of code it wraps. Records are upserted
+    with their usual point IDs, so re-ingestion updates points instead of
+    growing the collection.
+
+    Args:
+        ingestion (DataIngestion): Ingestion instance with its own client and batch size
+        file_path (str): Path to the JSON file with one record per line
+        collection_name (str): Name of the collection to write to
+        max_points_per_second (Optional[float]): Target write rate, None for no limit
+    """
+
+    def __init__(self, ingestion: DataIngestion, file_path: str, collection_name: str,
+                 max_points_per_second: Optional[float] = None):
+        self.ingestion = ingestion
+        self.file_path = file_path
+        self.collection_name = collection_name
+        self.max_points_per_second = max_points_per_second
+        self.points_written = 0
+        self.elapsed = 0.0
+        self.error: Optional[Exception] = None
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def _run(self) -> None:
+        start_time = now()
+        try:
+            while not self._stop.is_set():
+                written = self.ingestion.ingest_data(
+                    file_path=self.file_path,
+                    collection_name=self.collection_name,
+                    show_progress=False,
+                    max_points_per_second=self.max_points_per_second,
+                    stop_event=self._stop
+                )
+                self.points_written += written
+                if written == 0:
+                    break
+        except Exception as e:
+            self.error = e
+        self.elapsed = now() - start_time
+
+    def __enter__(self) -> "BackgroundIngestion":
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self._stop.set()
+        self._thread.join()
+
+    @property
+    def throughput(self) -> float:
+        """Points written per second."""
+        return self.points_written / self.elapsed if self.elapsed > 0 else 0.0
+
+
+def evaluate_under_ingestion(client: QdrantClient, collection_name: str, embeddings: Dict, file_path: str,
+                             write_rates: Optional[List[Optional[float]]] = None, write_batch_sizes: Optional[List[int]] = None,
+                             host: str = "localhost", port: int = 6333, k: int = 10, hnsw_ef: Optional[int] = None,
+                             batch_size: Optional[int] = None, repetitions: int = 3, ramp_up: float = 1.0,
+                             telemetry_interval: float = 1.0, ground_truth_cache: Optional[GroundTruthCache] = None) -> List[Dict[str, Any]]:
+    """
+    Measure search latency and precision while the collection is being written to.
+
+    For every write rate and write batch size, `DataIngestion` re-ingests the
+    data file in the background at that rate while the query set is searched.
+    A write rate of 0 measures the idle collection as baseline. Ground truth
+    is computed once on the idle collection; re-ingesting the same records
+    keeps it valid, ingesting new records lets precision drift with the data.
+    Telemetry samples taken during the search report how often the optimizer
+    was active and how many segments the writes created.
+
+    Args:
+        client (QdrantClient): Qdrant client used for the searches
+        collection_name (str): Name of the collection to evaluate
+        embeddings (Dict): Dictionary of embeddings or QuerySet to evaluate
+        file_path (str): JSON file with one record per line, e.g. arXiv updates
+        write_rates (Optional[List[Optional[float]]]): Target points per second (default: [0, 100, 1000]),
+            None for an unpaced writer
+        write_batch_sizes (Optional[List[int]]): Points per upsert request (default: [256])
+        host (str): Qdrant server host of the writer
+        port (int): Qdrant server port of the writer
+        k (int): Number of results to return per query
+        hnsw_ef (Optional[int]): HNSW ef of the searches
+        batch_size (Optional[int]): Send queries in batches of this size instead of one by one
+        repetitions (int): Number of measured passes over the query set per setting
+        ramp_up (float): Seconds the writer runs before measuring starts
+        telemetry_interval (float): Seconds between telemetry samples
+        ground_truth_cache (Optional[GroundTruthCache]): Cache for ground truth results
+
+    Returns:
+        List[Dict[str, Any]]: Results per write setting with target and achieved write throughput,
+        quality metrics, latency distribution and telemetry summary
+    """
+    write_rates = [0, 100, 1000] if write_rates is None else write_rates
+    write_batch_sizes = write_batch_sizes or [256]
+    vectors = query_vectors(embeddings)
+    search_params = models.SearchParams(hnsw_ef=hnsw_ef) if hnsw_ef else None
+
+    ground_truth, _ = get_ground_truth(
+        client, collection_name, vectors,
+        k=k,
+        batch_size=batch_size,
+        ground_truth_cache=ground_truth_cache
+    )
+
+    settings = [(rate, write_batch_size) for rate in write_rates for write_batch_size in write_batch_sizes]
+    # The idle baseline does not depend on the write batch size
+    settings = list(dict.fromkeys((rate, None if rate == 0 else size) for rate, size in settings))
+
+    results_list = []
+    for rate, write_batch_size in settings:
+        writer = None
+        if rate != 0:
+            ingestion = DataIngestion(host=host, port=port, prefer_grpc=False, batch_size=write_batch_size)
+            writer = BackgroundIngestion(ingestion, file_path, collection_name, max_points_per_second=rate)
+
+        print(f"Evaluating {collection_name} at write rate {rate if rate is not None else 'unlimited'} "
+              f"with write batch size {write_batch_size}...")
+        sampler = TelemetrySampler(client, collection_name, interval=telemetry_interval)
+        with writer or contextlib.nullcontext():
+            if writer is not None:
+                time.sleep(ramp_up)
+            with sampler:
+                ids, histogram, server_histogram = _measure_search(
+                    client, collection_name, vectors,
+                    search_params=search_params,
+                    k=k,
+                    batch_size=batch_size,
+                    repetitions=repetitions
+                )
+
+        if writer is not None and writer.error is not None:
+            print(f"❌ Error: Background ingestion failed: {str(writer.error)}")
+
+        results = _search_results(ids, ground_truth, histogram, server_histogram, batch_size, k)
+        results.pop("latency_histogram")
+        telemetry = sampler.summary()
+        telemetry.pop("telemetry_samples")
+        results_list.append({
+            "write_rate": rate,
+            "write_batch_size": write_batch_size,
+            "write_points": writer.points_written if writer else 0,
+            "write_throughput_per_s": writer.throughput if writer else 0.0,
+            **results,
+            **telemetry
+        })
+
+    return results_list
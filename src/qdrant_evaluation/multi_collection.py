@@ -0,0 +1,77 @@
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor
+from typing import List, Dict, Any, Callable
+
+import pandas as pd
+
+from qdrant_evaluation.client import get_client
+from qdrant_evaluation.evaluator import evaluate_ann, results_to_dataframe
+
+ISOLATION_MODES = ("serial", "parallel")
+EXECUTORS = ("thread", "process")
+
+
+def _evaluate_collection(host: str, port: int, evaluator: Callable, collection_name: str, embeddings: Dict,
+                         evaluator_kwargs: Dict[str, Any]) -> List[Dict[str, Any]]:
+    # Every worker uses its own client, clients are not shared between threads or processes
+    client = get_client(host=host, port=port)
+    try:
+        results = evaluator(client, collection_name, embeddings, **evaluator_kwargs)
+    finally:
+        client.close()
+
+    rows = results if isinstance(results, list) else [results]
+    return [{"collection": collection_name, **row} for row in rows]
+
+
+def evaluate_collections(collection_names: List[str], embeddings: Dict, evaluator: Callable = evaluate_ann,
+                         host: str = "localhost", port: int = 6333, isolation: str = "serial", max_workers: int = 4,
+                         executor: str = "thread", **evaluator_kwargs) -> pd.DataFrame:
+    """
+    Evaluate several collections with the same evaluator and merge the results.
+
+    With `isolation="serial"` the collections are evaluated one after another,
+    so the measured latencies are not distorted by concurrent searches. With
+    `isolation="parallel"` up to `max_workers` collections are evaluated at the
+    same time on a thread or process pool, which finishes large grids faster
+    but reports latencies under load. A collection that fails is reported and
+    left out of the results.
+
+    Args:
+        collection_names (List[str]): Names of the collections to evaluate
+        embeddings (Dict): Dictionary of embeddings or QuerySet to evaluate
+        evaluator (Callable): Evaluation function taking (client, collection_name, embeddings),
+            e.g. `evaluate_ann` or `evaluate_hnsw_ef`
+        host (str): Qdrant server host
+        port (int): Qdrant server port
+        isolation (str): 'serial' for clean latencies or 'parallel' for throughput
+        max_workers (int): Maximum number of collections evaluated at the same time in parallel mode
+        executor (str): 'thread' or 'process' pool for parallel mode; processes avoid contention
+            on the GIL but require a picklable evaluator, e.g. a module-level function
+        **evaluator_kwargs: Further arguments passed to the evaluator, e.g. hnsw_ef_values or batch_size
+
+    Returns:
+        pd.DataFrame: Results of all collections with a 'collection' column
+    """
+    if isolation not in ISOLATION_MODES:
+        raise ValueError(f"Unknown isolation mode: {isolation}, expected one of {ISOLATION_MODES}")
+    if executor not in EXECUTORS:
+        raise ValueError(f"Unknown executor: {executor}, expected one of {EXECUTORS}")
+
+    workers = 1 if isolation == "serial" else max(1, min(max_workers, len(collection_names)))
+    pool_class = ProcessPoolExecutor if executor == "process" and workers > 1 else ThreadPoolExecutor
+    print(f"Evaluating {len(collection_names)} collections with {workers} worker(s)...")
+
+    results_list: List[Dict[str, Any]] = []
+    with pool_class(max_workers=workers) as pool:
+        futures = [
+            (collection_name, pool.submit(_evaluate_collection, host, port, evaluator, collection_name, embeddings, evaluator_kwargs))
+            for collection_name in collection_names
+        ]
+        # Collect in submission order, so rows follow the order of collection_names
+        for collection_name, future in futures:
+            try:
+                results_list.extend(future.result())
+            except Exception as e:
+                print(f"❌ Error: Evaluation of {collection_name} failed: {str(e)}")
+
+    return results_to_dataframe(results_list)
@@ -0,0 +1,220 @@
+import contextlib
+import json
+import os
+import uuid
+import weakref
+from typing import Any, List, Dict, Optional, Iterable, Iterator, Union
+
+from qdrant_client import QdrantClient
+
+from qdrant_evaluation.ground_truth import collection_fingerprint
+
+# Payload requested by the search helpers when no lookup table is registered
+ID_PAYLOAD = ["id"]
+
+# Lookup tables per client and collection name; entries go away with their client
+_lookups: "weakref.WeakKeyDictionary[Any, Dict[str, PointIdLookup]]" = weakref.WeakKeyDictionary()
+
+
+def arxiv_point_id(arxiv_id: str) -> str:
+    """
+    Get the point ID `DataIngestion.create_point` assigns to an arXiv paper.
+
+    Args:
+        arxiv_id (str): arXiv identifier, e.g. '0704.0001'
+
+    Returns:
+        str: uuid5 of the arXiv identifier in the DNS namespace
+    """
+    return str(uuid.uuid5(uuid.NAMESPACE_DNS, arxiv_id))
+
+
+class PointIdLookup:
+    """
+    Table mapping point IDs to the 'id' payload field of a collection.
+
+    Searches with a registered lookup request neither payload nor vectors,
+    which keeps responses small, and translate the returned point IDs back
+    to arXiv IDs locally. The table is built once by scrolling the 'id'
+    field and cached on disk per collection fingerprint.
+
+    Args:
+        mapping (Dict[str, str]): Point ID (as string) to payload 'id'
+    """
+
+    def __init__(self, mapping: Dict[str, str]):
+        self.mapping = mapping
+
+    @classmethod
+    def from_arxiv_ids(cls, arxiv_ids: Iterable[str]) -> "PointIdLookup":
+        """
+        Build the lookup table from known arXiv IDs without querying the server.
+
+        Only valid for collections ingested with `DataIngestion`, whose point
+        IDs are derived from the arXiv ID with `arxiv_point_id`.
+
+        Args:
+            arxiv_ids (Iterable[str]): arXiv IDs of the collection
+
+        Returns:
+            PointIdLookup: Lookup table for the given papers
+        """
+        return cls({arxiv_point_id(arxiv_id): arxiv_id for arxiv_id in arxiv_ids})
+
+    @classmethod
+    def build(cls, client: QdrantClient, collection_name: str, batch_size: int = 1000) -> "PointIdLookup":
+        """
+        Build the lookup table by scrolling the 'id' payload field of a collection.
+
+        Args:
+            client (QdrantClient): Qdrant client
+            collection_name (str): Name of the collection
+            batch_size (int): Number of points fetched per scroll request
+
+        Returns:
+            PointIdLookup: Lookup table of the collection
+        """
+        mapping = {}
+        offset = None
+        while True:
+            points, offset = client.scroll(
+                collection_name=collection_name,
+                limit=batch_size,
+                offset=offset,
+                with_payload=ID_PAYLOAD,
+                with_vectors=False
+            )
+            for point in points:
+                mapping[str(point.id)] = (point.payload or {}).get("id", point.id)
+            if not points or offset is None:
+                break
+        return cls(mapping)
+
+    @classmethod
+    def for_collection(cls, client: QdrantClient, collection_name: str, cache_dir: str = ".id_lookup_cache") -> "PointIdLookup":
+        """
+        Load the lookup table of a collection from disk or build and cache it.
+
+        Args:
+            client (QdrantClient): Qdrant client
+            collection_name (str): Name of the collection
+            cache_dir (str): Directory of the cached lookup tables
+
+        Returns:
+            PointIdLookup: Lookup table of the collection
+        """
+        os.makedirs(cache_dir, exist_ok=True)
+        fingerprint = collection_fingerprint(client, collection_name)
+        safe_name = "".join(c if c.isalnum() or c in "-_" else "_" for c in collection_name)
+        path = os.path.join(cache_dir, f"{safe_name}__{fingerprint}.json")
+
+        if os.path.exists(path):
+            with open(path, 'r', encoding='utf-8') as file:
+                return cls(json.load(file))
+
+        print(f"Building point ID lookup for {collection_name}...")
+        lookup = cls.build(client, collection_name)
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, 'w', encoding='utf-8') as file:
+            json.dump(lookup.mapping, file)
+        os.replace(tmp_path, path)
+        return lookup
+
+    def resolve(self, point_ids: Iterable[Union[str, int]]) -> List:
+        """
+        Translate point IDs to payload IDs; unknown points keep their point ID.
+
+        Args:
+            point_ids (Iterable[Union[str, int]]): Point IDs of search results
+
+        Returns:
+            List: Payload IDs in the same order
+        """
+        return [self.mapping.get(str(point_id), point_id) for point_id in point_ids]
+
+
+def _collection_names(collection_names: Union[str, List[str]]) -> List[str]:
+    return [collection_names] if isinstance(collection_names, str) else list(collection_names)
+
+
+def register_id_lookup(client: Any, collection_names: Union[str, List[str]], lookup: Optional[PointIdLookup]) -> None:
+    """
+    Use a lookup table instead of the 'id' payload for searches of a client on the given collections.
+
+    Registrations are per client, so collections with the same name on
+    another server, or searched through another client, are not affected.
+    Collections copied from one another, like the variants of a sweep, share
+    point IDs and can share one table. Pass None to go back to fetching the
+    'id' payload field. See `id_lookup` for a registration limited to a block.
+
+    Args:
+        client (Any): Qdrant client, synchronous or asynchronous
+        collection_names (Union[str, List[str]]): Collection name or names
+        lookup (Optional[PointIdLookup]): Lookup table, None to unregister
+    """
+    lookups = _lookups.setdefault(client, {})
+    for collection_name in _collection_names(collection_names):
+        if lookup is None:
+            lookups.pop(collection_name, None)
+        else:
+            lookups[collection_name] = lookup
+
+
+@contextlib.contextmanager
+def id_lookup(client: Any, collection_names: Union[str, List[str]], lookup: Optional[PointIdLookup]) -> Iterator[None]:
+    """
+    Register a lookup table for the duration of a block, then restore the previous registrations.
+
+    Args:
+        client (Any): Qdrant client, synchronous or asynchronous
+        collection_names (Union[str, List[str]]): Collection name or names
+        lookup (Optional[PointIdLookup]): Lookup table, None to search with the 'id' payload inside the block
+    """
+    names = _collection_names(collection_names)
+    previous = {name: _lookups.get(client, {}).get(name) for name in names}
+    register_id_lookup(client, names, lookup)
+    try:
+        yield
+    finally:
+        for name, previous_lookup in previous.items():
+            register_id_lookup(client, name, previous_lookup)
+
+
+def _lookup(client: Any, collection_name: str) -> Optional[PointIdLookup]:
+    try:
+        return _lookups.get(client, {}).get(collection_name)
+    except TypeError:
+        # Clients that cannot be weakly referenced never have a lookup
+        return None
+
+
+def search_payload(client: Any, collection_name: str) -> Union[bool, List[str]]:
+    """
+    Get the payload selector for searches of a client on a collection.
+
+    Args:
+        client (Any): Qdrant client the search is sent with
+        collection_name (str): Name of the collection
+
+    Returns:
+        Union[bool, List[str]]: False if a lookup table is registered, otherwise only the 'id' field
+    """
+    return False if _lookup(client, collection_name) is not None else ID_PAYLOAD
+
+
+def result_ids(client: Any, collection_name: str, points: Iterable) -> List:
+    """
+    Get the arXiv IDs of search results requested with `search_payload`.
+
+    Args:
+        client (Any): Qdrant client the search was sent with
+        collection_name (str): Name of the searched collection
+        points (Iterable): Scored points of a search response
+
+    Returns:
+        List: IDs of the results in rank order
+    """
+    lookup = _lookup(client, collection_name)
+    if lookup is not None:
+        return lookup.resolve(point.id for point in points)
+    return [point.payload['id'] for point in points]
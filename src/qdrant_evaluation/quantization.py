@@ -0,0 +1,205 @@
+from typing import List, Dict, Any, Optional
+
+from qdrant_client import QdrantClient, models
+
+from qdrant_evaluation.client import build_quantization_config
+from qdrant_evaluation.collection import wait_for_collection_green, _vector_params
+from qdrant_evaluation.evaluator import get_ground_truth, _measure_search, _search_results
+from qdrant_evaluation.ground_truth import GroundTruthCache
+from qdrant_evaluation.brute_force import LocalExactSearch
+from qdrant_evaluation.query_set import query_vectors
+
+# Bytes per dimension of the quantized vectors, product quantization is derived from its compression ratio
+QUANTIZED_BYTES_PER_DIMENSION = {"scalar": 1.0, "binary": 1 / 8}
+
+DEFAULT_QUANTIZATION_SETTINGS = [
+    {"type": "scalar", "always_ram": True},
+    {"type": "product", "compression": "x16", "always_ram": True},
+    {"type": "binary", "always_ram": True},
+]
+
+
+def quantization_label(quantization: Optional[Dict[str, Any]]) -> str:
+    """
+    Get a short label for a quantization setting, used in collection names and results.
+
+    Args:
+        quantization (Optional[Dict[str, Any]]): Quantization settings
+
+    Returns:
+        str: Label such as 'none', 'scalar', 'product_x16' or 'binary_ram'
+    """
+    if not quantization:
+        return "none"
+
+    label = quantization["type"].lower()
+    if label == "product":
+        label += f"_{quantization.get('compression', 'x16')}"
+    if quantization.get("always_ram"):
+        label += "_ram"
+    return label
+
+
+def quantized_vector_bytes(points_count: int, dimension: int, quantization: Optional[Dict[str, Any]]) -> float:
+    """
+    Calculate the storage size of the quantized vectors of a collection.
+
+    Args:
+        points_count (int): Number of points
+        dimension (int): Vector dimension
+        quantization (Optional[Dict[str, Any]]): Quantization settings
+
+    Returns:
+        float: Size of the quantized vectors in bytes (0 without quantization)
+    """
+    if not quantization:
+        return 0.0
+
+    quantization_type = quantization["type"].lower()
+    if quantization_type == "product":
+        ratio = int(str(quantization.get("compression", "x16")).lstrip("x"))
+        return points_count * dimension * 4 / ratio
+    return points_count * dimension * QUANTIZED_BYTES_PER_DIMENSION[quantization_type]
+
+
+def apply_quantization(client: QdrantClient, collection_name: str, quantization: Optional[Dict[str, Any]], timeout: int = 3600) -> None:
+    """
+    Apply a quantization configuration to a collection and wait until it is rebuilt.
+
+    Args:
+        client (QdrantClient): Qdrant client
+        collection_name (str): Name of the collection to update
+        quantization (Optional[Dict[str, Any]]): Quantization settings, None to disable quantization
+        timeout (int): Maximum time in seconds to wait for the collection to become green
+    """
+    print(f"Applying quantization {quantization_label(quantization)} to {collection_name}...")
+    client.update_collection(
+        collection_name=collection_name,
+        quantization_config=build_quantization_config(quantization) or models.Disabled.DISABLED
+    )
+    wait_for_collection_green(client, collection_name, timeout=timeout)
+
+
+def evaluate_quantization_configs(client: QdrantClient, collection_name: str, embeddings: Dict,
+                                  quantization_settings: Optional[List[Dict[str, Any]]] = None,
+                                  oversampling_values: Optional[List[float]] = None,
+                                  rescore_values: Optional[List[bool]] = None, k: int = 10,
+                                  batch_size: Optional[int] = None, warmup: int = 0, repetitions: int = 1,
+                                  ground_truth_cache: Optional[GroundTruthCache] = None,
+                                  ground_truth_source: Optional[LocalExactSearch] = None,
+                                  using: Optional[str] = None, timeout: int = 3600) -> List[Dict[str, Any]]:
+    """
+    Evaluate scalar, product and binary quantization with an oversampling and rescore grid.
+
+    The collection is first measured without quantization as baseline. Then
+    every quantization configuration is applied in turn and searched with
+    every combination of oversampling and rescore. The original quantization
+    configuration of the collection is restored at the end.
+
+    Precision is measured against exact search, which does not depend on the
+    quantization configuration, so ground truth is computed once.
+
+    The RAM columns are estimates from the vector dimension, not measurements:
+    they assume the original vectors stay on disk and only the quantized
+    vectors are held in RAM, which the collection has to be configured for.
+
+    Args:
+        client (QdrantClient): Qdrant client
+        collection_name (str): Name of the collection to evaluate
+        embeddings (Dict): Dictionary of embeddings or QuerySet to evaluate
+        quantization_settings (Optional[List[Dict[str, Any]]]): Quantization settings, e.g.
+            [{"type": "scalar", "always_ram": True}] (default: scalar int8, product x16 and binary)
+        oversampling_values (Optional[List[float]]): Oversampling factors (default: [1.0, 2.0, 4.0])
+        rescore_values (Optional[List[bool]]): Rescore options (default: [False, True])
+        k (int): Number of results considered for precision
+        batch_size (Optional[int]): Send queries in batches of this size instead of one by one
+        warmup (int): Number of discarded passes over the query set before measuring
+        repetitions (int): Number of measured passes over the query set
+        ground_truth_cache (Optional[GroundTruthCache]): Cache for exact search results
+        ground_truth_source (Optional[LocalExactSearch]): Client-side exact search engine used for ground truth
+        using (Optional[str]): Named vector to search, None for the default vector
+        timeout (int): Maximum time in seconds to wait for quantization to be applied
+
+    Returns:
+        List[Dict[str, Any]]: Baseline row followed by one row per quantization setting,
+        oversampling and rescore with precision, latency, speedup and estimated RAM
+        ('est_vector_ram_mb', 'est_ram_reduction_factor')
+    """
+    if quantization_settings is None:
+        quantization_settings = DEFAULT_QUANTIZATION_SETTINGS
+    if oversampling_values is None:
+        oversampling_values = [1.0, 2.0, 4.0]
+    if rescore_values is None:
+        rescore_values = [False, True]
+
+    info = client.get_collection(collection_name)
+    original_quantization = info.config.quantization_config
+    points_count = info.points_count
+    dimension = _vector_params(info, using).size
+    vector_mb = points_count * dimension * 4 / 2 ** 20
+
+    vectors = query_vectors(embeddings)
+    knn_ids, _ = get_ground_truth(
+        client, collection_name, vectors,
+        k=k,
+        batch_size=batch_size,
+        ground_truth_cache=ground_truth_cache,
+        ground_truth_source=ground_truth_source,
+        using=using
+    )
+
+    def measure(search_params: Optional[models.SearchParams]) -> Dict[str, Any]:
+        result_ids, histogram, server_histogram = _measure_search(
+            client, collection_name, vectors,
+            search_params=search_params,
+            k=k,
+            batch_size=batch_size,
+            warmup=warmup,
+            repetitions=repetitions,
+            using=using
+        )
+        return _search_results(result_ids, knn_ids, histogram, server_histogram, batch_size, k)
+
+    results_list = []
+    try:
+        apply_quantization(client, collection_name, None, timeout=timeout)
+        baseline = measure(None)
+        results_list.append({
+            "quantization": "none",
+            "oversampling": None,
+            "rescore": None,
+            **baseline,
+            "speedup_factor": 1.0,
+            "est_vector_ram_mb": vector_mb,
+            "est_ram_reduction_factor": 1.0
+        })
+
+        for quantization in quantization_settings:
+            apply_quantization(client, collection_name, quantization, timeout=timeout)
+            quantized_mb = quantized_vector_bytes(points_count, dimension, quantization) / 2 ** 20
+
+            for oversampling in oversampling_values:
+                for rescore in rescore_values:
+                    print(f"Evaluating {quantization_label(quantization)} with oversampling={oversampling}, rescore={rescore}...")
+                    results = measure(models.SearchParams(
+                        quantization=models.QuantizationSearchParams(rescore=rescore, oversampling=oversampling)
+                    ))
+                    results_list.append({
+                        "quantization": quantization_label(quantization),
+                        "oversampling": oversampling,
+                        "rescore": rescore,
+                        **results,
+                        "speedup_factor": baseline["avg_query_time_ms"] / results["avg_query_time_ms"],
+                        # Original vectors can stay on disk, only the quantized vectors need RAM
+                        "est_vector_ram_mb": quantized_mb,
+                        "est_ram_reduction_factor": vector_mb / quantized_mb
+                    })
+    finally:
+        print(f"Restoring original quantization of {collection_name}...")
+        client.update_collection(
+            collection_name=collection_name,
+            quantization_config=original_quantization or models.Disabled.DISABLED
+        )
+        wait_for_collection_green(client, collection_name, timeout=timeout)
+
+    return results_list
@@ -0,0 +1,179 @@
+import json
+import os
+from collections.abc import Mapping
+from typing import List, Dict, Tuple, Optional, Any, Iterator, Union
+
+import numpy as np
+
+
+class QuerySet(Mapping):
+    """
+    Query set backed by a memory-mapped float32 matrix.
+
+    A query set on disk consists of `<path>.npy` with one embedding per row and
+    `<path>.queries.json` with the query texts and, optionally, ground truth IDs
+    computed for a collection. The matrix is memory-mapped, so loading takes
+    milliseconds regardless of its size and slices are views into the file.
+
+    A query set behaves like the dictionary of query text to embedding that
+    `load_test_dataset` returns for JSON files, so every evaluator accepts it.
+    With stored ground truth it can also be passed as `ground_truth_source`.
+
+    Args:
+        vectors (np.ndarray): Query embeddings of shape (n_queries, dimension)
+        texts (List[str]): Query text of every row
+        ground_truth (Optional[Dict[str, Any]]): Stored ground truth with 'collection', 'k' and 'ids'
+    """
+
+    def __init__(self, vectors: np.ndarray, texts: List[str], ground_truth: Optional[Dict[str, Any]] = None):
+        if len(vectors) != len(texts):
+            raise ValueError(f"Got {len(texts)} query texts for {len(vectors)} vectors")
+
+        self.vectors = vectors
+        self.texts = texts
+        self.ground_truth = ground_truth
+        self._rows: Optional[Dict[str, int]] = None
+
+    @classmethod
+    def load(cls, path: str, mmap: bool = True) -> "QuerySet":
+        """
+        Load a query set written by `save_query_set`.
+
+        Args:
+            path (str): Path of the query set without extension
+            mmap (bool): Memory-map the vectors instead of reading them into RAM
+
+        Returns:
+            QuerySet: The loaded query set
+        """
+        vectors = np.load(f"{path}.npy", mmap_mode="r" if mmap else None)
+        with open(f"{path}.queries.json", 'r', encoding='utf-8') as file:
+            sidecar = json.load(file)
+        return cls(vectors, sidecar["texts"], sidecar.get("ground_truth"))
+
+    def __getitem__(self, text: str) -> np.ndarray:
+        if self._rows is None:
+            self._rows = {query: row for row, query in enumerate(self.texts)}
+        return self.vectors[self._rows[text]]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.texts)
+
+    def __len__(self) -> int:
+        return len(self.texts)
+
+    def search_ids(self, embeddings: Union[np.ndarray, List[List]], k: int = 10) -> Tuple[List[List], List[float]]:
+        """
+        Return the stored ground truth, so the query set can serve as ground truth source.
+
+        Args:
+            embeddings (Union[np.ndarray, List[List]]): Query vectors, must be the vectors of this query set
+            k (int): Number of results per query
+
+        Returns:
+            Tuple[List[List], List[float]]: Stored result IDs and zero query times
+        """
+        if not self.ground_truth:
+            raise ValueError("Query set has no stored ground truth")
+        if k > self.ground_truth["k"]:
+            raise ValueError(f"Stored ground truth has k={self.ground_truth['k']}, requested k={k}")
+        if len(embeddings) != len(self):
+            raise ValueError(f"Got {len(embeddings)} queries for a query set of {len(self)}")
+
+        return [ids[:k] for ids in self.ground_truth["ids"]], [0.0] * len(self)
+
+
+def query_vectors(embeddings: Union[QuerySet, Dict]) -> Union[np.ndarray, List[List]]:
+    """
+    Get the query vectors of a query set or an embeddings dictionary.
+
+    Args:
+        embeddings (Union[QuerySet, Dict]): Query set or dictionary of query text to embedding
+
+    Returns:
+        Union[np.ndarray, List[List]]: The memory-mapped matrix of a query set, or the list
+        of embeddings of a dictionary
+    """
+    if isinstance(embeddings, QuerySet):
+        return embeddings.vectors
+    return list(embeddings.values())
+
+
+def save_query_set(path: str, embeddings: Dict, ground_truth_ids: Optional[List[List]] = None,
+                   collection_name: Optional[str] = None) -> QuerySet:
+    """
+    Write a query set to `<path>.npy` and `<path>.queries.json`.
+
+    Vectors are written row by row into the memory map, so the embeddings are
+    never held twice in memory.
+
+    Args:
+        path (str): Output path without extension
+        embeddings (Dict): Dictionary of query text to embedding
+        ground_truth_ids (Optional[List[List]]): Ground truth IDs per query to store with the query set
+        collection_name (Optional[str]): Collection the ground truth was computed on
+
+    Returns:
+        QuerySet: The written query set, memory-mapped from disk
+    """
+    texts = list(embeddings.keys())
+    dimension = len(next(iter(embeddings.values()))) if texts else 0
+
+    matrix = np.lib.format.open_memmap(f"{path}.npy", mode="w+", dtype=np.float32, shape=(len(texts), dimension))
+    for row, text in enumerate(texts):
+        matrix[row] = embeddings[text]
+    matrix.flush()
+    del matrix
+
+    _write_sidecar(path, texts, ground_truth_ids, collection_name)
+    return QuerySet.load(path)
+
+
+def store_ground_truth(path: str, ground_truth_ids: List[List], collection_name: str) -> None:
+    """
+    Store ground truth IDs in the sidecar of an existing query set.
+
+    Args:
+        path (str): Path of the query set without extension
+        ground_truth_ids (List[List]): Ground truth IDs per query, e.g. from `get_ground_truth`
+        collection_name (str): Collection the ground truth was computed on
+    """
+    with open(f"{path}.queries.json", 'r', encoding='utf-8') as file:
+        texts = json.load(file)["texts"]
+    _write_sidecar(path, texts, ground_truth_ids, collection_name)
+
+
+def convert_json_query_set(json_path: str, path: str) -> QuerySet:
+    """
+    Convert a JSON file of query text to embedding into the binary query set format.
+
+    Args:
+        json_path (str): Path of the JSON file, e.g. 'queries_embeddings.json'
+        path (str): Output path without extension
+
+    Returns:
+        QuerySet: The converted query set
+    """
+    with open(json_path, 'r', encoding='utf-8') as file:
+        embeddings = json.load(file)
+
+    query_set = save_query_set(path, embeddings)
+    print(f"Converted {len(query_set)} queries from {json_path} to {path}.npy")
+    return query_set
+
+
+def _write_sidecar(path: str, texts: List[str], ground_truth_ids: Optional[List[List]], collection_name: Optional[str]) -> None:
+    sidecar: Dict[str, Any] = {"texts": texts}
+    if ground_truth_ids is not None:
+        if len(ground_truth_ids) != len(texts):
+            raise ValueError(f"Got {len(ground_truth_ids)} ground truth rows for {len(texts)} queries")
+        sidecar["ground_truth"] = {
+            "collection": collection_name,
+            "k": min((len(ids) for ids in ground_truth_ids), default=0),
+            "ids": ground_truth_ids
+        }
+
+    tmp_path = f"{path}.queries.json.tmp"
+    with open(tmp_path, 'w', encoding='utf-8') as file:
+        json.dump(sidecar, file)
+    os.replace(tmp_path, f"{path}.queries.json")
@@ -0,0 +1,286 @@
+import hashlib
+import os
+import random
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Dict, Optional, Any
+
+import numpy as np
+import openai
+from qdrant_client import QdrantClient, models
+
+from qdrant_evaluation.collection import wait_for_collection_green
+from qdrant_evaluation.embedding import EMBEDDING_MODEL, get_openai_client
+from qdrant_evaluation.query_set import QuerySet, save_query_set
+
+# Errors worth retrying: rate limits, timeouts, dropped connections and server errors
+RETRYABLE_ERRORS = (openai.RateLimitError, openai.APIConnectionError, openai.InternalServerError)
+
+
+class EmbeddingCache:
+    """
+    Content-addressed disk cache of embeddings.
+
+    Every embedding is stored as `<cache_dir>/<model>/<key[:2]>/<key>.npy`, where
+    the key is the SHA-256 of model and text. Entries never go stale, so the
+    cache can be shared between query sets and copied between machines.
+
+    Args:
+        cache_dir (str): Directory of the cache
+    """
+
+    def __init__(self, cache_dir: str = ".embedding_cache"):
+        self.cache_dir = cache_dir
+
+    @staticmethod
+    def key(model: str, text: str) -> str:
+        """
+        Get the cache key of a text embedded with a model.
+
+        Args:
+            model (str): Embedding model
+            text (str): Embedded text
+
+        Returns:
+            str: Hex SHA-256 of model and text
+        """
+        return hashlib.sha256(f"{model}\n{text}".encode("utf-8")).hexdigest()
+
+    def _path(self, model: str, text: str) -> str:
+        key = self.key(model, text)
+        return os.path.join(self.cache_dir, model.replace("/", "_"), key[:2], f"{key}.npy")
+
+    def get(self, model: str, text: str) -> Optional[np.ndarray]:
+        """
+        Get a cached embedding.
+
+        Args:
+            model (str): Embedding model
+            text (str): Embedded text
+
+        Returns:
+            Optional[np.ndarray]: The float32 embedding or None if it is not cached
+        """
+        try:
+            return np.load(self._path(model, text))
+        except (FileNotFoundError, ValueError):
+            return None
+
+    def put(self, model: str, text: str, embedding: List[float]) -> None:
+        """
+        Store an embedding, written atomically so concurrent builders never read partial files.
+
+        Args:
+            model (str): Embedding model
+            text (str): Embedded text
+            embedding (List[float]): The embedding
+        """
+        path = self._path(model, text)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        with open(tmp_path, 'wb') as file:
+            np.save(file, np.asarray(embedding, dtype=np.float32))
+        os.replace(tmp_path, path)
+
+
+def _retry_after(error: Exception) -> Optional[float]:
+    response = getattr(error, "response", None)
+    if response is None:
+        return None
+    try:
+        return float(response.headers.get("retry-after"))
+    except (TypeError, ValueError):
+        return None
+
+
+def _embed_batch(client, texts: List[str], model: str, max_retries: int, backoff: float) -> List[List[float]]:
+    for attempt in range(max_retries + 1):
+        try:
+            response = client.embeddings.create(input=texts, model=model)
+            # The API may return the embeddings of a batch in any order
+            return [item.embedding for item in sorted(response.data, key=lambda item: item.index)]
+        except RETRYABLE_ERRORS as e:
+            if attempt == max_retries:
+                raise
+            delay = _retry_after(e) or backoff * 2 ** attempt * (1 + random.random())
+            print(f"Embedding request failed ({type(e).__name__}), retrying in {delay:.1f}s...")
+            time.sleep(delay)
+
+
+def embed_texts(texts: List[str], model: str = EMBEDDING_MODEL, batch_size: int = 256, max_concurrency: int = 4,
+                max_retries: int = 5, backoff: float = 1.0, cache: Optional[EmbeddingCache] = None,
+                client=None) -> np.ndarray:
+    """
+    Embed many texts with batched, concurrent requests.
+
+    Cached texts are not sent again; duplicate texts are embedded once. Up to
+    `max_concurrency` batch requests run at the same time. Rate limits,
+    timeouts and server errors are retried with exponential backoff, honouring
+    the server's Retry-After header.
+
+    Args:
+        texts (List[str]): Texts to embed
+        model (str): Embedding model
+        batch_size (int): Number of texts per request
+        max_concurrency (int): Maximum number of requests in flight
+        max_retries (int): Retries per request before giving up
+        backoff (float): Base delay in seconds of the exponential backoff
+        cache (Optional[EmbeddingCache]): Cache embeddings are read from and written to
+        client: OpenAI client (default: the shared client from `get_openai_client`)
+
+    Returns:
+        np.ndarray: float32 embeddings of shape (len(texts), dimension) in input order
+    """
+    texts = [text.replace("\n", " ") for text in texts]
+    if client is None:
+        # Retries are handled here, with backoff shared across the batches
+        client = get_openai_client(max_retries=0)
+        if client is None:
+            raise ValueError("OpenAI API key is missing or invalid")
+
+    embeddings: Dict[str, Any] = {}
+    if cache is not None:
+        for text in set(texts):
+            cached = cache.get(model, text)
+            if cached is not None:
+                embeddings[text] = cached
+
+    missing = list(dict.fromkeys(text for text in texts if text not in embeddings))
+    batches = [missing[start:start + batch_size] for start in range(0, len(missing), batch_size)]
+    print(f"Embedding {len(missing)} texts in {len(batches)} batches ({len(embeddings)} cached)...")
+
+    with ThreadPoolExecutor(max_workers=max(1, max_concurrency)) as pool:
+        futures = [pool.submit(_embed_batch, client, batch, model, max_retries, backoff) for batch in batches]
+        for batch, future in zip(batches, futures):
+            for text, embedding in zip(batch, future.result()):
+                embeddings[text] = embedding
+                if cache is not None:
+                    cache.put(model, text, embedding)
+
+    if not texts:
+        return np.empty((0, 0), dtype=np.float32)
+    return np.asarray([embeddings[text] for text in texts], dtype=np.float32)
+
+
+def build_query_set(path: str, texts: List[str], model: str = EMBEDDING_MODEL, cache_dir: Optional[str] = ".embedding_cache",
+                    **embed_kwargs) -> QuerySet:
+    """
+    Embed query texts and write them as a query set.
+
+    Args:
+        path (str): Output path without extension, see `save_query_set`
+        texts (List[str]): Query texts, duplicates are dropped
+        model (str): Embedding model
+        cache_dir (Optional[str]): Directory of the embedding cache, None to disable it
+        **embed_kwargs: Further arguments for `embed_texts`, e.g. batch_size or max_concurrency
+
+    Returns:
+        QuerySet: The written query set
+    """
+    texts = list(dict.fromkeys(text.replace("\n", " ") for text in texts))
+    cache = EmbeddingCache(cache_dir) if cache_dir else None
+    vectors = embed_texts(texts, model=model, cache=cache, **embed_kwargs)
+
+    query_set = save_query_set(path, dict(zip(texts, vectors)))
+    print(f"Wrote {len(query_set)} queries to {path}.npy")
+    return query_set
+
+
+def sample_query_set(client: QdrantClient, collection_name: str, path: str, n_queries: int = 100,
+                     vector_name: Optional[str] = None, hold_out_collection: Optional[str] = None,
+                     batch_size: int = 256, timeout: int = 3600) -> QuerySet:
+    """
+    Build a query set from vectors sampled at random from the collection itself.
+
+    No embedding requests are needed. The query text of every row is the
+    'id' payload of the sampled point. A sampled point is its own nearest
+    neighbour, so every query finds itself at rank 1 in both ground truth and
+    ANN results of the source collection. For true held-out queries, pass
+    `hold_out_collection`: all other points are copied into that new
+    collection, which is then the one to evaluate. The source collection is
+    never modified.
+
+    Args:
+        client (QdrantClient): Qdrant client
+        collection_name (str): Name of the collection to sample from
+        path (str): Output path without extension
+        n_queries (int): Number of points to sample
+        vector_name (Optional[str]): Named vector to sample, None for the default vector
+        hold_out_collection (Optional[str]): New collection receiving every point except the sampled ones
+        batch_size (int): Number of points copied per request
+        timeout (int): Maximum time in seconds to wait for the index of the hold-out collection
+
+    Returns:
+        QuerySet: The written query set
+
+    Raises:
+        ValueError: If the hold-out collection is the source collection or already exists
+    """
+    if hold_out_collection is not None:
+        if hold_out_collection == collection_name or client.collection_exists(hold_out_collection):
+            raise ValueError(f"Hold-out collection {hold_out_collection} must be a new collection")
+
+    points = client.query_points(
+        collection_name=collection_name,
+        query=models.SampleQuery(sample=models.Sample.RANDOM),
+        limit=n_queries,
+        with_payload=["id"],
+        with_vectors=[vector_name] if vector_name else True
+    ).points
+
+    embeddings = {}
+    for point in points:
+        vector = point.vector[vector_name] if vector_name else point.vector
+        embeddings[str((point.payload or {}).get("id", point.id))] = vector
+
+    if hold_out_collection is not None:
+        copy_without_points(client, collection_name, hold_out_collection, [point.id for point in points],
+                            batch_size=batch_size, timeout=timeout)
+
+    query_set = save_query_set(path, embeddings)
+    print(f"Sampled {len(query_set)} queries from {collection_name} to {path}.npy")
+    return query_set
+
+
+def copy_without_points(client: QdrantClient, source_collection: str, target_collection: str, point_ids: List,
+                        batch_size: int = 256, timeout: int = 3600) -> None:
+    """
+    Copy a collection into a new one, leaving out the given points.
+
+    Args:
+        client (QdrantClient): Qdrant client
+        source_collection (str): Name of the collection to copy points from
+        target_collection (str): Name of the collection to create
+        point_ids (List): IDs of the points to leave out
+        batch_size (int): Number of points copied per request
+        timeout (int): Maximum time in seconds to wait for the index to be built
+    """
+    source_info = client.get_collection(source_collection)
+    print(f"Copying {source_collection} to {target_collection} without {len(point_ids)} held-out points...")
+    client.create_collection(
+        collection_name=target_collection,
+        vectors_config=source_info.config.params.vectors,
+        hnsw_config=models.HnswConfigDiff(m=source_info.config.hnsw_config.m,
+                                          ef_construct=source_info.config.hnsw_config.ef_construct)
+    )
+
+    held_out = models.Filter(must_not=[models.HasIdCondition(has_id=point_ids)])
+    offset = None
+    while True:
+        points, offset = client.scroll(
+            collection_name=source_collection,
+            scroll_filter=held_out,
+            limit=batch_size,
+            offset=offset,
+            with_payload=True,
+            with_vectors=True
+        )
+        if points:
+            client.upsert(
+                collection_name=target_collection,
+                points=[models.PointStruct(id=point.id, vector=point.vector, payload=point.payload) for point in points]
+            )
+        if offset is None:
+            break
+
+    wait_for_collection_green(client, target_collection, timeout=timeout)
@@ -0,0 +1,201 @@
+import contextlib
+import json
+import sqlite3
+from typing import List, Dict, Any, Iterator, Optional, Sequence
+
+import pandas as pd
+
+# Metrics compared between runs: higher quality is better, lower latency is better
+QUALITY_METRICS = ("avg_precision", "avg_mrr", "avg_ndcg")
+LATENCY_METRICS = ("avg_query_time_ms", "p50_query_time_ms", "p99_query_time_ms")
+
+
+def setting_key(setting: Dict[str, Any]) -> str:
+    """
+    Get a canonical string for a search setting, used to match results across runs.
+
+    Args:
+        setting (Dict[str, Any]): Search setting, e.g. {"hnsw_ef": 64}
+
+    Returns:
+        str: JSON with sorted keys, e.g. '{"hnsw_ef": 64}'
+    """
+    return json.dumps(setting, sort_keys=True)
+
+
+class ResultsStore:
+    """
+    SQLite store for benchmark runs and their results.
+
+    A run records its name, start time, configuration and environment
+    metadata. Result rows are stored as JSON per collection and search
+    setting, so new metrics can be added without changing the schema.
+
+    Args:
+        path (str): Path of the SQLite database file
+    """
+
+    def __init__(self, path: str = "benchmark_results.sqlite"):
+        self.path = path
+        with self._connect() as connection:
+            connection.execute(
+                "CREATE TABLE IF NOT EXISTS runs ("
+                "run_id TEXT PRIMARY KEY, name TEXT, created_at TEXT, config TEXT, environment TEXT)"
+            )
+            connection.execute(
+                "CREATE TABLE IF NOT EXISTS results ("
+                "run_id TEXT REFERENCES runs(run_id), collection TEXT, setting TEXT, metrics TEXT)"
+            )
+
+    @contextlib.contextmanager
+    def _connect(self) -> Iterator[sqlite3.Connection]:
+        # The connection context only commits or rolls back, closing is separate
+        with contextlib.closing(sqlite3.connect(self.path)) as connection:
+            with connection:
+                yield connection
+
+    def save_run(self, run_id: str, name: str, created_at: str, config: Dict[str, Any], environment: Dict[str, Any],
+                 results: List[Dict[str, Any]]) -> None:
+        """
+        Store a run with all its result rows in one transaction.
+
+        Args:
+            run_id (str): Unique ID of the run
+            name (str): Name of the benchmark configuration
+            created_at (str): Start time of the run in ISO format
+            config (Dict[str, Any]): Benchmark configuration
+            environment (Dict[str, Any]): Environment metadata
+            results (List[Dict[str, Any]]): Result rows with 'collection' and 'setting' keys
+        """
+        with self._connect() as connection:
+            connection.execute(
+                "INSERT INTO runs VALUES (?, ?, ?, ?, ?)",
+                (run_id, name, created_at, json.dumps(config, default=str), json.dumps(environment, default=str))
+            )
+            connection.executemany(
+                "INSERT INTO results VALUES (?, ?, ?, ?)",
+                [
+                    (run_id, row["collection"], setting_key(row["setting"]),
+                     json.dumps({key: value for key, value in row.items() if key not in ("collection", "setting")}, default=str))
+                    for row in results
+                ]
+            )
+
+    def list_runs(self) -> pd.DataFrame:
+        """
+        List all stored runs, most recent first.
+
+        Returns:
+            pd.DataFrame: Run ID, name and start time of every run
+        """
+        with self._connect() as connection:
+            rows = connection.execute("SELECT run_id, name, created_at FROM runs ORDER BY created_at DESC, rowid DESC").fetchall()
+        return pd.DataFrame(rows, columns=["run_id", "name", "created_at"])
+
+    def get_run(self, run_id: str) -> Dict[str, Any]:
+        """
+        Get the metadata of a run.
+
+        Args:
+            run_id (str): ID of the run
+
+        Returns:
+            Dict[str, Any]: Name, start time, configuration and environment of the run
+        """
+        with self._connect() as connection:
+            row = connection.execute(
+                "SELECT run_id, name, created_at, config, environment FROM runs WHERE run_id = ?", (run_id,)
+            ).fetchone()
+        if row is None:
+            raise KeyError(f"Unknown run: {run_id}")
+        return {"run_id": row[0], "name": row[1], "created_at": row[2],
+                "config": json.loads(row[3]), "environment": json.loads(row[4])}
+
+    def load_results(self, run_id: str) -> pd.DataFrame:
+        """
+        Load the result rows of a run.
+
+        Args:
+            run_id (str): ID of the run
+
+        Returns:
+            pd.DataFrame: One row per collection and setting with all stored metrics
+        """
+        with self._connect() as connection:
+            rows = connection.execute(
+                "SELECT collection, setting, metrics FROM results WHERE run_id = ?", (run_id,)
+            ).fetchall()
+        return pd.DataFrame([
+            {"collection": collection, "setting": setting, **json.loads(metrics)}
+            for collection, setting, metrics in rows
+        ])
+
+
+def compare_runs(store: ResultsStore, baseline_run: str, candidate_run: str,
+                 quality_metrics: Sequence[str] = QUALITY_METRICS, latency_metrics: Sequence[str] = LATENCY_METRICS,
+                 quality_threshold: float = 0.01, latency_threshold: float = 0.10) -> pd.DataFrame:
+    """
+    Compare two runs per collection and search setting and flag regressions.
+
+    A quality metric regresses if it drops by more than `quality_threshold`
+    (absolute). A latency metric regresses if it grows by more than
+    `latency_threshold` (relative to the baseline). Recall columns of the
+    form 'avg_recall_at_<c>' are compared as quality metrics as well.
+
+    Collections and settings found in only one run are kept with their
+    'match' set to 'baseline_only' or 'candidate_only'. A baseline row
+    missing from the candidate counts as a regression, so a comparison never
+    looks clean because rows were dropped.
+
+    Args:
+        store (ResultsStore): Results store holding both runs
+        baseline_run (str): ID of the reference run
+        candidate_run (str): ID of the run to check
+        quality_metrics (Sequence[str]): Metrics where higher is better
+        latency_metrics (Sequence[str]): Metrics where lower is better
+        quality_threshold (float): Largest tolerated absolute quality drop
+        latency_threshold (float): Largest tolerated relative latency increase
+
+    Returns:
+        pd.DataFrame: Baseline value, candidate value and delta of every metric per
+        collection and setting, with the 'match' of the row, a 'regressions' list
+        and a 'regression' flag
+    """
+    baseline = store.load_results(baseline_run)
+    candidate = store.load_results(candidate_run)
+    if baseline.empty and candidate.empty:
+        return pd.DataFrame(columns=["collection", "setting", "match", "regressions", "regression"])
+    for results in (baseline, candidate):
+        for column in ("collection", "setting"):
+            if column not in results:
+                results[column] = pd.Series(dtype=object)
+
+    merged = baseline.merge(candidate, on=["collection", "setting"], how="outer",
+                            suffixes=("_baseline", "_candidate"), indicator="match")
+    merged["match"] = merged["match"].map({"both": "matched", "left_only": "baseline_only", "right_only": "candidate_only"})
+
+    recall_metrics = sorted(column for column in baseline.columns if column.startswith("avg_recall_at_"))
+    higher_is_better = [metric for metric in (*quality_metrics, *recall_metrics) if metric in baseline and metric in candidate]
+    lower_is_better = [metric for metric in latency_metrics if metric in baseline and metric in candidate]
+
+    comparison = merged[["collection", "setting", "match"]].copy()
+    regressions = [["missing_in_candidate"] if match == "baseline_only" else [] for match in merged["match"]]
+
+    for metric in (*higher_is_better, *lower_is_better):
+        before = merged[f"{metric}_baseline"].astype(float)
+        after = merged[f"{metric}_candidate"].astype(float)
+        comparison[f"{metric}_baseline"] = before
+        comparison[f"{metric}_candidate"] = after
+        comparison[f"{metric}_delta"] = after - before
+
+        if metric in higher_is_better:
+            regressed = (before - after) > quality_threshold
+        else:
+            regressed = (after - before) > latency_threshold * before
+        for position, flag in enumerate(regressed):
+            if flag:
+                regressions[position].append(metric)
+
+    comparison["regressions"] = regressions
+    comparison["regression"] = [bool(metrics) for metrics in regressions]
+    return comparison
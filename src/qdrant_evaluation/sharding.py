@@ -0,0 +1,135 @@
+from collections import Counter
+from typing import List, Dict, Any, Optional, Tuple
+
+from qdrant_client import QdrantClient, models
+
+from qdrant_data_ingestion.data_ingestion import primary_category
+from qdrant_evaluation.evaluator import get_ground_truth, get_search_points, _measure_search, _search_results
+from qdrant_evaluation.ground_truth import GroundTruthCache
+from qdrant_evaluation.projection import arxiv_point_id
+from qdrant_evaluation.query_set import query_vectors
+from qdrant_evaluation.timing import timed_runs
+
+
+def result_shard_keys(client: QdrantClient, collection_name: str, ids: List[List], batch_size: int = 1000) -> Dict[str, str]:
+    """
+    Look up the shard key of every paper in a list of result IDs.
+
+    Points are retrieved by the point ID `DataIngestion` derives from the
+    arXiv ID, only the 'categories' payload field is fetched.
+
+    Args:
+        client (QdrantClient): Qdrant client
+        collection_name (str): Name of the collection
+        ids (List[List]): arXiv IDs per query, e.g. ground truth results
+        batch_size (int): Number of points retrieved per request
+
+    Returns:
+        Dict[str, str]: Shard key per arXiv ID, see `primary_category`
+    """
+    arxiv_ids = list(dict.fromkeys(arxiv_id for query_ids in ids for arxiv_id in query_ids))
+    shard_keys = {}
+    for start in range(0, len(arxiv_ids), batch_size):
+        points = client.retrieve(
+            collection_name=collection_name,
+            ids=[arxiv_point_id(arxiv_id) for arxiv_id in arxiv_ids[start:start + batch_size]],
+            with_payload=["id", "categories"],
+            with_vectors=False
+        )
+        for point in points:
+            payload = point.payload or {}
+            shard_keys[payload.get("id")] = primary_category(payload.get("categories"))
+    return shard_keys
+
+
+def infer_query_shard_keys(ground_truth_ids: List[List], shard_keys: Dict[str, str]) -> List[str]:
+    """
+    Route every query to the shard holding most of its exact nearest neighbours.
+
+    Args:
+        ground_truth_ids (List[List]): Exact search results per query
+        shard_keys (Dict[str, str]): Shard key per arXiv ID, see `result_shard_keys`
+
+    Returns:
+        List[str]: Shard key per query
+    """
+    routes = []
+    for ids in ground_truth_ids:
+        counts = Counter(shard_keys[arxiv_id] for arxiv_id in ids if arxiv_id in shard_keys)
+        routes.append(counts.most_common(1)[0][0] if counts else "other")
+    return routes
+
+
+def evaluate_shard_routing(client: QdrantClient, collection_name: str, embeddings: Dict,
+                           query_shard_keys: Optional[List[str]] = None, k: int = 10, hnsw_ef: Optional[int] = None,
+                           warmup: int = 0, repetitions: int = 1,
+                           ground_truth_cache: Optional[GroundTruthCache] = None) -> List[Dict[str, Any]]:
+    """
+    Compare search routed to one category shard against fan-out search over all shards.
+
+    Both modes search the same category-sharded collection, created with
+    `DataIngestion.ingest_data(shard_by_category=True)`, and are measured
+    against exact fan-out search. Queries without a given shard key are routed
+    to the shard holding most of their exact nearest neighbours, which is
+    what a category classifier in front of the search would do at best.
+    'routing_recall_ceiling' is the share of exact neighbours inside the
+    routed shard, the highest recall routing can reach.
+
+    Args:
+        client (QdrantClient): Qdrant client
+        collection_name (str): Name of a collection sharded by category
+        embeddings (Dict): Dictionary of embeddings or QuerySet to evaluate
+        query_shard_keys (Optional[List[str]]): Shard key per query, inferred from the ground truth if None
+        k (int): Number of results to return per query
+        hnsw_ef (Optional[int]): HNSW ef of the searches
+        warmup (int): Number of discarded passes over the query set before measuring
+        repetitions (int): Number of measured passes over the query set
+        ground_truth_cache (Optional[GroundTruthCache]): Cache for exact search results
+
+    Returns:
+        List[Dict[str, Any]]: 'fan_out' and 'routed' rows with quality metrics, latency
+        distribution and speedup over fan-out
+    """
+    vectors = query_vectors(embeddings)
+    search_params = models.SearchParams(hnsw_ef=hnsw_ef) if hnsw_ef else None
+
+    ground_truth, _ = get_ground_truth(client, collection_name, vectors, k=k, ground_truth_cache=ground_truth_cache)
+    shard_keys = result_shard_keys(client, collection_name, ground_truth)
+    if query_shard_keys is None:
+        query_shard_keys = infer_query_shard_keys(ground_truth, shard_keys)
+    if len(query_shard_keys) != len(vectors):
+        raise ValueError(f"Got {len(query_shard_keys)} shard keys for {len(vectors)} queries")
+
+    print(f"Evaluating fan-out search on {collection_name}...")
+    ids, histogram, server_histogram = _measure_search(
+        client, collection_name, vectors,
+        search_params=search_params,
+        k=k,
+        warmup=warmup,
+        repetitions=repetitions
+    )
+    fan_out = {"routing": "fan_out", **_search_results(ids, ground_truth, histogram, server_histogram, k=k)}
+
+    print(f"Evaluating search routed to {len(set(query_shard_keys))} shard keys on {collection_name}...")
+
+    def run_pass() -> Tuple[List[List], List[float]]:
+        results = [
+            get_search_points(client, collection_name, vector, search_params, k, shard_key_selector=shard_key)
+            for vector, shard_key in zip(vectors, query_shard_keys)
+        ]
+        return [ids for ids, _ in results], [exec_time for _, exec_time in results]
+
+    ids, histogram = timed_runs(run_pass, warmup=warmup, repetitions=repetitions)
+    routed = {"routing": "routed", **_search_results(ids, ground_truth, histogram, k=k)}
+
+    ceiling = [
+        sum(shard_keys.get(arxiv_id) == shard_key for arxiv_id in exact_ids) / len(exact_ids)
+        for exact_ids, shard_key in zip(ground_truth, query_shard_keys) if exact_ids
+    ]
+    routed["routing_recall_ceiling"] = sum(ceiling) / len(ceiling) if ceiling else None
+    routed["shard_keys"] = dict(Counter(query_shard_keys))
+
+    for results in (fan_out, routed):
+        results["speedup_factor"] = fan_out["avg_query_time_ms"] / results["avg_query_time_ms"]
+
+    return [fan_out, routed]
@@ -0,0 +1,260 @@
+import itertools
+import time
+from typing import List, Dict, Any, Optional
+
+import pandas as pd
+from qdrant_client import QdrantClient, models
+
+from qdrant_data_ingestion.data_ingestion import DEFAULT_INDEXING_THRESHOLD
+from qdrant_evaluation.brute_force import LocalExactSearch
+from qdrant_evaluation.collection import wait_for_collection_green
+from qdrant_evaluation.evaluator import get_ground_truth, _measure_search, _search_results, results_to_dataframe
+from qdrant_evaluation.ground_truth import GroundTruthCache
+from qdrant_evaluation.query_set import query_vectors
+from qdrant_evaluation.telemetry import TelemetrySampler
+
+# Optimizer settings passed on to `models.OptimizersConfigDiff`
+OPTIMIZER_KEYS = ("default_segment_number", "max_segment_size", "memmap_threshold", "indexing_threshold")
+
+# Server behaviour of unset optimizer settings, as explicit values: None in an update
+# means 'no change', so unset values could not be restored otherwise. Segment number 0
+# is chosen by CPU count, memmap threshold 0 disables memmap storage. An unset
+# max_segment_size is derived from the server's CPU count and has no explicit value.
+DEFAULT_OPTIMIZER_SETTINGS = {"default_segment_number": 0, "memmap_threshold": 0,
+                              "indexing_threshold": DEFAULT_INDEXING_THRESHOLD}
+
+# Storage settings: original vectors and HNSW graph on disk instead of in RAM.
+# 'on_disk_vectors' is a bool for all vectors or a dict per vector name
+STORAGE_KEYS = ("on_disk_vectors", "on_disk_hnsw")
+
+DEFAULT_STORAGE_SETTINGS = [
+    {"default_segment_number": 2},
+    {"default_segment_number": 8},
+    {"default_segment_number": 2, "on_disk_vectors": True},
+    {"default_segment_number": 2, "on_disk_vectors": True, "on_disk_hnsw": True},
+]
+
+
+def storage_label(setting: Dict[str, Any]) -> str:
+    """
+    Get a short label for a storage setting, used in results.
+
+    Args:
+        setting (Dict[str, Any]): Optimizer and storage settings
+
+    Returns:
+        str: Label such as 'segments=2,vectors_on_disk' or 'default'
+    """
+    short_names = {"default_segment_number": "segments", "max_segment_size": "max_segment_kb",
+                   "memmap_threshold": "memmap_kb", "indexing_threshold": "indexing_kb"}
+    parts = [f"{short_names[key]}={setting[key]}" for key in OPTIMIZER_KEYS if setting.get(key) is not None]
+    on_disk_vectors = _on_disk_vectors_value(setting.get("on_disk_vectors"))
+    if isinstance(on_disk_vectors, dict):
+        parts.append("vectors_on_disk=" + "+".join(name or "default" for name, on_disk in on_disk_vectors.items() if on_disk))
+    elif on_disk_vectors:
+        parts.append("vectors_on_disk")
+    if setting.get("on_disk_hnsw"):
+        parts.append("hnsw_on_disk")
+    return ",".join(parts) or "default"
+
+
+def storage_grid(**values: List[Any]) -> List[Dict[str, Any]]:
+    """
+    Expand lists of values per setting into all their combinations.
+
+    Example: `storage_grid(default_segment_number=[2, 8], on_disk_vectors=[False, True])`
+    yields four settings.
+
+    Args:
+        **values (List[Any]): Candidate values per key of `OPTIMIZER_KEYS` and `STORAGE_KEYS`
+
+    Returns:
+        List[Dict[str, Any]]: One setting per combination
+    """
+    unknown = set(values) - set(OPTIMIZER_KEYS) - set(STORAGE_KEYS)
+    if unknown:
+        raise ValueError(f"Unknown storage settings: {sorted(unknown)}")
+
+    keys = list(values)
+    return [dict(zip(keys, combination)) for combination in itertools.product(*(values[key] for key in keys))]
+
+
+def _vector_names(info) -> List[str]:
+    vectors = info.config.params.vectors
+    # The unnamed default vector is addressed as '' in updates
+    return list(vectors) if isinstance(vectors, dict) else [""]
+
+
+def _on_disk_vectors_value(on_disk_vectors: Any) -> Any:
+    # A per-name dict with the same value for every vector collapses to that value
+    if isinstance(on_disk_vectors, dict) and len(set(on_disk_vectors.values())) == 1:
+        return next(iter(on_disk_vectors.values()))
+    return on_disk_vectors
+
+
+def apply_storage_config(client: QdrantClient, collection_name: str, setting: Dict[str, Any], timeout: int = 3600,
+                         settle_time: float = 2.0) -> Dict[str, Any]:
+    """
+    Apply optimizer and storage settings to a collection and wait until optimization settles.
+
+    Keys that are missing from the setting are left unchanged. The collection
+    counts as settled once it is green and its segment count has not changed
+    for `settle_time` seconds, since the optimizer may start merging segments
+    only after the collection reported green. The optimization time ends at
+    the poll that first saw the settled segment count. Segment numbers only change
+    through optimization: a lower `default_segment_number` merges segments,
+    a higher one takes effect for segments created afterwards.
+
+    Args:
+        client (QdrantClient): Qdrant client
+        collection_name (str): Name of the collection to update
+        setting (Dict[str, Any]): Settings with keys from `OPTIMIZER_KEYS` and `STORAGE_KEYS`
+        timeout (int): Maximum time in seconds to wait for optimization
+        settle_time (float): Seconds the segment count must stay unchanged
+
+    Returns:
+        Dict[str, Any]: 'optimization_time_s' and the settled 'segments_count'
+    """
+    on_disk_vectors = setting.get("on_disk_vectors")
+    print(f"Applying storage setting {storage_label(setting)} to {collection_name}...")
+    start_time = time.perf_counter()
+
+    optimizers = {key: setting[key] for key in OPTIMIZER_KEYS if key in setting}
+    client.update_collection(
+        collection_name=collection_name,
+        optimizers_config=models.OptimizersConfigDiff(**optimizers) if optimizers else None,
+        hnsw_config=models.HnswConfigDiff(on_disk=setting["on_disk_hnsw"]) if "on_disk_hnsw" in setting else None,
+        vectors_config={
+            name: models.VectorParamsDiff(on_disk=on_disk)
+            for name, on_disk in (
+                on_disk_vectors.items() if isinstance(on_disk_vectors, dict)
+                else ((name, on_disk_vectors) for name in _vector_names(client.get_collection(collection_name)))
+            )
+        } if on_disk_vectors is not None else None
+    )
+
+    segments_count = None
+    while True:
+        wait_for_collection_green(client, collection_name, timeout=timeout)
+        info = client.get_collection(collection_name)
+        polled_at = time.perf_counter()
+        if info.segments_count == segments_count and info.status == models.CollectionStatus.GREEN:
+            break
+        if polled_at - start_time > timeout:
+            raise TimeoutError(f"Optimization of {collection_name} did not settle within {timeout} seconds")
+        # The count seen by this poll may turn out to be the settled one
+        segments_count, stable_since = info.segments_count, polled_at
+        time.sleep(settle_time)
+
+    return {"optimization_time_s": stable_since - start_time, "segments_count": segments_count}
+
+
+def _original_storage_config(info) -> Dict[str, Any]:
+    optimizer_config = info.config.optimizer_config
+    vectors = info.config.params.vectors
+    vectors = vectors if isinstance(vectors, dict) else {"": vectors}
+    optimizers = {key: getattr(optimizer_config, key) for key in OPTIMIZER_KEYS}
+    return {
+        **{key: DEFAULT_OPTIMIZER_SETTINGS.get(key) if value is None else value for key, value in optimizers.items()},
+        "on_disk_vectors": {name: bool(params.on_disk) for name, params in vectors.items()},
+        "on_disk_hnsw": bool(info.config.hnsw_config.on_disk),
+    }
+
+
+def evaluate_storage_configs(client: QdrantClient, collection_name: str, embeddings: Dict,
+                             storage_settings: Optional[List[Dict[str, Any]]] = None, k: int = 10,
+                             hnsw_ef: Optional[int] = None, batch_size: Optional[int] = None, warmup: int = 1,
+                             repetitions: int = 1, ground_truth_cache: Optional[GroundTruthCache] = None,
+                             ground_truth_source: Optional[LocalExactSearch] = None, telemetry_interval: float = 1.0,
+                             timeout: int = 3600, settle_time: float = 2.0) -> pd.DataFrame:
+    """
+    Evaluate combinations of optimizer and storage settings on a collection.
+
+    Every setting is applied in place, the collection is left to settle and
+    then searched while server telemetry is sampled, so every row carries its
+    recall, latency percentiles and resident memory. Exact search results do
+    not depend on these settings, so ground truth is computed once. The
+    original configuration of the collection is restored at the end, with
+    unset optimizer settings restored as `DEFAULT_OPTIMIZER_SETTINGS`. An
+    unset `max_segment_size` has no explicit equivalent, so it cannot be
+    swept on such a collection.
+
+    Use at least one warmup pass: after moving vectors or the graph to disk,
+    the first pass measures the page cache rather than the setting.
+
+    Args:
+        client (QdrantClient): Qdrant client
+        collection_name (str): Name of the collection to evaluate
+        embeddings (Dict): Dictionary of embeddings or QuerySet to evaluate
+        storage_settings (Optional[List[Dict[str, Any]]]): Settings to evaluate, e.g. from
+            `storage_grid` (default: `DEFAULT_STORAGE_SETTINGS`)
+        k (int): Number of results to return per query
+        hnsw_ef (Optional[int]): HNSW ef of the searches
+        batch_size (Optional[int]): Send queries in batches of this size instead of one by one
+        warmup (int): Number of discarded passes over the query set before measuring
+        repetitions (int): Number of measured passes over the query set
+        ground_truth_cache (Optional[GroundTruthCache]): Cache for exact search results
+        ground_truth_source (Optional[LocalExactSearch]): Client-side exact search engine used for ground truth
+        telemetry_interval (float): Seconds between telemetry samples during the search
+        timeout (int): Maximum time in seconds to wait for optimization of a setting
+        settle_time (float): Seconds the segment count must stay unchanged after optimization
+
+    Returns:
+        pd.DataFrame: One row per setting in the shape of `results_to_dataframe`, with the
+        setting keys, 'storage' label, optimization time, segment count and telemetry summary
+
+    Raises:
+        ValueError: If a setting sweeps an optimizer setting that is unset on the collection
+            and has no explicit default
+    """
+    if storage_settings is None:
+        storage_settings = DEFAULT_STORAGE_SETTINGS
+
+    original = _original_storage_config(client.get_collection(collection_name))
+    unrestorable = [key for key, value in original.items()
+                    if value is None and any(setting.get(key) is not None for setting in storage_settings)]
+    if unrestorable:
+        raise ValueError(f"Collection {collection_name} has no explicit {', '.join(unrestorable)}, so the original "
+                         f"value could not be restored after the evaluation; set it on the collection first")
+    vectors = query_vectors(embeddings)
+    search_params = models.SearchParams(hnsw_ef=hnsw_ef) if hnsw_ef else None
+
+    knn_ids, _ = get_ground_truth(
+        client, collection_name, vectors,
+        k=k,
+        batch_size=batch_size,
+        ground_truth_cache=ground_truth_cache,
+        ground_truth_source=ground_truth_source
+    )
+
+    results_list = []
+    try:
+        for setting in storage_settings:
+            optimization = apply_storage_config(client, collection_name, setting, timeout=timeout, settle_time=settle_time)
+
+            print(f"Evaluating {collection_name} with {storage_label(setting)}...")
+            sampler = TelemetrySampler(client, collection_name, interval=telemetry_interval)
+            with sampler:
+                result_ids, histogram, server_histogram = _measure_search(
+                    client, collection_name, vectors,
+                    search_params=search_params,
+                    k=k,
+                    batch_size=batch_size,
+                    warmup=warmup,
+                    repetitions=repetitions
+                )
+
+            results_list.append({
+                "storage": storage_label(setting),
+                **{key: setting.get(key, original[key]) for key in OPTIMIZER_KEYS},
+                "on_disk_vectors": _on_disk_vectors_value(setting.get("on_disk_vectors", original["on_disk_vectors"])),
+                "on_disk_hnsw": setting.get("on_disk_hnsw", original["on_disk_hnsw"]),
+                **optimization,
+                **_search_results(result_ids, knn_ids, histogram, server_histogram, batch_size, k),
+                **sampler.summary()
+            })
+    finally:
+        print(f"Restoring original storage configuration of {collection_name}...")
+        apply_storage_config(client, collection_name, original, timeout=timeout, settle_time=settle_time)
+
+    return results_to_dataframe(results_list)
@@ -0,0 +1,296 @@
+import json
+import os
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Dict, Any, Optional, Sequence
+
+import pandas as pd
+from qdrant_client import QdrantClient, models
+
+from qdrant_evaluation.client import build_quantization_config
+from qdrant_evaluation.collection import wait_for_collection_green
+from qdrant_evaluation.evaluator import get_ground_truth, results_to_dataframe, _measure_search, _search_results
+from qdrant_evaluation.ground_truth import GroundTruthCache
+from qdrant_evaluation.brute_force import LocalExactSearch
+from qdrant_evaluation.query_set import query_vectors
+from qdrant_evaluation.quantization import quantization_label, quantized_vector_bytes
+
+
+def variant_name(source_collection: str, m: int, ef_construct: int, quantization: Optional[Dict[str, Any]] = None) -> str:
+    """
+    Get the collection name of a sweep variant, e.g. 'arxiv_papers_16_32'.
+
+    Args:
+        source_collection (str): Name of the collection the variant is copied from
+        m (int): HNSW M parameter
+        ef_construct (int): HNSW ef_construct parameter
+        quantization (Optional[Dict[str, Any]]): Quantization settings
+
+    Returns:
+        str: Name of the variant collection
+    """
+    name = f"{source_collection}_{m}_{ef_construct}"
+    if quantization:
+        name += f"_{quantization_label(quantization)}"
+    return name
+
+
+def estimate_memory_mb(points_count: int, dimension: int, m: int, quantization: Optional[Dict[str, Any]] = None) -> float:
+    """
+    Estimate the memory footprint of vectors and HNSW graph of a collection.
+
+    The estimate counts float32 original vectors, quantized vectors and the
+    links of the HNSW base layer (2 * m neighbours of 4 bytes per point).
+    Payload and upper graph layers are ignored.
+
+    Args:
+        points_count (int): Number of points
+        dimension (int): Vector dimension
+        m (int): HNSW M parameter
+        quantization (Optional[Dict[str, Any]]): Quantization settings
+
+    Returns:
+        float: Estimated memory in MB
+    """
+    vector_bytes = points_count * dimension * 4
+    graph_bytes = points_count * m * 2 * 4
+    quantized_bytes = quantized_vector_bytes(points_count, dimension, quantization)
+
+    return (vector_bytes + graph_bytes + quantized_bytes) / 2 ** 20
+
+
+def build_variant_collection(client: QdrantClient, source_collection: str, target_collection: str, m: int, ef_construct: int,
+                             quantization: Optional[Dict[str, Any]] = None, batch_size: int = 256, timeout: int = 3600) -> None:
+    """
+    Create a copy of a collection with its own HNSW and quantization configuration.
+
+    A target collection that already holds all points of the source is kept,
+    so an interrupted sweep does not rebuild finished variants. Partially
+    copied collections are recreated.
+
+    Args:
+        client (QdrantClient): Qdrant client
+        source_collection (str): Name of the collection to copy points from
+        target_collection (str): Name of the variant collection
+        m (int): HNSW M parameter
+        ef_construct (int): HNSW ef_construct parameter
+        quantization (Optional[Dict[str, Any]]): Quantization settings
+        batch_size (int): Number of points copied per request
+        timeout (int): Maximum time in seconds to wait for the index to be built
+    """
+    source_info = client.get_collection(source_collection)
+
+    if client.collection_exists(target_collection):
+        if client.count(target_collection, exact=True).count == source_info.points_count:
+            print(f"Collection {target_collection} already exists, skipping build.")
+            wait_for_collection_green(client, target_collection, timeout=timeout)
+            return
+        client.delete_collection(target_collection)
+
+    print(f"Building collection {target_collection} with m={m}, ef_construct={ef_construct}, quantization={quantization_label(quantization)}...")
+    client.create_collection(
+        collection_name=target_collection,
+        vectors_config=source_info.config.params.vectors,
+        hnsw_config=models.HnswConfigDiff(m=m, ef_construct=ef_construct),
+        quantization_config=build_quantization_config(quantization)
+    )
+
+    offset = None
+    while True:
+        points, offset = client.scroll(
+            collection_name=source_collection,
+            limit=batch_size,
+            offset=offset,
+            with_payload=True,
+            with_vectors=True
+        )
+        if points:
+            client.upsert(
+                collection_name=target_collection,
+                points=[models.PointStruct(id=point.id, vector=point.vector, payload=point.payload) for point in points]
+            )
+        if offset is None:
+            break
+
+    wait_for_collection_green(client, target_collection, timeout=timeout)
+
+
+def pareto_frontier(df: pd.DataFrame, precision_column: str = "avg_precision",
+                    cost_columns: Sequence[str] = ("avg_query_time_ms", "estimated_memory_mb")) -> pd.DataFrame:
+    """
+    Mark the configurations that are not dominated in precision and cost.
+
+    A row is dominated if another row has at least the same precision and no
+    higher cost in every cost column, and is strictly better in one of them.
+
+    Args:
+        df (pd.DataFrame): Sweep results
+        precision_column (str): Column to maximize
+        cost_columns (Sequence[str]): Columns to minimize
+
+    Returns:
+        pd.DataFrame: Copy of the results with a boolean 'pareto_optimal' column
+    """
+    df = df.copy()
+    if df.empty:
+        df["pareto_optimal"] = pd.Series(dtype=bool)
+        return df
+
+    columns = [precision_column, *cost_columns]
+    values = df[columns].to_numpy(dtype=float, copy=True)
+    # Flip precision so that every column is minimized
+    values[:, 0] = -values[:, 0]
+
+    optimal = []
+    for row in values:
+        no_worse = (values <= row).all(axis=1)
+        better = (values < row).any(axis=1)
+        optimal.append(not (no_worse & better).any())
+
+    df["pareto_optimal"] = optimal
+    return df
+
+
+def _load_completed(results_path: str) -> List[Dict[str, Any]]:
+    if not os.path.exists(results_path):
+        return []
+
+    rows = []
+    with open(results_path, 'r', encoding='utf-8') as file:
+        for line in file:
+            line = line.strip()
+            if line:
+                try:
+                    rows.append(json.loads(line))
+                except json.JSONDecodeError:
+                    # A partially written last line from an interrupted run
+                    continue
+    return rows
+
+
+def run_hnsw_sweep(client: QdrantClient, source_collection: str, embeddings: Dict, m_values: List[int], ef_construct_values: List[int],
+                   hnsw_ef_values: Optional[List[int]] = None, quantization_settings: Optional[List[Optional[Dict[str, Any]]]] = None,
+                   results_path: str = "hnsw_sweep_results.jsonl", max_parallel_builds: int = 2, k: int = 10,
+                   batch_size: Optional[int] = None, warmup: int = 0, repetitions: int = 1,
+                   ground_truth_cache: Optional[GroundTruthCache] = None,
+                   ground_truth_source: Optional[LocalExactSearch] = None) -> pd.DataFrame:
+    """
+    Build and evaluate a grid of HNSW and quantization variants of a collection.
+
+    Variant collections are copied from the source collection with at most
+    `max_parallel_builds` builds running at the same time. Evaluation starts
+    once all builds are finished and runs one variant at a time, so index
+    construction does not distort the measured latencies. Every result row is
+    appended to `results_path` as soon as it is measured; rerunning the sweep
+    with the same path skips finished rows and existing variant collections.
+
+    Ground truth is computed once on the source collection with exact search
+    and shared by all variants, since they contain the same points.
+
+    Args:
+        client (QdrantClient): Qdrant client
+        source_collection (str): Name of the collection holding the data
+        embeddings (Dict): Dictionary of embeddings or QuerySet to evaluate
+        m_values (List[int]): HNSW M values
+        ef_construct_values (List[int]): HNSW ef_construct values
+        hnsw_ef_values (Optional[List[int]]): HNSW ef search values (default: [10, 20, 50, 100, 200])
+        quantization_settings (Optional[List[Optional[Dict[str, Any]]]]): Quantization settings, None for no
+            quantization, e.g. [None, {"type": "scalar", "always_ram": True, "rescore": True}]
+        results_path (str): JSON lines file the results are appended to
+        max_parallel_builds (int): Maximum number of variant collections built at the same time
+        k (int): Number of results considered for precision
+        batch_size (Optional[int]): Send queries in batches of this size instead of one by one
+        warmup (int): Number of discarded passes over the query set before measuring
+        repetitions (int): Number of measured passes over the query set
+        ground_truth_cache (Optional[GroundTruthCache]): Cache for exact search results
+        ground_truth_source (Optional[LocalExactSearch]): Client-side exact search engine used for ground truth
+
+    Returns:
+        pd.DataFrame: All results of the sweep with a 'pareto_optimal' column
+    """
+    if hnsw_ef_values is None:
+        hnsw_ef_values = [10, 20, 50, 100, 200]
+    if quantization_settings is None:
+        quantization_settings = [None]
+
+    variants = [
+        {"m": m, "ef_construct": ef_construct, "quantization": quantization,
+         "collection": variant_name(source_collection, m, ef_construct, quantization)}
+        for m in m_values
+        for ef_construct in ef_construct_values
+        for quantization in quantization_settings
+    ]
+
+    rows = _load_completed(results_path)
+    completed = {(row["collection"], row["hnsw_ef"]) for row in rows}
+    pending = [variant for variant in variants
+               if any((variant["collection"], hnsw_ef) not in completed for hnsw_ef in hnsw_ef_values)]
+    print(f"{len(variants) - len(pending)} of {len(variants)} variants already evaluated.")
+
+    with ThreadPoolExecutor(max_workers=max_parallel_builds) as executor:
+        builds = [
+            executor.submit(
+                build_variant_collection, client, source_collection, variant["collection"],
+                variant["m"], variant["ef_construct"], variant["quantization"]
+            )
+            for variant in pending
+        ]
+        for build in builds:
+            build.result()
+
+    vectors = query_vectors(embeddings)
+    if pending:
+        knn_ids, _ = get_ground_truth(
+            client, source_collection, vectors,
+            k=k,
+            batch_size=batch_size,
+            ground_truth_cache=ground_truth_cache,
+            ground_truth_source=ground_truth_source
+        )
+
+    source_info = client.get_collection(source_collection)
+    dimension = source_info.config.params.vectors.size
+
+    with open(results_path, 'a', encoding='utf-8') as results_file:
+        for variant in pending:
+            quantization = variant["quantization"] or {}
+            for hnsw_ef in hnsw_ef_values:
+                if (variant["collection"], hnsw_ef) in completed:
+                    continue
+
+                print(f"Evaluating collection {variant['collection']} with hnsw_ef={hnsw_ef}...")
+                search_params = models.SearchParams(
+                    hnsw_ef=hnsw_ef,
+                    quantization=models.QuantizationSearchParams(
+                        rescore=quantization.get("rescore", True),
+                        oversampling=quantization.get("oversampling", 2.0)
+                    ) if quantization else None
+                )
+                result_ids, histogram, server_histogram = _measure_search(
+                    client, variant["collection"], vectors,
+                    search_params=search_params,
+                    k=k,
+                    batch_size=batch_size,
+                    warmup=warmup,
+                    repetitions=repetitions
+                )
+                results = _search_results(result_ids, knn_ids, histogram, server_histogram, batch_size, k)
+                results.pop("latency_histogram")
+
+                row = {
+                    "collection": variant["collection"],
+                    "m": variant["m"],
+                    "ef_construct": variant["ef_construct"],
+                    "quantization": quantization_label(variant["quantization"]),
+                    "hnsw_ef": hnsw_ef,
+                    "estimated_memory_mb": estimate_memory_mb(
+                        source_info.points_count, dimension, variant["m"], variant["quantization"]
+                    ),
+                    **results
+                }
+                results_file.write(json.dumps(row) + "\n")
+                results_file.flush()
+                rows.append(row)
+
+    variant_collections = {variant["collection"] for variant in variants}
+    df = results_to_dataframe([row for row in rows if row["collection"] in variant_collections])
+    return pareto_frontier(df)
@@ -0,0 +1,220 @@
+import threading
+from typing import List, Dict, Any, Optional
+
+from qdrant_client import QdrantClient
+
+from qdrant_evaluation.timing import now
+
+MB = 2 ** 20
+
+
+def parse_prometheus(text: str) -> Dict[str, float]:
+    """
+    Parse Prometheus text exposition format into metric totals.
+
+    Samples of the same metric with different labels are summed.
+
+    Args:
+        text (str): Response of the `/metrics` endpoint
+
+    Returns:
+        Dict[str, float]: Total value per metric name
+    """
+    metrics: Dict[str, float] = {}
+    for line in text.splitlines():
+        line = line.strip()
+        if not line or line.startswith("#"):
+            continue
+
+        # 'name{labels} value [timestamp]', label values may contain spaces
+        name_end = line.find("{")
+        if name_end != -1:
+            name = line[:name_end]
+            value = line[line.rfind("}") + 1:].split()[0]
+        else:
+            name, value = line.split()[:2]
+
+        try:
+            metrics[name] = metrics.get(name, 0.0) + float(value)
+        except ValueError:
+            continue
+    return metrics
+
+
+def _collection_telemetry(telemetry, collection_name: str) -> Dict[str, Any]:
+    sample: Dict[str, Any] = {}
+
+    collections = telemetry.collections.collections if telemetry.collections else None
+    for collection in collections or []:
+        if getattr(collection, "id", None) != collection_name:
+            continue
+
+        totals = {"segments": 0, "vectors_size_bytes": 0, "payloads_size_bytes": 0, "ram_usage_bytes": 0, "disk_usage_bytes": 0}
+        for shard in collection.shards or []:
+            local = shard.local
+            if local is None:
+                continue
+            totals["vectors_size_bytes"] += local.vectors_size_bytes or 0
+            totals["payloads_size_bytes"] += local.payloads_size_bytes or 0
+            for segment in local.segments or []:
+                totals["segments"] += 1
+                totals["ram_usage_bytes"] += segment.info.ram_usage_bytes or 0
+                totals["disk_usage_bytes"] += segment.info.disk_usage_bytes or 0
+        sample.update(totals)
+
+    if telemetry.hardware and telemetry.hardware.collection_data:
+        usage = telemetry.hardware.collection_data.get(collection_name)
+        if usage is not None:
+            sample["hardware_cpu"] = usage.cpu
+            sample["vector_io_read"] = usage.vector_io_read
+
+    return sample
+
+
+def take_telemetry_sample(client: QdrantClient, collection_name: str, details_level: int = 3) -> Dict[str, Any]:
+    """
+    Sample server metrics, telemetry and collection info at one point in time.
+
+    Endpoints that are unavailable (e.g. in local mode or on older servers)
+    leave their fields out of the sample.
+
+    Args:
+        client (QdrantClient): Qdrant client
+        collection_name (str): Name of the collection the sample is taken for
+        details_level (int): Telemetry detail level, segment sizes need level 3
+
+    Returns:
+        Dict[str, Any]: Sample with 'time' and whatever of resident/allocated memory, process CPU
+        seconds, hardware counters, collection status, segment count and storage sizes was available
+    """
+    sample: Dict[str, Any] = {"time": now()}
+
+    try:
+        metrics = parse_prometheus(client.http.service_api.metrics())
+        for key, metric in (("resident_bytes", "memory_resident_bytes"), ("allocated_bytes", "memory_allocated_bytes"),
+                            ("cpu_seconds", "process_cpu_seconds_total")):
+            if metric in metrics:
+                sample[key] = metrics[metric]
+    except Exception as e:
+        print(f"❌ Error: {str(e)}")
+
+    try:
+        telemetry = client.http.service_api.telemetry(details_level=details_level).result
+        if telemetry.memory is not None:
+            sample["resident_bytes"] = telemetry.memory.resident_bytes
+            sample["allocated_bytes"] = telemetry.memory.allocated_bytes
+        sample.update(_collection_telemetry(telemetry, collection_name))
+    except Exception as e:
+        print(f"❌ Error: {str(e)}")
+
+    info = client.get_collection(collection_name)
+    sample["status"] = getattr(info.status, "value", info.status)
+    sample["segments_count"] = info.segments_count
+    sample["points_count"] = info.points_count
+    sample["indexed_vectors_count"] = info.indexed_vectors_count
+    return sample
+
+
+def summarize_telemetry(samples: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """
+    Summarize telemetry samples taken before, during and after an evaluation.
+
+    Args:
+        samples (List[Dict[str, Any]]): Samples in time order, the first taken before and
+            the last taken after the evaluation
+
+    Returns:
+        Dict[str, Any]: Server memory before, after and at its peak, CPU used during the
+        evaluation, the share of samples in which the collection was optimizing and the
+        storage footprint of the collection afterwards
+    """
+    if not samples:
+        return {}
+
+    before, after = samples[0], samples[-1]
+
+    def delta(key: str) -> Optional[float]:
+        if before.get(key) is None or after.get(key) is None:
+            return None
+        return after[key] - before[key]
+
+    def mb(value: Optional[float]) -> Optional[float]:
+        return value / MB if value is not None else None
+
+    resident = [sample["resident_bytes"] for sample in samples if sample.get("resident_bytes") is not None]
+    statuses = [sample["status"] for sample in samples if sample.get("status") is not None]
+    segments = [sample["segments_count"] for sample in samples if sample.get("segments_count") is not None]
+    elapsed = after["time"] - before["time"]
+    cpu_seconds = delta("cpu_seconds")
+
+    return {
+        "server_ram_resident_mb_before": mb(before.get("resident_bytes")),
+        "server_ram_resident_mb_after": mb(after.get("resident_bytes")),
+        "server_ram_resident_mb_peak": mb(max(resident)) if resident else None,
+        "server_ram_allocated_mb_after": mb(after.get("allocated_bytes")),
+        "server_cpu_seconds": cpu_seconds,
+        "server_cpu_utilization": cpu_seconds / elapsed if cpu_seconds is not None and elapsed > 0 else None,
+        "server_hardware_cpu": delta("hardware_cpu"),
+        "server_vector_io_read": delta("vector_io_read"),
+        # A yellow collection is being optimized, i.e. segments are merged or indexed
+        "collection_optimizing_share": sum(status != "green" for status in statuses) / len(statuses) if statuses else None,
+        "collection_segments_count": after.get("segments_count"),
+        "collection_segments_count_max": max(segments) if segments else None,
+        "collection_vectors_size_mb": mb(after.get("vectors_size_bytes")),
+        "collection_payloads_size_mb": mb(after.get("payloads_size_bytes")),
+        "collection_ram_usage_mb": mb(after.get("ram_usage_bytes")),
+        "collection_disk_usage_mb": mb(after.get("disk_usage_bytes")),
+    }
+
+
+class TelemetrySampler:
+    """
+    Sample server telemetry before, during and after a block of code.
+
+    Used as a context manager around an evaluation: one sample is taken on
+    entry, a background thread samples every `interval` seconds and a final
+    sample is taken on exit. The background samples add a small amount of
+    load to the server, so keep the interval well above the query latency.
+
+    Args:
+        client (QdrantClient): Qdrant client
+        collection_name (str): Name of the evaluated collection
+        interval (float): Seconds between samples during the evaluation
+        details_level (int): Telemetry detail level
+    """
+
+    def __init__(self, client: QdrantClient, collection_name: str, interval: float = 1.0, details_level: int = 3):
+        self.client = client
+        self.collection_name = collection_name
+        self.interval = interval
+        self.details_level = details_level
+        self.samples: List[Dict[str, Any]] = []
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def _sample(self) -> None:
+        self.samples.append(take_telemetry_sample(self.client, self.collection_name, self.details_level))
+
+    def _run(self) -> None:
+        while not self._stop.wait(self.interval):
+            self._sample()
+
+    def __enter__(self) -> "TelemetrySampler":
+        self._sample()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self._stop.set()
+        self._thread.join()
+        self._sample()
+
+    def summary(self) -> Dict[str, Any]:
+        """
+        Summarize the collected samples, see `summarize_telemetry`.
+
+        Returns:
+            Dict[str, Any]: Telemetry summary plus the raw 'telemetry_samples'
+        """
+        return {**summarize_telemetry(self.samples), "telemetry_samples": self.samples}
@@ -0,0 +1,177 @@
+import math
+import time
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+
+# Monotonic, high-resolution clock used for all latency measurements
+now = time.perf_counter
+
+
+class LatencyHistogram:
+    """
+    HDR-style latency histogram.
+
+    Values are counted in logarithmic buckets whose width is a fixed fraction of
+    their value, so percentiles are accurate to `significant_digits` across the
+    whole range from microseconds to seconds while memory stays bounded. Mean,
+    standard deviation, minimum and maximum are tracked exactly. Histograms of
+    separate runs can be merged without losing percentile accuracy.
+    """
+
+    def __init__(self, name: str = "query_time", significant_digits: int = 2, lowest: float = 1e-6):
+        """
+        Initialize an empty histogram.
+
+        Args:
+            name (str): Metric name used for the summary keys, e.g. 'query_time'
+            significant_digits (int): Number of significant digits kept for percentiles
+            lowest (float): Smallest distinguishable value in seconds
+        """
+        self.name = name
+        self.significant_digits = significant_digits
+        self.lowest = lowest
+        self._log_base = math.log1p(10 ** -significant_digits)
+        self.counts: Dict[int, int] = {}
+        self.count = 0
+        self.min = math.inf
+        self.max = 0.0
+        self._mean = 0.0
+        self._m2 = 0.0
+
+    def _index(self, value: float) -> int:
+        return int(math.log(max(value, self.lowest) / self.lowest) / self._log_base)
+
+    def _bucket_value(self, index: int) -> float:
+        return self.lowest * math.exp((index + 0.5) * self._log_base)
+
+    def record(self, value: float) -> None:
+        """
+        Record a single latency.
+
+        Args:
+            value (float): Latency in seconds
+        """
+        index = self._index(value)
+        self.counts[index] = self.counts.get(index, 0) + 1
+        self.count += 1
+        self.min = min(self.min, value)
+        self.max = max(self.max, value)
+
+        # Welford's online algorithm keeps the variance numerically stable
+        delta = value - self._mean
+        self._mean += delta / self.count
+        self._m2 += delta * (value - self._mean)
+
+    def record_all(self, values: Iterable[float]) -> None:
+        """
+        Record several latencies.
+
+        Args:
+            values (Iterable[float]): Latencies in seconds
+        """
+        for value in values:
+            self.record(value)
+
+    def merge(self, other: "LatencyHistogram") -> "LatencyHistogram":
+        """
+        Add the values of another histogram with the same resolution.
+
+        Args:
+            other (LatencyHistogram): Histogram to merge into this one
+
+        Returns:
+            LatencyHistogram: This histogram
+        """
+        if (other.significant_digits, other.lowest) != (self.significant_digits, self.lowest):
+            raise ValueError("Cannot merge histograms with different resolution")
+        if other.count == 0:
+            return self
+
+        for index, count in other.counts.items():
+            self.counts[index] = self.counts.get(index, 0) + count
+
+        total = self.count + other.count
+        delta = other._mean - self._mean
+        self._m2 += other._m2 + delta * delta * self.count * other.count / total
+        self._mean += delta * other.count / total
+        self.count = total
+        self.min = min(self.min, other.min)
+        self.max = max(self.max, other.max)
+        return self
+
+    @property
+    def mean(self) -> float:
+        return self._mean if self.count else 0.0
+
+    @property
+    def stddev(self) -> float:
+        return math.sqrt(self._m2 / (self.count - 1)) if self.count > 1 else 0.0
+
+    def percentile(self, percentile: float) -> float:
+        """
+        Get the latency below which the given percentage of values fall.
+
+        Args:
+            percentile (float): Percentile between 0 and 100
+
+        Returns:
+            float: Latency in seconds
+        """
+        if self.count == 0:
+            return 0.0
+
+        rank = max(1, math.ceil(percentile / 100 * self.count))
+        seen = 0
+        for index in sorted(self.counts):
+            seen += self.counts[index]
+            if seen >= rank:
+                return min(max(self._bucket_value(index), self.min), self.max)
+        return self.max
+
+    def summary(self) -> Dict[str, float]:
+        """
+        Summarize the distribution in milliseconds.
+
+        Returns:
+            Dict[str, float]: avg, std, p50, p90, p99 and max keyed like 'p99_query_time_ms'
+        """
+        return {
+            f"avg_{self.name}_ms": self.mean * 1000,
+            f"std_{self.name}_ms": self.stddev * 1000,
+            f"p50_{self.name}_ms": self.percentile(50) * 1000,
+            f"p90_{self.name}_ms": self.percentile(90) * 1000,
+            f"p99_{self.name}_ms": self.percentile(99) * 1000,
+            f"max_{self.name}_ms": self.max * 1000,
+        }
+
+
+def timed_runs(run_pass: Callable[[], Tuple[List[List], List[float]]], warmup: int = 0, repetitions: int = 1,
+               name: str = "query_time") -> Tuple[List[List], LatencyHistogram]:
+    """
+    Run a measurement pass with warmup passes and repetitions.
+
+    Warmup passes are executed and discarded, so cold caches on the server do
+    not distort the distribution. The latencies of all repetitions are recorded
+    into one histogram; result IDs are taken from the first repetition.
+
+    Args:
+        run_pass (Callable): Function running all queries once and returning
+            result IDs and per-query latencies in seconds
+        warmup (int): Number of discarded passes
+        repetitions (int): Number of measured passes
+        name (str): Metric name of the histogram
+
+    Returns:
+        Tuple[List[List], LatencyHistogram]: Result IDs and latency histogram
+    """
+    for _ in range(warmup):
+        run_pass()
+
+    histogram = LatencyHistogram(name=name)
+    ids: Optional[List[List]] = None
+    for _ in range(max(1, repetitions)):
+        pass_ids, pass_times = run_pass()
+        if ids is None:
+            ids = pass_ids
+        histogram.record_all(pass_times)
+
+    return ids, histogram
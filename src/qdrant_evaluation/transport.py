@@ -0,0 +1,236 @@
+import json
+from typing import List, Dict, Any, Optional, Tuple, Sequence
+
+import grpc
+import httpx
+from qdrant_client import models
+from qdrant_client.grpc import QueryResponse
+from qdrant_client.conversions.conversion import RestToGrpc, value_to_json
+
+from qdrant_evaluation.client import get_client
+from qdrant_evaluation.evaluator import _measure_search
+from qdrant_evaluation.query_set import query_vectors
+from qdrant_evaluation.timing import now, LatencyHistogram
+from qdrant_evaluation.projection import ID_PAYLOAD
+
+BREAKDOWN_COMPONENTS = ("encode_time", "transport_time", "server_time", "network_time", "decode_time")
+
+
+class RestTransport:
+    """
+    Raw REST query transport that exposes every stage of a request.
+
+    Requests are serialized and responses parsed explicitly around a plain
+    HTTP call, so encoding, transport and decoding can be timed separately.
+
+    Args:
+        host (str): Qdrant server host
+        port (int): Qdrant server REST port
+    """
+
+    name = "rest"
+
+    def __init__(self, host: str = "localhost", port: int = 6333):
+        self._http = httpx.Client(base_url=f"http://{host}:{port}", headers={"Content-Type": "application/json"})
+
+    def encode(self, collection_name: str, request: models.QueryRequest) -> Tuple[str, bytes]:
+        return f"/collections/{collection_name}/points/query", request.model_dump_json(exclude_none=True).encode("utf-8")
+
+    def send(self, encoded: Tuple[str, bytes]) -> bytes:
+        path, body = encoded
+        response = self._http.post(path, content=body)
+        response.raise_for_status()
+        return response.content
+
+    def decode(self, raw: bytes) -> Tuple[List, float]:
+        response = json.loads(raw)
+        return [point["payload"]["id"] for point in response["result"]["points"]], response["time"]
+
+    def close(self) -> None:
+        self._http.close()
+
+
+class GrpcTransport:
+    """
+    Raw gRPC query transport that exposes every stage of a request.
+
+    The Query method is called with pre-serialized bytes, so protobuf
+    conversion and serialization are timed as encoding and parsing as decoding.
+
+    Args:
+        host (str): Qdrant server host
+        grpc_port (int): Qdrant server gRPC port
+    """
+
+    name = "grpc"
+
+    def __init__(self, host: str = "localhost", grpc_port: int = 6334):
+        self._channel = grpc.insecure_channel(f"{host}:{grpc_port}")
+        # Identity (de)serializers: the stub sends and returns raw bytes
+        self._query = self._channel.unary_unary("/qdrant.Points/Query")
+
+    def encode(self, collection_name: str, request: models.QueryRequest) -> bytes:
+        return RestToGrpc.convert_query_request(request, collection_name).SerializeToString()
+
+    def send(self, encoded: bytes) -> bytes:
+        return self._query(encoded)
+
+    def decode(self, raw: bytes) -> Tuple[List, float]:
+        response = QueryResponse.FromString(raw)
+        return [value_to_json(point.payload["id"]) for point in response.result], response.time
+
+    def close(self) -> None:
+        self._channel.close()
+
+
+def query_with_breakdown(transport, collection_name: str, embedding: List, search_params: Optional[models.SearchParams] = None,
+                         k: int = 10) -> Tuple[List, Dict[str, float]]:
+    """
+    Run a single query and split its latency into client and server stages.
+
+    - encode_time: building and serializing the request
+    - transport_time: sending the request and receiving the raw response
+    - server_time: search time reported by the server
+    - network_time: transport time not spent searching on the server
+    - decode_time: parsing the response and extracting the result IDs
+
+    Args:
+        transport: `RestTransport` or `GrpcTransport`
+        collection_name (str): Name of the collection to query
+        embedding (List): Query embedding vector
+        search_params (Optional[models.SearchParams]): Search parameters of the query
+        k (int): Number of results to return
+
+    Returns:
+        Tuple[List, Dict[str, float]]: Result IDs and the time of every stage in seconds,
+        including the 'total_time'
+    """
+    start_time = now()
+    encoded = transport.encode(
+        collection_name,
+        models.QueryRequest(query=embedding, limit=k, params=search_params, with_payload=ID_PAYLOAD)
+    )
+    encoded_time = now()
+    raw = transport.send(encoded)
+    received_time = now()
+    ids, server_time = transport.decode(raw)
+    decoded_time = now()
+
+    transport_time = received_time - encoded_time
+    return ids, {
+        "total_time": decoded_time - start_time,
+        "encode_time": encoded_time - start_time,
+        "transport_time": transport_time,
+        "server_time": server_time,
+        # Clocks differ between client and server, so tiny negative values are clamped
+        "network_time": max(transport_time - server_time, 0.0),
+        "decode_time": decoded_time - received_time,
+    }
+
+
+def measure_latency_breakdown(transport, collection_name: str, embeddings: List[List],
+                              search_params: Optional[models.SearchParams] = None, k: int = 10,
+                              warmup: int = 0, repetitions: int = 1) -> Dict[str, Any]:
+    """
+    Measure the latency breakdown of a query set over a raw transport.
+
+    Args:
+        transport: `RestTransport` or `GrpcTransport`
+        collection_name (str): Name of the collection to query
+        embeddings (List[List]): Query embedding vectors
+        search_params (Optional[models.SearchParams]): Search parameters applied to every query
+        k (int): Number of results to return per query
+        warmup (int): Number of discarded passes over the query set
+        repetitions (int): Number of measured passes over the query set
+
+    Returns:
+        Dict[str, Any]: Full distribution of 'total_time' and average and p99 of every
+        stage in ms, plus the 'latency_histogram' of the total time
+    """
+    histograms = {name: LatencyHistogram(name=name) for name in ("total_time", *BREAKDOWN_COMPONENTS)}
+
+    for _ in range(warmup):
+        for vector in embeddings:
+            query_with_breakdown(transport, collection_name, vector, search_params, k)
+
+    for _ in range(repetitions):
+        for vector in embeddings:
+            _, stages = query_with_breakdown(transport, collection_name, vector, search_params, k)
+            for name, value in stages.items():
+                histograms[name].record(value)
+
+    results = {**histograms["total_time"].summary()}
+    for name in BREAKDOWN_COMPONENTS:
+        summary = histograms[name].summary()
+        results[f"avg_{name}_ms"] = summary[f"avg_{name}_ms"]
+        results[f"p99_{name}_ms"] = summary[f"p99_{name}_ms"]
+    results["latency_histogram"] = histograms["total_time"]
+    return results
+
+
+def compare_transports(collection_name: str, embeddings: Dict, host: str = "localhost", port: int = 6333,
+                       grpc_port: int = 6334, transports: Sequence[str] = ("rest", "grpc"),
+                       search_params: Optional[models.SearchParams] = None, k: int = 10,
+                       warmup: int = 0, repetitions: int = 1) -> List[Dict[str, Any]]:
+    """
+    Run the same query set over REST and gRPC and break down where the latency goes.
+
+    For every transport the query set is measured twice: over the raw
+    transport with per-stage timings, and through `QdrantClient` end to end.
+    The difference between the two is the overhead of the Python client
+    library on top of serialization and transport.
+
+    Args:
+        collection_name (str): Name of the collection to query
+        embeddings (Dict): Dictionary of embeddings or QuerySet to evaluate
+        host (str): Qdrant server host
+        port (int): Qdrant server REST port
+        grpc_port (int): Qdrant server gRPC port
+        transports (Sequence[str]): Transports to compare, 'rest' and/or 'grpc'
+        search_params (Optional[models.SearchParams]): Search parameters applied to every query
+        k (int): Number of results to return per query
+        warmup (int): Number of discarded passes over the query set before measuring
+        repetitions (int): Number of measured passes over the query set
+
+    Returns:
+        List[Dict[str, Any]]: One row per transport with the stage breakdown, the end-to-end
+        client latency and the client library overhead
+    """
+    vectors = query_vectors(embeddings)
+    results_list = []
+
+    for name in transports:
+        print(f"Measuring {name} latency breakdown on {collection_name}...")
+        transport = RestTransport(host, port) if name == "rest" else GrpcTransport(host, grpc_port)
+        try:
+            breakdown = measure_latency_breakdown(
+                transport, collection_name, vectors,
+                search_params=search_params,
+                k=k,
+                warmup=warmup,
+                repetitions=repetitions
+            )
+        finally:
+            transport.close()
+
+        client = get_client(host=host, port=port, prefer_grpc=(name == "grpc"), grpc_port=grpc_port)
+        try:
+            _, client_histogram, _ = _measure_search(
+                client, collection_name, vectors,
+                search_params=search_params,
+                k=k,
+                warmup=warmup,
+                repetitions=repetitions,
+                name="client_query_time"
+            )
+        finally:
+            client.close()
+
+        results_list.append({
+            "transport": name,
+            **breakdown,
+            **client_histogram.summary(),
+            "client_library_overhead_ms": client_histogram.mean * 1000 - breakdown["avg_total_time_ms"]
+        })
+
+    return results_list
@@ -0,0 +1,103 @@
+from typing import Dict, Any, Optional
+
+from qdrant_client import QdrantClient, models
+
+from qdrant_evaluation.evaluator import get_ground_truth, _measure_search, _search_results
+from qdrant_evaluation.ground_truth import GroundTruthCache
+from qdrant_evaluation.brute_force import LocalExactSearch
+from qdrant_evaluation.query_set import query_vectors
+
+
+def tune_hnsw_ef(client: QdrantClient, collection_name: str, embeddings: Dict, target_precision: float = 0.95, k: int = 10,
+                 min_ef: Optional[int] = None, max_ef: int = 1024, resolution: int = 1, batch_size: Optional[int] = None,
+                 warmup: int = 0, repetitions: int = 1, ground_truth_cache: Optional[GroundTruthCache] = None,
+                 ground_truth_source: Optional[LocalExactSearch] = None) -> Dict[str, Any]:
+    """
+    Find the smallest hnsw_ef that reaches a target precision@k.
+
+    Precision grows monotonically with hnsw_ef, so the search first doubles ef
+    starting at `min_ef` until the target is reached and then bisects between
+    the last failing and the first passing value. It stops as soon as the
+    interval is narrower than `resolution`, or early if `min_ef` already
+    reaches the target. The search passes measure precision only; the chosen ef
+    is measured again with warmup and repetitions for its latency profile.
+
+    Args:
+        client (QdrantClient): Qdrant client
+        collection_name (str): Name of the collection to query
+        embeddings (Dict): Dictionary of embeddings or QuerySet to evaluate
+        target_precision (float): Precision@k to reach, e.g. 0.95
+        k (int): Number of results considered for precision
+        min_ef (Optional[int]): Smallest ef to consider (default: k)
+        max_ef (int): Largest ef to consider
+        resolution (int): Stop when the ef interval is at most this wide
+        batch_size (Optional[int]): Send queries in batches of this size instead of one by one
+        warmup (int): Number of discarded passes before measuring the chosen ef
+        repetitions (int): Number of measured passes for the chosen ef
+        ground_truth_cache (Optional[GroundTruthCache]): Cache for exact search results
+        ground_truth_source (Optional[LocalExactSearch]): Client-side exact search engine used for ground truth
+
+    Returns:
+        Dict[str, Any]: Chosen 'hnsw_ef', whether the target was met, its precision and
+        latency distribution, and the precision of every evaluated ef value
+    """
+    if min_ef is None:
+        min_ef = k
+
+    vectors = query_vectors(embeddings)
+    knn_ids, _ = get_ground_truth(
+        client, collection_name, vectors,
+        k=k,
+        batch_size=batch_size,
+        ground_truth_cache=ground_truth_cache,
+        ground_truth_source=ground_truth_source
+    )
+
+    evaluated: Dict[int, float] = {}
+
+    def precision_at(hnsw_ef: int) -> float:
+        if hnsw_ef not in evaluated:
+            result_ids, histogram, server_histogram = _measure_search(
+                client, collection_name, vectors,
+                search_params=models.SearchParams(hnsw_ef=hnsw_ef),
+                k=k,
+                batch_size=batch_size
+            )
+            evaluated[hnsw_ef] = _search_results(result_ids, knn_ids, histogram, server_histogram, batch_size, k)["avg_precision"]
+            print(f"hnsw_ef={hnsw_ef}: precision@{k}={evaluated[hnsw_ef]:.4f}")
+        return evaluated[hnsw_ef]
+
+    # Exponential search for the first ef reaching the target
+    low, high = None, min_ef
+    while precision_at(high) < target_precision:
+        if high >= max_ef:
+            break
+        low, high = high, min(high * 2, max_ef)
+
+    target_met = evaluated[high] >= target_precision
+
+    # Bisection between the last failing and the first passing ef
+    if target_met and low is not None:
+        while high - low > resolution:
+            middle = (low + high) // 2
+            if precision_at(middle) >= target_precision:
+                high = middle
+            else:
+                low = middle
+
+    result_ids, histogram, server_histogram = _measure_search(
+        client, collection_name, vectors,
+        search_params=models.SearchParams(hnsw_ef=high),
+        k=k,
+        batch_size=batch_size,
+        warmup=warmup,
+        repetitions=repetitions
+    )
+
+    return {
+        "hnsw_ef": high,
+        "target_precision": target_precision,
+        "target_met": target_met,
+        **_search_results(result_ids, knn_ids, histogram, server_histogram, batch_size, k),
+        "evaluated": [{"hnsw_ef": ef, "avg_precision": precision} for ef, precision in sorted(evaluated.items())]
+    }
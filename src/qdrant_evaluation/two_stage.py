@@ -0,0 +1,209 @@
+from typing import List, Dict, Optional, Tuple
+
+import numpy as np
+from qdrant_client import QdrantClient, models
+
+from qdrant_data_ingestion.data_ingestion import FULL_VECTOR, REDUCED_VECTOR
+from qdrant_data_ingestion.pca import PcaProjection
+from qdrant_evaluation.collection import wait_for_collection_green
+from qdrant_evaluation.evaluator import get_ground_truth, _measure_search, _search_results
+from qdrant_evaluation.ground_truth import GroundTruthCache
+from qdrant_evaluation.projection import search_payload, result_ids
+from qdrant_evaluation.query_set import query_vectors
+from qdrant_evaluation.timing import now, timed_runs
+
+
+def build_reduced_collection(client: QdrantClient, source_collection: str, target_collection: str, n_components: int = 256,
+                             sample_size: int = 10000, batch_size: int = 256, pca_path: Optional[str] = None,
+                             timeout: int = 3600, overwrite: bool = False) -> PcaProjection:
+    """
+    Copy a single-vector collection into one with 'full' and PCA-reduced 'reduced' named vectors.
+
+    The projection is fitted on a random sample of the source collection. This
+    is the counterpart of `DataIngestion.ingest_data(reduced_vector_size=...)`
+    for collections that are already ingested.
+
+    Args:
+        client (QdrantClient): Qdrant client
+        source_collection (str): Name of the single-vector collection
+        target_collection (str): Name of the collection to create
+        n_components (int): Dimension of the reduced vector
+        sample_size (int): Number of points the projection is fitted on
+        batch_size (int): Number of points copied per request
+        pca_path (Optional[str]): Path the projection is saved to (default: '<target_collection>.pca.npz')
+        timeout (int): Maximum time in seconds to wait for the index to be built
+        overwrite (bool): Replace the target collection if it already exists
+
+    Returns:
+        PcaProjection: The fitted projection, needed to project query vectors
+
+    Raises:
+        ValueError: If the target is the source collection, or exists and `overwrite` is False
+    """
+    if target_collection == source_collection:
+        raise ValueError(f"Target collection {target_collection} must differ from the source collection")
+    target_exists = client.collection_exists(target_collection)
+    if target_exists and not overwrite:
+        raise ValueError(f"Collection {target_collection} already exists, pass overwrite=True to replace it")
+
+    source_params = client.get_collection(source_collection).config.params.vectors
+
+    sample = client.query_points(
+        collection_name=source_collection,
+        query=models.SampleQuery(sample=models.Sample.RANDOM),
+        limit=sample_size,
+        with_payload=False,
+        with_vectors=True
+    ).points
+    projection = PcaProjection.fit([point.vector for point in sample], n_components)
+    projection.save(pca_path or f"{target_collection}.pca.npz")
+
+    if target_exists:
+        print(f"Deleting existing collection {target_collection}...")
+        client.delete_collection(target_collection)
+
+    print(f"Building collection {target_collection} with {n_components}-dim reduced vectors...")
+    client.create_collection(
+        collection_name=target_collection,
+        vectors_config={
+            FULL_VECTOR: source_params,
+            REDUCED_VECTOR: models.VectorParams(size=n_components, distance=source_params.distance)
+        }
+    )
+
+    offset = None
+    while True:
+        points, offset = client.scroll(
+            collection_name=source_collection,
+            limit=batch_size,
+            offset=offset,
+            with_payload=True,
+            with_vectors=True
+        )
+        if points:
+            reduced = projection.transform([point.vector for point in points])
+            client.upsert(
+                collection_name=target_collection,
+                points=[
+                    models.PointStruct(id=point.id, vector={FULL_VECTOR: point.vector, REDUCED_VECTOR: vector.tolist()}, payload=point.payload)
+                    for point, vector in zip(points, reduced)
+                ]
+            )
+        if offset is None:
+            break
+
+    wait_for_collection_green(client, target_collection, timeout=timeout)
+    return projection
+
+
+def get_two_stage_points(client: QdrantClient, collection_name: str, embedding: List, reduced_embedding: List, k: int = 10,
+                         candidates: int = 100, hnsw_ef: Optional[int] = None) -> Tuple[List, float]:
+    """
+    Search the reduced vector for candidates and rescore them with the full vector.
+
+    Args:
+        client (QdrantClient): Qdrant client
+        collection_name (str): Name of a collection with 'full' and 'reduced' vectors
+        embedding (List): Full query vector
+        reduced_embedding (List): Query vector projected with the collection's PCA projection
+        k (int): Number of results to return
+        candidates (int): Number of candidates fetched on the reduced vector
+        hnsw_ef (Optional[int]): HNSW ef of the candidate search
+
+    Returns:
+        Tuple[List, float]: List of result IDs and query execution time
+    """
+    start_time = now()
+    result = client.query_points(
+        collection_name=collection_name,
+        prefetch=models.Prefetch(
+            query=reduced_embedding,
+            using=REDUCED_VECTOR,
+            limit=max(candidates, k),
+            params=models.SearchParams(hnsw_ef=hnsw_ef) if hnsw_ef else None
+        ),
+        query=embedding,
+        using=FULL_VECTOR,
+        limit=k,
+        with_payload=search_payload(client, collection_name)
+    ).points
+    query_time = now() - start_time
+    return result_ids(client, collection_name, result), query_time
+
+
+def evaluate_two_stage(client: QdrantClient, collection_name: str, embeddings: Dict, projection: PcaProjection,
+                       candidates_values: Optional[List[int]] = None, k: int = 10, hnsw_ef: Optional[int] = None,
+                       ground_truth_cache: Optional[GroundTruthCache] = None, warmup: int = 0,
+                       repetitions: int = 1) -> List[Dict]:
+    """
+    Compare two-stage search against single-vector search on the same collection.
+
+    Ground truth is exact search on the full vector. The baseline row searches
+    the full vector alone, the 'reduced' row the reduced vector alone without
+    rescoring, and one 'two_stage' row per candidate count prefetches on the
+    reduced vector and rescores with the full vector. Every row reports its
+    recall and latency relative to the baseline.
+
+    Args:
+        client (QdrantClient): Qdrant client
+        collection_name (str): Name of a collection with 'full' and 'reduced' vectors
+        embeddings (Dict): Dictionary of embeddings or QuerySet to evaluate
+        projection (PcaProjection): Projection the reduced vectors were built with
+        candidates_values (Optional[List[int]]): Candidate counts of the prefetch (default: [20, 50, 100])
+        k (int): Number of results to return
+        hnsw_ef (Optional[int]): HNSW ef of all HNSW searches
+        ground_truth_cache (Optional[GroundTruthCache]): Cache for ground truth results
+        warmup (int): Number of discarded passes over the query set before measuring
+        repetitions (int): Number of measured passes over the query set
+
+    Returns:
+        List[Dict]: Results per search mode with 'mode', 'candidates', quality metrics,
+        latency distribution, 'recall_delta' and 'latency_ratio'
+    """
+    candidates_values = candidates_values or [20, 50, 100]
+    vectors = np.asarray(query_vectors(embeddings), dtype=np.float32)
+    reduced_vectors = projection.transform(vectors)
+    search_params = models.SearchParams(hnsw_ef=hnsw_ef) if hnsw_ef else None
+
+    ground_truth, _ = get_ground_truth(
+        client, collection_name, vectors,
+        k=k,
+        ground_truth_cache=ground_truth_cache,
+        using=FULL_VECTOR
+    )
+
+    results_list = []
+    for mode, query_set, using in (("full", vectors, FULL_VECTOR), ("reduced", reduced_vectors, REDUCED_VECTOR)):
+        print(f"Evaluating {mode} vector search...")
+        ids, histogram, server_histogram = _measure_search(
+            client, collection_name, query_set,
+            search_params=search_params,
+            k=k,
+            warmup=warmup,
+            repetitions=repetitions,
+            using=using
+        )
+        results = _search_results(ids, ground_truth, histogram, server_histogram, k=k)
+        results_list.append({"mode": mode, "candidates": None, **results})
+
+    for candidates in candidates_values:
+        print(f"Evaluating two-stage search with {candidates} candidates...")
+
+        def run_pass() -> Tuple[List[List], List[float]]:
+            results = [
+                get_two_stage_points(client, collection_name, vector, reduced, k, candidates, hnsw_ef)
+                for vector, reduced in zip(vectors, reduced_vectors)
+            ]
+            return [ids for ids, _ in results], [exec_time for _, exec_time in results]
+
+        ids, histogram = timed_runs(run_pass, warmup=warmup, repetitions=repetitions)
+        results = _search_results(ids, ground_truth, histogram, k=k)
+        results_list.append({"mode": "two_stage", "candidates": candidates, **results})
+
+    baseline = results_list[0]
+    recall_key = f"avg_recall_at_{k}"
+    for results in results_list:
+        results["recall_delta"] = results[recall_key] - baseline[recall_key]
+        results["latency_ratio"] = results["avg_query_time_ms"] / baseline["avg_query_time_ms"]
+
+    return results_list
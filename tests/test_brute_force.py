@@ -0,0 +1,77 @@
+import json
+
+import numpy as np
+import pytest
+from qdrant_client import QdrantClient, models
+
+from qdrant_evaluation.brute_force import LocalExactSearch, export_collection_vectors
+
+
+def naive_top_k(vectors, queries, k, distance):
+    """Reference implementation scoring every query against every vector at once."""
+    if distance == "cosine":
+        vectors = vectors / np.linalg.norm(vectors, axis=1, keepdims=True)
+        queries = queries / np.linalg.norm(queries, axis=1, keepdims=True)
+    if distance == "euclid":
+        scores = -((queries[:, None, :] - vectors[None, :, :]) ** 2).sum(axis=2)
+    else:
+        scores = queries @ vectors.T
+    return np.argsort(-scores, axis=1, kind="stable")[:, :k]
+
+
+@pytest.mark.parametrize("distance", ["cosine", "dot", "euclid"])
+def test_search_matches_naive_top_k(distance):
+    """Blocked, threaded search returns the same neighbours as a full scan."""
+    rng = np.random.default_rng(42)
+    vectors = rng.standard_normal((1000, 16)).astype(np.float32)
+    queries = rng.standard_normal((25, 16)).astype(np.float32)
+
+    engine = LocalExactSearch(vectors, distance=distance, block_size=97, query_block_size=7, num_threads=4)
+    indices, scores = engine.search(queries, k=5)
+
+    assert indices.shape == (25, 5)
+    assert np.all(np.diff(scores, axis=1) <= 1e-6)
+    np.testing.assert_array_equal(indices, naive_top_k(vectors, queries, 5, distance))
+
+
+def test_search_ids_over_memory_mapped_files(tmp_path):
+    """Exported files are memory-mapped and rows are mapped back to their IDs."""
+    vectors = np.eye(4, dtype=np.float32)
+    np.save(tmp_path / "papers.npy", vectors)
+    (tmp_path / "papers.ids.json").write_text(json.dumps(["a", "b", "c", "d"]))
+    (tmp_path / "papers.meta.json").write_text(json.dumps({"distance": "cosine"}))
+
+    engine = LocalExactSearch.from_files(str(tmp_path / "papers"))
+    ids, times = engine.search_ids([[0.0, 0.0, 1.0, 0.1]], k=2)
+
+    assert isinstance(engine.vectors, np.memmap)
+    assert ids == [["c", "d"]]
+    assert len(times) == 1
+
+
+def test_export_named_vector(tmp_path):
+    """A named vector is exported by name, with its own dimension and distance."""
+    client = QdrantClient(":memory:")
+    client.create_collection("papers", vectors_config={
+        "full": models.VectorParams(size=3, distance=models.Distance.COSINE),
+        "reduced": models.VectorParams(size=2, distance=models.Distance.DOT),
+    })
+    client.upsert("papers", points=[
+        models.PointStruct(id=i, vector={"full": [1.0, 0.0, float(i)], "reduced": [float(i), 1.0]}, payload={"id": f"p{i}"})
+        for i in range(5)
+    ])
+
+    assert export_collection_vectors(client, "papers", str(tmp_path / "papers"), batch_size=2, using="reduced") == 5
+
+    engine = LocalExactSearch.from_files(str(tmp_path / "papers"))
+    assert engine.vectors.shape == (5, 2)
+    assert engine.distance == "dot"
+    assert engine.search_ids([[1.0, 0.0]], k=1)[0] == [["p4"]]
+    with pytest.raises(ValueError, match="named vectors"):
+        export_collection_vectors(client, "papers", str(tmp_path / "default"))
+
+
+def test_unsupported_distance_is_rejected():
+    """Metrics without a matrix formulation are refused."""
+    with pytest.raises(ValueError):
+        LocalExactSearch(np.zeros((2, 2), dtype=np.float32), distance="manhattan")
@@ -0,0 +1,184 @@
+import json
+from unittest.mock import MagicMock
+
+import pytest
+from qdrant_client import QdrantClient, models
+
+from qdrant_data_ingestion import DataIngestion, IngestionError, PipelinedUploader
+from qdrant_data_ingestion.data_ingestion import DEFAULT_HNSW_M, DEFAULT_INDEXING_THRESHOLD
+
+
+def write_records(path, n):
+    """Write n records with 2-dim embeddings, one JSON object per line."""
+    path.write_text("\n".join(json.dumps({"id": f"0704.{i:04d}", "embedding": [1.0, float(i)]}) for i in range(n)))
+    return str(path)
+
+
+def hnsw_updates(client):
+    return [call.kwargs["hnsw_config"].m for call in client.update_collection.call_args_list if call.kwargs.get("hnsw_config")]
+
+
+def test_bulk_load_ingests_and_reports_times(tmp_path, monkeypatch):
+    monkeypatch.setattr("qdrant_data_ingestion.data_ingestion.time.sleep", lambda seconds: None)
+    path = write_records(tmp_path / "data.json", 25)
+    ingestion = DataIngestion(batch_size=10)
+    ingestion.client = QdrantClient(":memory:")
+
+    total = ingestion.ingest_data(path, "bulk", vector_size=2, show_progress=False, bulk_load=True,
+                                  bulk_load_on_disk=True)
+
+    assert total == 25
+    assert ingestion.client.count("bulk").count == 25
+    assert ingestion.last_ingestion["points"] == 25
+    assert ingestion.last_ingestion["load_time_s"] >= 0
+    assert ingestion.last_ingestion["index_time_s"] >= 0
+
+
+def test_bulk_load_disables_and_restores_indexing():
+    ingestion = DataIngestion(batch_size=10)
+    ingestion.client = QdrantClient(":memory:")
+    ingestion.create_collection_if_not_exists("bulk", vector_size=2)
+    local = ingestion.client
+    ingestion.client = MagicMock(wraps=local)
+
+    original = ingestion.begin_bulk_load("bulk", on_disk=True)
+    assert hnsw_updates(ingestion.client) == [0]
+    disabled = ingestion.client.update_collection.call_args_list[0].kwargs["optimizers_config"]
+    assert disabled.indexing_threshold == 0
+    assert ingestion.client.update_collection.call_args_list[1].kwargs["vectors_config"][""].on_disk is True
+
+    ingestion.end_bulk_load("bulk", original)
+    assert hnsw_updates(ingestion.client) == [0, 16]
+    restored = ingestion.client.update_collection.call_args_list[-1].kwargs["optimizers_config"]
+    assert restored.indexing_threshold == local.get_collection("bulk").config.optimizer_config.indexing_threshold
+
+
+def test_bulk_load_restores_indexing_after_failed_upload(tmp_path):
+    path = write_records(tmp_path / "data.json", 25)
+    ingestion = DataIngestion(batch_size=10)
+    local = QdrantClient(":memory:")
+    ingestion.client = MagicMock(wraps=local)
+    ingestion.client.upsert.side_effect = RuntimeError("connection reset")
+
+    with pytest.raises(IngestionError):
+        ingestion.ingest_data(path, "bulk", vector_size=2, show_progress=False, bulk_load=True, upload_workers=2)
+
+    assert hnsw_updates(ingestion.client) == [0, 16]
+
+
+def test_bulk_load_restores_indexing_after_sequential_upload_failure(tmp_path):
+    path = write_records(tmp_path / "data.json", 25)
+    ingestion = DataIngestion(batch_size=10)
+    ingestion.client = MagicMock(wraps=QdrantClient(":memory:"))
+    ingestion.client.upsert.side_effect = RuntimeError("connection reset")
+
+    with pytest.raises(RuntimeError):
+        ingestion.ingest_data(path, "bulk", vector_size=2, show_progress=False, bulk_load=True)
+
+    assert hnsw_updates(ingestion.client) == [0, 16]
+
+
+def test_bulk_load_restores_indexing_when_closing_uploader_fails(tmp_path, monkeypatch):
+    path = write_records(tmp_path / "data.json", 25)
+    ingestion = DataIngestion(batch_size=10)
+    ingestion.client = MagicMock(wraps=QdrantClient(":memory:"))
+
+    def close(self):
+        raise IngestionError("upload failed")
+
+    monkeypatch.setattr(PipelinedUploader, "close", close)
+    with pytest.raises(IngestionError):
+        ingestion.ingest_data(path, "bulk", vector_size=2, show_progress=False, bulk_load=True, upload_workers=2)
+
+    assert hnsw_updates(ingestion.client) == [0, 16]
+
+
+def collection_info(status, indexed, points=10, m=16):
+    info = MagicMock(status=status, indexed_vectors_count=indexed, points_count=points, segments_count=1)
+    info.config.params.vectors = models.VectorParams(size=2, distance=models.Distance.COSINE)
+    info.config.hnsw_config.m = m
+    info.config.optimizer_config.indexing_threshold = 0
+    return info
+
+
+def test_end_bulk_load_restores_defaults_for_unset_values():
+    """Unset values are restored explicitly, since None in a diff means 'no change'."""
+    ingestion = DataIngestion(batch_size=10)
+    ingestion.client = MagicMock()
+    ingestion.client.get_collection.return_value.config.hnsw_config.m = None
+    ingestion.client.get_collection.return_value.config.optimizer_config.indexing_threshold = None
+
+    original = ingestion.begin_bulk_load("bulk")
+    ingestion.end_bulk_load("bulk", original)
+    ingestion.end_bulk_load("bulk", {"m": None, "indexing_threshold": None, "on_disk": None})
+
+    for call in ingestion.client.update_collection.call_args_list[1:]:
+        assert call.kwargs["hnsw_config"].m == DEFAULT_HNSW_M
+        assert call.kwargs["optimizers_config"].indexing_threshold == DEFAULT_INDEXING_THRESHOLD
+
+
+def test_wait_for_index_waits_for_optimizer_to_start():
+    """A green collection that has not started indexing yet is not done."""
+    ingestion = DataIngestion(batch_size=10)
+    ingestion.client = MagicMock()
+    ingestion.client.get_collection.side_effect = [
+        collection_info(models.CollectionStatus.GREEN, 0),
+        collection_info(models.CollectionStatus.GREEN, 0),
+        collection_info(models.CollectionStatus.YELLOW, 4),
+    ] + [collection_info(models.CollectionStatus.GREEN, 10)] * 3
+
+    elapsed = ingestion.wait_for_index("bulk", expected_vectors=10, poll_interval=0.01, stable_polls=2,
+                                       show_progress=False)
+
+    assert ingestion.client.get_collection.call_count == 6
+    assert elapsed >= 0.03
+
+
+def test_wait_for_index_accepts_unindexed_small_segment():
+    """A small segment below the indexing threshold stays unindexed, which completes the load anyway."""
+    ingestion = DataIngestion(batch_size=10)
+    ingestion.client = MagicMock()
+
+    def uneven(status, indexed):
+        # A large indexed segment, a small leftover and the appendable segment
+        info = collection_info(status, indexed, points=10000)
+        info.segments_count = 3
+        info.config.optimizer_config.indexing_threshold = 10
+        return info
+
+    ingestion.client.get_collection.side_effect = [
+        uneven(models.CollectionStatus.GREEN, 0),
+        uneven(models.CollectionStatus.YELLOW, 3000),
+    ] + [uneven(models.CollectionStatus.GREEN, 9200)] * 4
+
+    assert DataIngestion.expected_indexed_vectors(uneven(models.CollectionStatus.GREEN, 0)) == 10000
+    elapsed = ingestion.wait_for_index("bulk", timeout=60, poll_interval=0.0, show_progress=False)
+
+    assert ingestion.client.get_collection.call_count == 6
+    assert elapsed < 60
+
+
+def test_wait_for_index_warns_after_timeout(caplog):
+    """A load whose index never settles is reported, not failed."""
+    ingestion = DataIngestion(batch_size=10)
+    ingestion.client = MagicMock()
+    ingestion.client.get_collection.return_value = collection_info(models.CollectionStatus.GREEN, 0)
+
+    elapsed = ingestion.wait_for_index("bulk", expected_vectors=10, timeout=0.05, poll_interval=0.01,
+                                       show_progress=False)
+
+    assert elapsed > 0.05
+    assert "did not settle" in caplog.text
+
+
+def test_expected_indexed_vectors_respects_threshold():
+    info = collection_info(models.CollectionStatus.GREEN, 0, points=100000)
+    info.config.optimizer_config.indexing_threshold = 10
+    assert DataIngestion.expected_indexed_vectors(info) == 100000
+
+    info.config.optimizer_config.indexing_threshold = 20000
+    assert DataIngestion.expected_indexed_vectors(info) == 0
+
+    info.config.optimizer_config.indexing_threshold = 10
+    info.config.hnsw_config.m = 0
+    assert DataIngestion.expected_indexed_vectors(info) == 0
@@ -0,0 +1,83 @@
+from types import SimpleNamespace
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from qdrant_evaluation.collection import monitor_index_build
+
+
+def make_info(status, indexed, segments, points=100):
+    """Build a minimal collection info object."""
+    return SimpleNamespace(status=status, indexed_vectors_count=indexed, points_count=points, segments_count=segments)
+
+
+@patch("qdrant_evaluation.collection.time.sleep")
+def test_monitor_records_progress_and_backs_off(sleep):
+    """Progress samples are recorded and the interval grows only while nothing changes."""
+    client = MagicMock()
+    client.get_collection.side_effect = [
+        make_info("yellow", 0, 4),
+        make_info("yellow", 0, 4),
+        make_info("yellow", 50, 3),
+        make_info("yellow", 50, 3),
+        make_info("green", 100, 2),
+    ]
+
+    metrics = monitor_index_build(client, "test", min_interval=0.1, max_interval=1.0, backoff=2.0)
+
+    assert [call.args[0] for call in sleep.call_args_list] == pytest.approx([0.1, 0.2, 0.1, 0.2])
+    assert len(metrics["build_progress"]) == 5
+    assert metrics["indexed_vectors_count"] == 100
+    assert metrics["segments_count"] == 2
+    assert metrics["max_segments_count"] == 4
+    assert metrics["vectors_indexed_per_s"] == pytest.approx(100 / metrics["build_time_s"])
+
+
+@patch("qdrant_evaluation.collection.now")
+@patch("qdrant_evaluation.collection.time.sleep")
+def test_monitor_waits_for_rebuild_to_start(sleep, fake_now):
+    """A collection still green after an update is timed from the call until the rebuild finished."""
+    fake_now.side_effect = [0.0, 0.0, 1.0, 2.0, 3.0, 6.0]
+    client = MagicMock()
+    client.get_collection.side_effect = [
+        make_info("green", 100, 2),
+        make_info("green", 100, 2),
+        make_info("yellow", 100, 4),
+        # Old segments are swapped out, so the indexed count drops during the rebuild
+        make_info("yellow", 40, 3),
+        make_info("green", 100, 2),
+    ]
+
+    metrics = monitor_index_build(client, "test", start_timeout=10.0)
+
+    assert len(metrics["build_progress"]) == 5
+    assert metrics["build_time_s"] == 6.0
+    assert metrics["vectors_indexed_per_s"] == pytest.approx(100 / 6.0)
+
+
+@patch("qdrant_evaluation.collection.now")
+@patch("qdrant_evaluation.collection.time.sleep")
+def test_monitor_without_build_reports_no_build_time(sleep, fake_now):
+    """A collection that stays green reports no build time instead of a near-zero one."""
+    fake_now.side_effect = [0.0, 0.0, 4.0, 11.0, 20.0, 20.0]
+    client = MagicMock()
+    client.get_collection.return_value = make_info("green", 100, 2)
+
+    metrics = monitor_index_build(client, "test", start_timeout=10.0)
+
+    assert client.get_collection.call_count == 3
+    assert metrics["build_time_s"] is None
+    assert metrics["vectors_indexed_per_s"] is None
+    assert monitor_index_build(client, "test")["build_time_s"] is None
+
+
+@patch("qdrant_evaluation.collection.now")
+@patch("qdrant_evaluation.collection.time.sleep")
+def test_monitor_times_out(sleep, fake_now):
+    """A collection that never turns green raises TimeoutError."""
+    fake_now.side_effect = [0.0, 0.0, 5.0, 11.0]
+    client = MagicMock()
+    client.get_collection.return_value = make_info("yellow", 0, 4)
+
+    with pytest.raises(TimeoutError):
+        monitor_index_build(client, "test", timeout=10)
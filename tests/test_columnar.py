@@ -0,0 +1,115 @@
+import json
+from unittest.mock import MagicMock
+
+import numpy as np
+import pytest
+from qdrant_client import QdrantClient, models
+from qdrant_client.conversions.conversion import RestToGrpc
+
+from qdrant_data_ingestion import DataIngestion, ColumnarBatch, decode_batch, stream_columnar, FULL_VECTOR, REDUCED_VECTOR
+
+
+def records(n):
+    """Records with 4-dim embeddings in two top-level categories."""
+    rng = np.random.default_rng(0)
+    return [
+        {
+            "id": f"0704.{i:04d}",
+            "title": f"Paper {i}",
+            "categories": "hep-th math.AG" if i % 2 else "cs.LG",
+            "embedding": rng.normal(size=4).tolist()
+        }
+        for i in range(n)
+    ]
+
+
+def write_records(path, rows):
+    path.write_text("\n".join(json.dumps(row) for row in rows) + "\n")
+    return str(path)
+
+
+def test_decode_batch_matches_create_point():
+    """Columnar decoding yields the IDs, vectors and payloads of `create_point`."""
+    rows = records(5)
+    batch = decode_batch([json.dumps(row).encode() for row in rows])
+    ingestion = DataIngestion(batch_size=10)
+
+    assert batch.vectors.dtype == np.float32
+    assert batch.vectors.shape == (5, 4)
+    for row, record in enumerate(rows):
+        point = ingestion.create_point(dict(record))
+        assert batch.ids[row] == point.id
+        assert batch.payloads[row] == point.payload
+        np.testing.assert_allclose(batch.vectors[row], point.vector, rtol=1e-6)
+
+
+def test_decode_batch_skips_records_without_embedding():
+    rows = records(3)
+    rows[1]["embedding"] = None
+    batch = decode_batch([json.dumps(row).encode() for row in rows])
+
+    assert len(batch) == 2
+    assert [payload["id"] for payload in batch.payloads] == ["0704.0000", "0704.0002"]
+
+
+def test_stream_columnar_batches(tmp_path):
+    path = write_records(tmp_path / "data.json", records(7))
+    assert [len(batch) for batch in stream_columnar(path, 3)] == [3, 3, 1]
+
+
+def test_columnar_ingest_matches_point_ingest(tmp_path):
+    """Both paths store the same points."""
+    path = write_records(tmp_path / "data.json", records(25))
+    ingestion = DataIngestion(batch_size=10)
+    ingestion.client = QdrantClient(":memory:")
+
+    assert ingestion.ingest_data(path, "points", vector_size=4, show_progress=False) == 25
+    assert ingestion.ingest_data(path, "columns", vector_size=4, show_progress=False, columnar=True) == 25
+
+    def stored(collection_name):
+        points, _ = ingestion.client.scroll(collection_name, limit=100, with_vectors=True)
+        return {point.id: (point.payload, np.round(point.vector, 5).tolist()) for point in points}
+
+    assert stored("columns") == stored("points")
+
+
+def test_columnar_ingest_with_reduced_vectors(tmp_path):
+    path = write_records(tmp_path / "data.json", records(25))
+    ingestion = DataIngestion(batch_size=10)
+    ingestion.client = QdrantClient(":memory:")
+
+    ingestion.ingest_data(path, "reduced", vector_size=4, show_progress=False, columnar=True,
+                          reduced_vector_size=2, pca_sample_size=15, pca_path=str(tmp_path / "reduced.pca.npz"))
+
+    points, _ = ingestion.client.scroll("reduced", limit=100, with_vectors=True)
+    assert len(points) == 25
+    assert all(len(point.vector[FULL_VECTOR]) == 4 and len(point.vector[REDUCED_VECTOR]) == 2 for point in points)
+
+
+def test_upload_batch_splits_columnar_batch_by_category():
+    ingestion = DataIngestion(batch_size=10)
+    ingestion.client = MagicMock()
+    batch = decode_batch([json.dumps(row).encode() for row in records(5)])
+
+    ingestion.upload_batch("sharded", batch, shard_by_category=True)
+
+    calls = {call.kwargs["shard_key_selector"]: call.kwargs["points"] for call in ingestion.client.upsert.call_args_list}
+    assert set(calls) == {"physics", "cs"}
+    assert len(calls["physics"].ids) == 2
+    assert len(calls["cs"].ids) == 3
+    assert isinstance(batch.select([0]), ColumnarBatch)
+
+
+def test_to_batch_serializes_for_rest_and_grpc():
+    """The client serializes list vectors only, which is why `to_batch` converts the matrix."""
+    batch = decode_batch([json.dumps(row).encode() for row in records(3)])
+    points = batch.to_batch()
+
+    assert models.PointsBatch(batch=points).model_dump_json()
+    assert len(RestToGrpc.convert_batch_vector_struct(points.vectors, len(batch))) == 3
+
+    raw = models.Batch.model_construct(ids=batch.ids, vectors=batch.vectors, payloads=batch.payloads)
+    with pytest.raises(Exception):
+        models.PointsBatch(batch=raw).model_dump_json()
+    with pytest.raises(ValueError):
+        RestToGrpc.convert_batch_vector_struct(list(batch.vectors), len(batch))
@@ -0,0 +1,108 @@
+import pytest
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+from qdrant_evaluation import evaluator
+from qdrant_evaluation.timing import LatencyHistogram
+from qdrant_evaluation.evaluator import (
+    evaluate_ann,
+    evaluate_hnsw_ef,
+    get_points_in_batches,
+)
+
+
+def make_point(arxiv_id):
+    """Build a minimal scored point carrying an arXiv ID in its payload."""
+    return SimpleNamespace(id=arxiv_id, payload={"id": arxiv_id})
+
+
+def make_batch_client(ann_ids, exact_ids, server_time=0.004):
+    """
+    Create a mocked client answering REST batch queries.
+
+    Exact searches return `exact_ids`, all other searches return `ann_ids`.
+    """
+    client = MagicMock()
+
+    def query_batch_points(collection_name, query_request_batch):
+        searches = query_request_batch.searches
+        exact = searches[0].params is not None and searches[0].params.exact
+        ids = exact_ids if exact else ann_ids
+        return SimpleNamespace(
+            result=[SimpleNamespace(points=[make_point(i) for i in ids]) for _ in searches],
+            time=server_time,
+        )
+
+    client.http.search_api.query_batch_points.side_effect = query_batch_points
+    return client
+
+
+def test_get_points_in_batches_splits_and_amortizes():
+    """Queries are split into batches and batch times are spread over the queries."""
+    client = make_batch_client(ann_ids=["a", "b"], exact_ids=["a", "b"], server_time=0.008)
+    vectors = [[0.1, 0.2]] * 5
+
+    ids, client_times, server_times = get_points_in_batches(client, "papers", vectors, k=2, batch_size=2)
+
+    assert client.http.search_api.query_batch_points.call_count == 3
+    assert ids == [["a", "b"]] * 5
+    assert len(client_times) == 5
+    assert server_times[:4] == [pytest.approx(0.004)] * 4
+    assert server_times[4] == pytest.approx(0.008)
+
+
+def test_evaluate_ann_batched_reports_precision_and_server_time():
+    """Batched evaluation reports precision against exact search and server latency."""
+    client = make_batch_client(ann_ids=list("abcdefghij"), exact_ids=list("abcdefghxy"))
+    embeddings = {f"query {i}": [0.1, 0.2] for i in range(4)}
+
+    results = evaluate_ann(client, "papers", embeddings, batch_size=2)
+
+    assert results["avg_precision"] == pytest.approx(0.8)
+    assert results["avg_server_time_ms"] == pytest.approx(2.0)
+    assert results["batch_size"] == 2
+    client.query_points.assert_not_called()
+
+
+def test_evaluate_hnsw_ef_batched_computes_ground_truth_once():
+    """Exact search runs once for the whole ef sweep."""
+    client = make_batch_client(ann_ids=list("abcdefghij"), exact_ids=list("abcdefghij"))
+    embeddings = {"query": [0.1, 0.2]}
+
+    results = evaluate_hnsw_ef(client, "papers", embeddings, hnsw_ef_values=[16, 32], batch_size=8)
+
+    assert [r["hnsw_ef"] for r in results] == [16, 32]
+    assert all(r["avg_precision"] == 1.0 for r in results)
+    assert client.http.search_api.query_batch_points.call_count == 3
+
+
+def test_evaluate_ann_uses_local_ground_truth_source():
+    """A local ground truth source replaces exact search on the server."""
+    client = make_batch_client(ann_ids=list("abcdefghij"), exact_ids=list("abcdefghij"))
+    source = MagicMock()
+    source.search_ids.return_value = ([list("abcdefghxy")], [0.001])
+
+    results = evaluate_ann(client, "papers", {"query": [0.1, 0.2]}, batch_size=4, ground_truth_source=source)
+
+    assert results["avg_precision"] == pytest.approx(0.8)
+    assert client.http.search_api.query_batch_points.call_count == 1
+    source.search_ids.assert_called_once()
+
+
+def test_quantization_speedup_ignores_cached_ground_truth_time(monkeypatch):
+    """The speedup compares measured quantized and unquantized search, not ground truth timings."""
+    def measure_search(client, collection_name, vectors, search_params=None, name="query_time", **kwargs):
+        histogram = LatencyHistogram()
+        ignore = search_params.quantization.ignore
+        histogram.record_all([0.004 if ignore else 0.001] * len(vectors))
+        return [["a"]] * len(vectors), histogram, None
+
+    # Cached ground truth reports near-zero query times
+    monkeypatch.setattr(evaluator, "get_ground_truth", lambda *args, **kwargs: ([["a"]], [0.0]))
+    monkeypatch.setattr(evaluator, "_measure_search", measure_search)
+
+    results = evaluator.evaluate_with_quantization(MagicMock(), "papers", {"q": [1.0, 0.0]}, rescore=True, k=1)
+
+    assert results["avg_ground_truth_time_ms"] == 0.0
+    assert results["avg_unquantized_time_ms"] == pytest.approx(4.0, rel=0.02)
+    assert results["speedup_factor"] == pytest.approx(4.0, rel=0.02)
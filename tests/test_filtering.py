@@ -0,0 +1,87 @@
+from unittest.mock import MagicMock
+
+import numpy as np
+import pytest
+from qdrant_client import QdrantClient, models
+
+from qdrant_evaluation.filtering import payload_distribution, selectivity_filters, evaluate_filtered_search
+
+
+def make_collection(points=200, dimension=8):
+    """Create an in-memory collection with arXiv-like categories and update dates."""
+    rng = np.random.default_rng(0)
+    client = QdrantClient(":memory:")
+    client.create_collection("papers", vectors_config=models.VectorParams(size=dimension, distance=models.Distance.COSINE))
+    client.upsert("papers", [
+        models.PointStruct(
+            id=index,
+            vector=rng.standard_normal(dimension).tolist(),
+            payload={
+                "id": f"paper-{index}",
+                # cs.LG on every second paper, math.CO on every tenth
+                "categories": " ".join(["cs.LG"] * (index % 2 == 0) + ["math.CO"] * (index % 10 == 0) + ["stat.ML"]),
+                "update_date": f"{2000 + index // 10}-01-01"
+            }
+        )
+        for index in range(points)
+    ])
+    return client
+
+
+def test_payload_distribution_counts_single_categories():
+    """Space separated categories are counted one by one and dates are sorted."""
+    distribution = payload_distribution(make_collection(), "papers", batch_size=64)
+
+    assert distribution["sampled"] == 200
+    assert distribution["categories"]["cs.LG"] == 100
+    assert distribution["categories"]["math.CO"] == 20
+    assert distribution["update_dates"] == sorted(distribution["update_dates"])
+
+
+def test_selectivity_filters_pick_closest_values():
+    """Category and date filters are chosen to match the target selectivity."""
+    distribution = payload_distribution(make_collection(), "papers")
+
+    filters = selectivity_filters(distribution, [0.5, 0.1])
+
+    assert [(entry["field"], entry["value"]) for entry in filters] == [
+        ("categories", "cs.LG"),
+        ("categories", "math.CO"),
+        ("update_date", "2010-01-01"),
+        ("update_date", "2018-01-01"),
+    ]
+
+
+def test_evaluate_filtered_search_against_filtered_exact_search():
+    """Each bucket reports its exact selectivity and is compared to filtered exact search."""
+    client = make_collection()
+    embeddings = {f"query {index}": vector for index, vector in enumerate(np.eye(8)[:3].tolist())}
+
+    rows = evaluate_filtered_search(client, "papers", embeddings, selectivities=[0.1], k=5)
+
+    assert [row["field"] for row in rows] == ["categories", "update_date"]
+    for row in rows:
+        assert row["selectivity"] == pytest.approx(0.1)
+        assert row["payload_index"] is False
+        # The in-memory client searches exactly, so filtered ANN equals the ground truth
+        assert row["avg_recall_at_5"] == 1.0
+
+
+def test_selectivity_is_counted_again_after_indexing():
+    """Text conditions match differently with a text index, so every index state is counted on its own."""
+    local = make_collection()
+    client = MagicMock(wraps=local)
+    info = local.get_collection("papers")
+    client.get_collection.return_value = info
+
+    def create_payload_index(collection_name, field_name, field_schema, wait=True):
+        info.payload_schema[field_name] = field_schema
+
+    client.create_payload_index.side_effect = create_payload_index
+    embeddings = {"query": np.eye(8)[0].tolist()}
+
+    rows = evaluate_filtered_search(client, "papers", embeddings, selectivities=[0.1], fields=["categories"], k=5,
+                                    create_indexes=True)
+
+    assert [row["payload_index"] for row in rows] == [False, True]
+    assert client.count.call_count == 2
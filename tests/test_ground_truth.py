@@ -0,0 +1,108 @@
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+from qdrant_client import QdrantClient, models
+
+from qdrant_evaluation.ground_truth import GroundTruthCache, collection_fingerprint, query_set_hash
+from qdrant_evaluation.projection import arxiv_point_id
+
+
+class FakeConfig:
+    """Stand-in for pydantic config models exposing model_dump_json."""
+
+    def __init__(self, value):
+        self.value = value
+
+    def model_dump_json(self):
+        return str(self.value)
+
+
+def make_client(points_count=100):
+    """Create a mocked client describing a collection with `points_count` points."""
+    client = MagicMock()
+    client.get_collection.return_value = SimpleNamespace(
+        points_count=points_count,
+        config=SimpleNamespace(
+            params=FakeConfig("size=2,distance=Cosine"),
+            hnsw_config=FakeConfig("m=16"),
+            quantization_config=None,
+        ),
+    )
+    client.scroll.return_value = ([SimpleNamespace(id=1, vector=[0.1, 0.2])], None)
+    return client
+
+
+def test_query_set_hash_depends_on_vectors():
+    """Different query sets produce different hashes."""
+    assert query_set_hash([[0.1, 0.2]]) == query_set_hash([[0.1, 0.2]])
+    assert query_set_hash([[0.1, 0.2]]) != query_set_hash([[0.1, 0.3]])
+
+
+def test_get_or_compute_reuses_cached_results(tmp_path):
+    """A second lookup with the same collection state does not recompute."""
+    cache = GroundTruthCache(cache_dir=str(tmp_path))
+    client = make_client()
+    compute = MagicMock(return_value=([["a", "b"]], [0.5]))
+
+    first = cache.get_or_compute(client, "papers", [[0.1, 0.2]], 2, "exact", compute)
+    second = cache.get_or_compute(client, "papers", [[0.1, 0.2]], 2, "exact", compute)
+
+    assert first == second == ([["a", "b"]], [0.5])
+    assert compute.call_count == 1
+
+
+def test_changed_collection_invalidates_entries(tmp_path):
+    """Changing the collection content recomputes and drops stale entries."""
+    cache = GroundTruthCache(cache_dir=str(tmp_path))
+    compute = MagicMock(return_value=([["a"]], [0.5]))
+
+    cache.get_or_compute(make_client(points_count=100), "papers", [[0.1, 0.2]], 1, "exact", compute)
+    cache.get_or_compute(make_client(points_count=101), "papers", [[0.1, 0.2]], 1, "exact", compute)
+
+    assert compute.call_count == 2
+    assert len(list(tmp_path.glob("papers__exact__*.json"))) == 1
+
+
+def test_fingerprint_detects_changes_beyond_the_first_points():
+    """Vectors updated in place far from the start of the ID space change the fingerprint."""
+    client = QdrantClient(":memory:")
+    client.create_collection("papers", vectors_config=models.VectorParams(size=2, distance=models.Distance.COSINE))
+    points = [models.PointStruct(id=arxiv_point_id(f"0704.{i:04d}"), vector=[1.0, float(i)]) for i in range(2000)]
+    client.upsert("papers", points=points)
+    before = collection_fingerprint(client, "papers")
+    assert collection_fingerprint(client, "papers") == before
+
+    # Every point outside the first page is rewritten, the point count stays the same
+    first_page = {point.id for point in client.scroll("papers", limit=32)[0]}
+    client.upsert("papers", points=[
+        models.PointStruct(id=point.id, vector=[2.0, point.vector[1]]) for point in points if point.id not in first_page
+    ])
+
+    assert collection_fingerprint(client, "papers") != before
+
+
+def test_fingerprint_of_named_vectors():
+    client = QdrantClient(":memory:")
+    client.create_collection("papers", vectors_config={
+        "full": models.VectorParams(size=2, distance=models.Distance.COSINE),
+        "reduced": models.VectorParams(size=1, distance=models.Distance.COSINE)
+    })
+    client.upsert("papers", points=[models.PointStruct(id=1, vector={"full": [1.0, 0.0], "reduced": [1.0]})])
+
+    assert len(collection_fingerprint(client, "papers")) == 64
+
+
+def test_filtered_entries_depend_on_payload_indexes(tmp_path):
+    """A text index changes what text conditions match, so filtered ground truth is recomputed after indexing."""
+    cache = GroundTruthCache(cache_dir=str(tmp_path))
+    client = make_client()
+    client.get_collection.return_value.payload_schema = {}
+    compute = MagicMock(return_value=([["a"]], [0.5]))
+
+    cache.get_or_compute(client, "papers", [[0.1, 0.2]], 1, "exact", compute)
+    cache.get_or_compute(client, "papers", [[0.1, 0.2]], 1, "exact_filter_abc", compute)
+    client.get_collection.return_value.payload_schema = {"categories": FakeConfig("text")}
+    cache.get_or_compute(client, "papers", [[0.1, 0.2]], 1, "exact", compute)
+    cache.get_or_compute(client, "papers", [[0.1, 0.2]], 1, "exact_filter_abc", compute)
+
+    assert compute.call_count == 3
@@ -0,0 +1,64 @@
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+
+from qdrant_evaluation.load_test import run_load_test, search_params_from_setting, summarize_load_test
+
+
+class FakeAsyncClient:
+    """Asynchronous client stub that records how many requests overlap."""
+
+    def __init__(self, ids, delay=0.01):
+        self.ids = ids
+        self.delay = delay
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.calls = 0
+
+    async def query_points(self, collection_name, query, limit, search_params, with_payload=True):
+        self.calls += 1
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        await asyncio.sleep(self.delay)
+        self.in_flight -= 1
+        return SimpleNamespace(points=[SimpleNamespace(payload={"id": i}) for i in self.ids[:limit]])
+
+
+def test_run_load_test_respects_concurrency():
+    """No more than `concurrency` requests are in flight and every query is replayed."""
+    client = FakeAsyncClient(ids=["a", "b"])
+
+    result = asyncio.run(run_load_test(client, "papers", [[0.1]] * 5, k=2, concurrency=3, repeat=2))
+
+    assert client.calls == 10
+    assert client.max_in_flight == 3
+    assert result["errors"] == 0
+    assert result["achieved_qps"] > 0
+    assert all(latency >= 0.01 for latency in result["latencies"])
+
+
+def test_summarize_load_test_reports_percentiles_and_precision():
+    """Latency percentiles are reported in ms and precision uses the ground truth of each query."""
+    load_result = {
+        "achieved_qps": 100.0,
+        "latencies": [0.001 * i for i in range(1, 101)],
+        "result_ids": [["a", "b"]] * 100,
+        "errors": 0,
+    }
+
+    summary = summarize_load_test(load_result, exact_ids=[["a", "b"], ["a", "c"]], k=2)
+
+    assert summary["avg_precision"] == pytest.approx(0.75)
+    assert summary["p50_query_time_ms"] == pytest.approx(50.0, rel=0.01)
+    assert summary["p99_query_time_ms"] == pytest.approx(99.0, rel=0.01)
+    assert summary["max_query_time_ms"] == pytest.approx(100.0)
+
+
+def test_search_params_from_setting():
+    """Settings map to the search parameters of the existing evaluators."""
+    assert search_params_from_setting({}) is None
+    assert search_params_from_setting({"hnsw_ef": 64}).hnsw_ef == 64
+    quantized = search_params_from_setting({"rescore": True})
+    assert quantized.quantization.rescore is True
+    assert quantized.quantization.oversampling == 2.0
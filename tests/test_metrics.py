@@ -0,0 +1,73 @@
+import math
+
+import numpy as np
+import pytest
+
+from qdrant_evaluation.evaluator import precision_k
+from qdrant_evaluation.metrics import compute_metrics, ids_to_matrices, default_cutoffs
+
+
+def test_default_cutoffs():
+    """Cutoffs larger than k are dropped and k itself is always reported."""
+    assert default_cutoffs(10) == [1, 5, 10]
+    assert default_cutoffs(3) == [1, 3]
+    assert default_cutoffs(20) == [1, 5, 10, 20]
+
+
+def test_ids_to_matrices_pads_short_rows():
+    """IDs of any type share integer codes and padded cells never match."""
+    results, truth = ids_to_matrices([["a", "b"]], [["b"]], k=3)
+
+    assert results.shape == truth.shape == (1, 3)
+    assert results[0, 1] == truth[0, 0]
+    assert not (results[0, 2:] == truth[0, 1:]).any()
+
+
+def test_precision_matches_set_definition():
+    """Vectorized precision and precision_k equal the share of exact IDs among the results."""
+    rng = np.random.default_rng(3)
+    result_ids = [list(rng.choice(50, 10, replace=False)) for _ in range(20)]
+    exact_ids = [list(rng.choice(50, 10, replace=False)) for _ in range(20)]
+
+    expected = [len(set(r) & set(e)) / 10 for r, e in zip(result_ids, exact_ids)]
+
+    assert compute_metrics(result_ids, exact_ids, k=10)["avg_precision"] == pytest.approx(sum(expected) / 20)
+    assert [precision_k(set(r), set(e), 10) for r, e in zip(result_ids, exact_ids)] == pytest.approx(expected)
+
+
+def test_padding_never_matches_missing_ids():
+    """A missing ID counts like any other ID and never matches padding."""
+    results, truth = ids_to_matrices([[None]], [[None, "a"]], k=3)
+
+    assert results[0, 0] == truth[0, 0] >= 0
+    assert not np.isin(results[0, 1:], truth[0]).any()
+    assert compute_metrics([["a"]], [[None, "a"]], k=2)["avg_precision"] == pytest.approx(0.5)
+    assert compute_metrics([[None]], [["a"]], k=2)["avg_precision"] == 0.0
+
+
+def test_rank_aware_metrics():
+    """Recall, MRR and nDCG follow the rank of the hits."""
+    metrics = compute_metrics([[9, 1, 2]], [[1, 2, 3]], k=3, per_query=True)
+
+    assert metrics["avg_precision"][0] == pytest.approx(2 / 3)
+    assert metrics["avg_recall_at_1"][0] == 0.0
+    assert metrics["avg_recall_at_3"][0] == pytest.approx(2 / 3)
+    assert metrics["avg_mrr"][0] == pytest.approx(1 / 2)
+
+    discounts = [1 / math.log2(rank + 1) for rank in (1, 2, 3)]
+    assert metrics["avg_ndcg"][0] == pytest.approx((discounts[1] + discounts[2]) / sum(discounts))
+
+
+def test_perfect_results():
+    """Identical result and ground truth lists score 1 on every metric."""
+    ids = [[f"id-{q}-{r}" for r in range(5)] for q in range(4)]
+
+    assert compute_metrics(ids, ids, k=5) == pytest.approx(
+        {"avg_precision": 1.0, "avg_recall_at_1": 1.0, "avg_recall_at_5": 1.0, "avg_mrr": 1.0, "avg_ndcg": 1.0}
+    )
+
+
+def test_mismatched_row_counts_raise():
+    """Result and ground truth lists must cover the same queries."""
+    with pytest.raises(ValueError):
+        compute_metrics([[1]], [[1], [2]], k=1)
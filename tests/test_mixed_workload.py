@@ -0,0 +1,75 @@
+import json
+import threading
+import time
+from unittest.mock import MagicMock, patch
+
+from qdrant_client import QdrantClient, models
+
+from qdrant_data_ingestion import DataIngestion
+from qdrant_evaluation.mixed_workload import evaluate_under_ingestion
+
+
+def write_records(path, n):
+    """Write n records with 2-dim embeddings, one JSON object per line."""
+    path.write_text("\n".join(json.dumps({"id": f"0704.{i:04d}", "embedding": [1.0, float(i)]}) for i in range(n)))
+    return str(path)
+
+
+def test_ingest_data_paces_writes(tmp_path):
+    """Uploads are paced to max_points_per_second."""
+    ingestion = DataIngestion(batch_size=10)
+    ingestion.client = MagicMock()
+    ingestion.client.collection_exists.return_value = True
+
+    start = time.perf_counter()
+    count = ingestion.ingest_data(write_records(tmp_path / "papers.json", 30), "papers", vector_size=2,
+                                  show_progress=False, max_points_per_second=100)
+
+    assert count == 30
+    assert ingestion.client.upsert.call_count == 3
+    assert time.perf_counter() - start >= 0.28
+
+
+def test_ingest_data_stops_on_event(tmp_path):
+    """A set stop event ends the ingestion before any upload."""
+    ingestion = DataIngestion(batch_size=10)
+    ingestion.client = MagicMock()
+    stop = threading.Event()
+    stop.set()
+
+    count = ingestion.ingest_data(write_records(tmp_path / "papers.json", 30), "papers", show_progress=False, stop_event=stop)
+
+    assert count == 0
+    ingestion.client.upsert.assert_not_called()
+
+
+class FakeIngestion:
+    """Ingestion stub writing a fixed number of points per pass until it is stopped."""
+
+    def __init__(self, host, port, prefer_grpc, batch_size):
+        self.batch_size = batch_size
+
+    def ingest_data(self, file_path, collection_name, show_progress, max_points_per_second, stop_event):
+        stop_event.wait(0.01)
+        return self.batch_size
+
+
+@patch("qdrant_evaluation.mixed_workload.DataIngestion", FakeIngestion)
+def test_evaluate_under_ingestion_reports_write_settings():
+    """The idle baseline runs once, every write setting reports its write throughput and search quality."""
+    client = QdrantClient(":memory:")
+    client.create_collection("papers", vectors_config=models.VectorParams(size=2, distance=models.Distance.COSINE))
+    client.upsert("papers", points=[
+        models.PointStruct(id=i, vector=[1.0, i / 10], payload={"id": f"0704.{i:04d}"}) for i in range(20)
+    ])
+
+    results = evaluate_under_ingestion(
+        client, "papers", {"q1": [1.0, 0.5], "q2": [1.0, 1.5]}, "papers.json",
+        write_rates=[0, 100], write_batch_sizes=[8, 16], k=5, repetitions=1, ramp_up=0.0, telemetry_interval=10.0
+    )
+
+    assert [(r["write_rate"], r["write_batch_size"]) for r in results] == [(0, None), (100, 8), (100, 16)]
+    assert results[0]["write_points"] == 0
+    assert all(r["write_points"] > 0 and r["write_throughput_per_s"] > 0 for r in results[1:])
+    assert all(r["avg_precision"] == 1.0 for r in results)
+    assert results[0]["collection_optimizing_share"] == 0.0
@@ -0,0 +1,57 @@
+import threading
+import time
+from unittest.mock import patch, MagicMock
+
+import pytest
+
+from qdrant_evaluation.multi_collection import evaluate_collections
+
+
+class ConcurrencyProbe:
+    """Fake evaluator recording how many evaluations run at the same time."""
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.running = 0
+        self.max_running = 0
+
+    def __call__(self, client, collection_name, embeddings, hnsw_ef_values=None):
+        with self.lock:
+            self.running += 1
+            self.max_running = max(self.max_running, self.running)
+        time.sleep(0.05)
+        with self.lock:
+            self.running -= 1
+        if collection_name == "broken":
+            raise RuntimeError("collection not found")
+        return [{"hnsw_ef": ef, "avg_precision": 0.9, "avg_query_time_ms": 1.0} for ef in hnsw_ef_values]
+
+
+@patch("qdrant_evaluation.multi_collection.get_client", return_value=MagicMock())
+def test_serial_isolation_runs_one_at_a_time(get_client):
+    """Serial mode never overlaps evaluations and merges all rows in collection order."""
+    probe = ConcurrencyProbe()
+
+    df = evaluate_collections(["a", "b", "c"], {}, evaluator=probe, hnsw_ef_values=[16, 32])
+
+    assert probe.max_running == 1
+    assert df["collection"].tolist() == ["a", "a", "b", "b", "c", "c"]
+    assert get_client.call_count == 3
+
+
+@patch("qdrant_evaluation.multi_collection.get_client", return_value=MagicMock())
+def test_parallel_isolation_respects_cap_and_skips_failures(get_client):
+    """Parallel mode overlaps up to max_workers evaluations and leaves out failed collections."""
+    probe = ConcurrencyProbe()
+
+    df = evaluate_collections(["a", "broken", "b", "c"], {}, evaluator=probe, isolation="parallel",
+                              max_workers=2, hnsw_ef_values=[16])
+
+    assert probe.max_running == 2
+    assert df["collection"].tolist() == ["a", "b", "c"]
+
+
+def test_unknown_isolation_mode():
+    """Only serial and parallel isolation are supported."""
+    with pytest.raises(ValueError):
+        evaluate_collections(["a"], {}, isolation="random")
@@ -0,0 +1,91 @@
+import json
+import threading
+import time
+from unittest.mock import MagicMock
+
+import pytest
+from qdrant_client import QdrantClient
+
+from qdrant_data_ingestion import DataIngestion, PipelinedUploader, IngestionError
+
+
+def write_records(path, n):
+    """Write n records with 2-dim embeddings, one JSON object per line."""
+    path.write_text("\n".join(json.dumps({"id": f"0704.{i:04d}", "embedding": [1.0, float(i)]}) for i in range(n)))
+    return str(path)
+
+
+def test_uploader_applies_backpressure_and_concurrency():
+    """No more than queue_size batches wait and up to `workers` uploads run at once."""
+    lock = threading.Lock()
+    state = {"running": 0, "max_running": 0, "max_queued": 0}
+    uploaded = []
+
+    def upload(batch):
+        with lock:
+            state["running"] += 1
+            state["max_running"] = max(state["max_running"], state["running"])
+        time.sleep(0.02)
+        with lock:
+            state["running"] -= 1
+            uploaded.extend(batch)
+
+    uploader = PipelinedUploader(upload, workers=3, queue_size=2)
+    for i in range(12):
+        uploader.submit([i])
+        state["max_queued"] = max(state["max_queued"], uploader.queue.qsize())
+    errors = uploader.close()
+
+    assert errors == []
+    assert sorted(uploaded) == list(range(12))
+    assert state["max_running"] == 3
+    assert state["max_queued"] <= 2
+
+
+def test_uploader_reports_errors_in_submission_order():
+    """Failed batches are returned sorted by their position in the stream."""
+    def upload(batch):
+        time.sleep(0.03 if batch[0] == 1 else 0.0)
+        if batch[0] in (1, 3):
+            raise RuntimeError(f"batch {batch[0]}")
+
+    uploader = PipelinedUploader(upload, workers=2, queue_size=4)
+    for i in range(5):
+        uploader.submit([i])
+    errors = uploader.close()
+
+    assert [error.index for error in errors] == [1, 3]
+    assert str(errors[0].error) == "batch 1"
+    assert uploader.failed.is_set()
+
+
+def test_pipelined_ingestion_uploads_without_waiting_and_verifies(tmp_path):
+    """Pipelined ingestion upserts with wait=False and reads back the last point of every batch."""
+    ingestion = DataIngestion(batch_size=10)
+    ingestion.client = QdrantClient(":memory:")
+    upsert = MagicMock(wraps=ingestion.client.upsert)
+    ingestion.client.upsert = upsert
+
+    count = ingestion.ingest_data(write_records(tmp_path / "papers.json", 45), "papers", vector_size=2,
+                                  show_progress=False, upload_workers=3, queue_size=2)
+
+    assert count == 45
+    assert ingestion.client.count("papers").count == 45
+    assert upsert.call_count == 5
+    assert all(call.kwargs["wait"] is False for call in upsert.call_args_list)
+
+
+def test_pipelined_ingestion_raises_on_failed_batches(tmp_path):
+    """Upload failures stop the ingestion and surface as IngestionError."""
+    ingestion = DataIngestion(batch_size=10)
+    ingestion.client = MagicMock()
+    ingestion.client.upsert.side_effect = ConnectionError("server unavailable")
+
+    with pytest.raises(IngestionError) as excinfo:
+        ingestion.ingest_data(write_records(tmp_path / "papers.json", 100), "papers", vector_size=2,
+                              show_progress=False, upload_workers=2, queue_size=1)
+
+    indexes = [error.index for error in excinfo.value.errors]
+    assert indexes == sorted(indexes) and indexes[0] == 0
+    assert len(indexes) < 10
+    ingestion.client.retrieve.assert_not_called()
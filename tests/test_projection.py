@@ -0,0 +1,89 @@
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+import pytest
+from qdrant_client import QdrantClient, models
+
+from qdrant_evaluation.evaluator import get_search_points, get_batch_points
+from qdrant_evaluation.projection import (
+    ID_PAYLOAD,
+    PointIdLookup,
+    register_id_lookup,
+    id_lookup,
+    search_payload,
+    result_ids,
+    arxiv_point_id
+)
+
+
+@pytest.fixture
+def collection():
+    """Local collection with points ingested like `DataIngestion` does."""
+    client = QdrantClient(":memory:")
+    client.create_collection("papers", vectors_config=models.VectorParams(size=2, distance=models.Distance.COSINE))
+    client.upsert("papers", points=[
+        models.PointStruct(id=arxiv_point_id(arxiv_id), vector=vector, payload={"id": arxiv_id, "abstract": "x" * 1000})
+        for arxiv_id, vector in (("0704.0001", [1.0, 0.0]), ("0704.0002", [0.0, 1.0]), ("0704.0003", [0.7, 0.7]))
+    ])
+    return client
+
+
+def test_search_requests_only_id_payload_without_lookup(collection):
+    """Without a lookup only the 'id' field is fetched and used."""
+    assert search_payload(collection, "papers") == ID_PAYLOAD
+
+    ids, _ = get_search_points(collection, "papers", [1.0, 0.1], k=2)
+
+    assert ids == ["0704.0001", "0704.0003"]
+
+
+def test_search_with_lookup_fetches_no_payload(collection):
+    """A registered lookup disables payloads and yields the same IDs."""
+    lookup = PointIdLookup.build(collection, "papers", batch_size=2)
+    register_id_lookup(collection, "papers", lookup)
+
+    assert search_payload(collection, "papers") is False
+    points = collection.query_points("papers", query=[1.0, 0.1], limit=2, with_payload=search_payload(collection, "papers")).points
+    assert all(not point.payload for point in points)
+
+    ids, _, _ = get_batch_points(collection, "papers", [[1.0, 0.1], [0.1, 1.0]], k=2)
+    assert ids == [["0704.0001", "0704.0003"], ["0704.0002", "0704.0003"]]
+
+
+def test_lookup_is_scoped_to_client_and_block(collection):
+    """Registrations neither leak to other clients nor outlive an `id_lookup` block."""
+    other = QdrantClient(":memory:")
+    lookup = PointIdLookup.from_arxiv_ids(["0704.0001"])
+
+    with id_lookup(collection, "papers", lookup):
+        assert search_payload(collection, "papers") is False
+        assert search_payload(other, "papers") == ID_PAYLOAD
+        with id_lookup(collection, "papers", None):
+            assert search_payload(collection, "papers") == ID_PAYLOAD
+        assert search_payload(collection, "papers") is False
+
+    assert search_payload(collection, "papers") == ID_PAYLOAD
+
+
+def test_from_arxiv_ids_matches_scrolled_lookup(collection):
+    """Point IDs derived from arXiv IDs match the IDs stored in the collection."""
+    built = PointIdLookup.build(collection, "papers")
+    derived = PointIdLookup.from_arxiv_ids(["0704.0001", "0704.0002", "0704.0003"])
+
+    assert derived.mapping == built.mapping
+    assert derived.resolve(["unknown"]) == ["unknown"]
+
+
+def test_for_collection_caches_lookup(tmp_path):
+    """The lookup is built once and then loaded from disk."""
+    client = MagicMock()
+    client.scroll.return_value = ([SimpleNamespace(id=1, payload={"id": "0704.0001"})], None)
+
+    with pytest.MonkeyPatch.context() as patch:
+        patch.setattr("qdrant_evaluation.projection.collection_fingerprint", lambda client, name: "abc")
+        first = PointIdLookup.for_collection(client, "papers", cache_dir=str(tmp_path))
+        second = PointIdLookup.for_collection(client, "papers", cache_dir=str(tmp_path))
+
+    assert client.scroll.call_count == 1
+    assert first.mapping == second.mapping == {"1": "0704.0001"}
+    assert result_ids(client, "other", [SimpleNamespace(id=1, payload={"id": "x"})]) == ["x"]
@@ -0,0 +1,77 @@
+from types import SimpleNamespace
+from unittest.mock import MagicMock, patch
+
+import pytest
+from qdrant_client import models
+
+from qdrant_evaluation.quantization import evaluate_quantization_configs, quantized_vector_bytes
+from qdrant_evaluation.timing import LatencyHistogram
+
+
+def fake_measure(client, collection_name, vectors, search_params=None, **kwargs):
+    """Unquantized search takes 4 ms, quantized search 1 ms."""
+    histogram = LatencyHistogram()
+    histogram.record(0.004 if search_params is None else 0.001)
+    return [["a"]], histogram, None
+
+
+def test_quantized_vector_bytes():
+    """Scalar keeps a byte per dimension, binary a bit, product divides by its ratio."""
+    assert quantized_vector_bytes(10, 1536, None) == 0
+    assert quantized_vector_bytes(10, 1536, {"type": "scalar"}) == 10 * 1536
+    assert quantized_vector_bytes(10, 1536, {"type": "binary"}) == 10 * 1536 / 8
+    assert quantized_vector_bytes(10, 1536, {"type": "product", "compression": "x32"}) == 10 * 1536 * 4 / 32
+
+
+@patch("qdrant_evaluation.quantization.wait_for_collection_green")
+@patch("qdrant_evaluation.quantization.get_ground_truth", return_value=([["a"]], [0.01]))
+@patch("qdrant_evaluation.quantization._measure_search", side_effect=fake_measure)
+def test_quantization_grid_reports_speedup_and_ram_reduction(measure, ground_truth, wait):
+    """Every config is applied, searched over the grid and the original config restored."""
+    client = MagicMock()
+    client.get_collection.return_value = SimpleNamespace(
+        points_count=1000,
+        config=SimpleNamespace(
+            quantization_config=None,
+            params=SimpleNamespace(vectors=SimpleNamespace(size=1536)),
+        ),
+    )
+
+    results = evaluate_quantization_configs(
+        client, "papers", {"query": [0.1]},
+        quantization_settings=[{"type": "scalar", "always_ram": True}, {"type": "binary"}],
+        oversampling_values=[1.0, 2.0],
+        rescore_values=[True],
+    )
+
+    assert [row["quantization"] for row in results] == ["none", "scalar_ram", "scalar_ram", "binary", "binary"]
+    assert results[1]["speedup_factor"] == pytest.approx(4.0, rel=0.02)
+    assert results[1]["est_ram_reduction_factor"] == pytest.approx(4.0)
+    assert results[3]["est_ram_reduction_factor"] == pytest.approx(32.0)
+    assert client.update_collection.call_args_list[-1].kwargs["quantization_config"] == models.Disabled.DISABLED
+
+
+@patch("qdrant_evaluation.quantization.wait_for_collection_green")
+@patch("qdrant_evaluation.quantization.get_ground_truth", return_value=([["a"]], [0.01]))
+@patch("qdrant_evaluation.quantization._measure_search", side_effect=fake_measure)
+def test_quantization_grid_resolves_named_vector(measure, ground_truth, wait):
+    """On named-vector collections the searched vector is resolved by name."""
+    client = MagicMock()
+    client.get_collection.return_value = SimpleNamespace(
+        points_count=1000,
+        config=SimpleNamespace(
+            quantization_config=None,
+            params=SimpleNamespace(vectors={"full": SimpleNamespace(size=1536), "reduced": SimpleNamespace(size=256)}),
+        ),
+    )
+
+    results = evaluate_quantization_configs(
+        client, "papers", {"query": [0.1]}, quantization_settings=[{"type": "scalar"}],
+        oversampling_values=[1.0], rescore_values=[True], using="reduced"
+    )
+
+    assert results[0]["est_vector_ram_mb"] == pytest.approx(1000 * 256 * 4 / 2 ** 20)
+    assert all(call.kwargs["using"] == "reduced" for call in measure.call_args_list)
+    assert ground_truth.call_args.kwargs["using"] == "reduced"
+    with pytest.raises(ValueError, match="named vectors"):
+        evaluate_quantization_configs(client, "papers", {"query": [0.1]})
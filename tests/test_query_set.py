@@ -0,0 +1,63 @@
+import json
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+import numpy as np
+import pytest
+
+from qdrant_evaluation.evaluator import evaluate_ann
+from qdrant_evaluation.query_set import QuerySet, convert_json_query_set, query_vectors, store_ground_truth
+
+
+def write_query_set(embeddings, tmp_path, path):
+    """Write embeddings to a JSON file and convert it to a query set."""
+    json_path = tmp_path / "source.json"
+    json_path.write_text(json.dumps(embeddings))
+    return convert_json_query_set(str(json_path), path)
+
+
+def test_convert_json_roundtrip(tmp_path):
+    """A converted JSON query set is memory-mapped and keeps texts and vectors."""
+    embeddings = {"first query": [0.1, 0.2, 0.3], "second query": [0.4, 0.5, 0.6]}
+    json_path = tmp_path / "queries.json"
+    json_path.write_text(json.dumps(embeddings))
+
+    convert_json_query_set(str(json_path), str(tmp_path / "queries"))
+    query_set = QuerySet.load(str(tmp_path / "queries"))
+
+    assert isinstance(query_set.vectors, np.memmap)
+    assert query_set.vectors.dtype == np.float32
+    assert list(query_set) == list(embeddings)
+    np.testing.assert_allclose(query_set["second query"], embeddings["second query"], rtol=1e-6)
+    assert query_vectors(query_set) is query_set.vectors
+
+
+def test_stored_ground_truth_serves_as_source(tmp_path):
+    """Stored ground truth is returned for any k up to the stored k."""
+    path = str(tmp_path / "queries")
+    write_query_set({"a": [1.0, 0.0], "b": [0.0, 1.0]}, tmp_path, path)
+    store_ground_truth(path, [["x", "y", "z"], ["y", "z", "x"]], "arxiv_papers")
+
+    query_set = QuerySet.load(path)
+    ids, times = query_set.search_ids(query_set.vectors, k=2)
+
+    assert ids == [["x", "y"], ["y", "z"]]
+    assert times == [0.0, 0.0]
+    with pytest.raises(ValueError):
+        query_set.search_ids(query_set.vectors, k=4)
+
+
+def test_evaluators_accept_query_set(tmp_path):
+    """Evaluators search the memory-mapped rows of a query set directly."""
+    path = str(tmp_path / "queries")
+    write_query_set({"a": [1.0, 0.0], "b": [0.0, 1.0]}, tmp_path, path)
+    query_set = QuerySet.load(path)
+
+    client = MagicMock()
+    client.query_points.return_value = SimpleNamespace(points=[SimpleNamespace(payload={"id": "x"})])
+
+    results = evaluate_ann(client, "test", query_set)
+
+    assert client.query_points.call_count == 4
+    assert isinstance(client.query_points.call_args.kwargs["query"], np.ndarray)
+    assert results["avg_precision"] == pytest.approx(0.1)
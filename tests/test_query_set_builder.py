@@ -0,0 +1,104 @@
+import threading
+import time
+from types import SimpleNamespace
+
+import httpx
+import numpy as np
+import openai
+import pytest
+from qdrant_client import QdrantClient, models
+
+from qdrant_evaluation.query_set import QuerySet
+from qdrant_evaluation.query_set_builder import EmbeddingCache, embed_texts, build_query_set, sample_query_set
+
+
+class FakeEmbeddings:
+    """Embeddings endpoint stub recording batches and overlapping requests."""
+
+    def __init__(self, failures=0):
+        self.batches = []
+        self.failures = failures
+        self.lock = threading.Lock()
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    def create(self, input, model):
+        with self.lock:
+            if self.failures:
+                self.failures -= 1
+                response = httpx.Response(429, headers={"retry-after": "0"}, request=httpx.Request("POST", "http://test"))
+                raise openai.RateLimitError("rate limited", response=response, body=None)
+            self.batches.append(list(input))
+            self.in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        time.sleep(0.02)
+        with self.lock:
+            self.in_flight -= 1
+        # Returned out of order, as the API allows
+        data = [SimpleNamespace(index=i, embedding=[float(len(text)), 1.0]) for i, text in enumerate(input)]
+        return SimpleNamespace(data=data[::-1])
+
+
+def test_embed_texts_batches_with_bounded_concurrency():
+    """Texts are embedded in batches, in input order, with at most max_concurrency requests in flight."""
+    embeddings = FakeEmbeddings()
+    texts = [f"query {'x' * i}" for i in range(10)] + ["query "]
+
+    vectors = embed_texts(texts, batch_size=3, max_concurrency=2, client=SimpleNamespace(embeddings=embeddings))
+
+    assert vectors.dtype == np.float32
+    assert vectors.shape == (11, 2)
+    assert vectors[:, 0].tolist() == [float(len(text)) for text in texts]
+    assert len(embeddings.batches) == 4
+    assert embeddings.max_in_flight <= 2
+
+
+def test_embed_texts_retries_rate_limits():
+    """Rate-limited requests are retried until they succeed."""
+    embeddings = FakeEmbeddings(failures=2)
+
+    vectors = embed_texts(["a", "bb"], backoff=0.0, client=SimpleNamespace(embeddings=embeddings))
+
+    assert vectors[:, 0].tolist() == [1.0, 2.0]
+    assert embeddings.batches == [["a", "bb"]]
+
+
+def test_build_query_set_uses_cache(tmp_path):
+    """A rebuilt query set is served from the cache without embedding requests."""
+    cache_dir = str(tmp_path / "cache")
+    first = FakeEmbeddings()
+    query_set = build_query_set(str(tmp_path / "queries"), ["a", "bb", "a"], cache_dir=cache_dir,
+                                client=SimpleNamespace(embeddings=first))
+
+    second = FakeEmbeddings()
+    rebuilt = build_query_set(str(tmp_path / "rebuilt"), ["bb", "a"], cache_dir=cache_dir,
+                              client=SimpleNamespace(embeddings=second))
+
+    assert list(query_set) == ["a", "bb"]
+    assert isinstance(QuerySet.load(str(tmp_path / "queries")), QuerySet)
+    assert second.batches == []
+    np.testing.assert_array_equal(rebuilt["a"], query_set["a"])
+    assert EmbeddingCache(cache_dir).get("other-model", "a") is None
+
+
+def test_sample_query_set_holds_out_points(tmp_path):
+    """Sampled vectors become queries named by their 'id' payload and are left out of a copy of the collection."""
+    client = QdrantClient(":memory:")
+    client.create_collection("papers", vectors_config=models.VectorParams(size=2, distance=models.Distance.DOT))
+    client.upsert("papers", points=[
+        models.PointStruct(id=i, vector=[float(i), 1.0], payload={"id": f"0704.{i:04d}"}) for i in range(10)
+    ])
+
+    query_set = sample_query_set(client, "papers", str(tmp_path / "sampled"), n_queries=3,
+                                 hold_out_collection="papers_held_out")
+
+    assert len(query_set) == 3
+    for text in query_set:
+        assert query_set[text].tolist() == [float(int(text[-4:])), 1.0]
+    assert client.count("papers").count == 10
+    remaining, _ = client.scroll("papers_held_out", limit=100)
+    assert len(remaining) == 7
+    assert not {point.payload["id"] for point in remaining} & set(query_set)
+
+    with pytest.raises(ValueError):
+        sample_query_set(client, "papers", str(tmp_path / "again"), hold_out_collection="papers")
@@ -0,0 +1,154 @@
+import json
+import sqlite3
+from unittest.mock import MagicMock
+
+import pytest
+from qdrant_client import QdrantClient, models
+
+from qdrant_evaluation import benchmark
+from qdrant_evaluation.benchmark import load_config, benchmark_settings
+from qdrant_evaluation.cli import main, _resolve_runs
+from qdrant_evaluation.results_store import ResultsStore, compare_runs
+
+
+def make_row(setting, precision, p99):
+    """Build a stored result row for one search setting."""
+    return {"collection": "papers", "setting": setting, "avg_precision": precision,
+            "avg_recall_at_1": precision, "avg_query_time_ms": p99 / 2, "p99_query_time_ms": p99}
+
+
+def save_runs(store):
+    """Store a baseline run and a candidate with a precision drop and a latency regression."""
+    store.save_run("base", "bench", "2024-01-01T00:00:00", {}, {"qdrant_version": "1.9.0"},
+                   [make_row({}, 0.9, 10.0), make_row({"hnsw_ef": 64}, 0.95, 20.0)])
+    store.save_run("cand", "bench", "2024-01-02T00:00:00", {}, {"qdrant_version": "1.10.0"},
+                   [make_row({}, 0.85, 10.0), make_row({"hnsw_ef": 64}, 0.95, 30.0)])
+
+
+def test_store_roundtrip(tmp_path):
+    """Runs keep their environment and results and are listed most recent first."""
+    store = ResultsStore(str(tmp_path / "results.sqlite"))
+    save_runs(store)
+
+    assert store.list_runs()["run_id"].tolist() == ["cand", "base"]
+    assert store.get_run("base")["environment"] == {"qdrant_version": "1.9.0"}
+    results = store.load_results("base")
+    assert set(results["setting"]) == {"{}", '{"hnsw_ef": 64}'}
+    with pytest.raises(KeyError):
+        store.get_run("missing")
+
+
+def test_compare_runs_flags_regressions(tmp_path):
+    """Quality drops and latency increases beyond the thresholds are flagged per setting."""
+    store = ResultsStore(str(tmp_path / "results.sqlite"))
+    save_runs(store)
+
+    comparison = compare_runs(store, "base", "cand").set_index("setting")
+
+    assert comparison.loc["{}", "avg_precision_delta"] == pytest.approx(-0.05)
+    assert comparison.loc["{}", "regressions"] == ["avg_precision", "avg_recall_at_1"]
+    assert comparison.loc['{"hnsw_ef": 64}', "regressions"] == ["avg_query_time_ms", "p99_query_time_ms"]
+
+    relaxed = compare_runs(store, "base", "cand", quality_threshold=0.1, latency_threshold=1.0)
+    assert not relaxed["regression"].any()
+
+
+def test_cli_compare_exit_code(tmp_path, capsys):
+    """The compare command defaults to the two latest runs and fails on regressions."""
+    path = str(tmp_path / "results.sqlite")
+    save_runs(ResultsStore(path))
+
+    assert main(["--store", path, "compare"]) == 1
+    assert "Comparing cand against base" in capsys.readouterr().out
+    assert main(["--store", path, "compare", "base", "cand", "--quality-threshold", "0.1", "--latency-threshold", "1"]) == 0
+
+
+def test_resolve_runs_never_compares_a_run_with_itself(tmp_path):
+    """A single given run is compared with the most recent other run."""
+    store = ResultsStore(str(tmp_path / "results.sqlite"))
+    save_runs(store)
+    store.save_run("next", "bench", "2024-01-03T00:00:00", {}, {}, [make_row({}, 0.9, 10.0)])
+
+    assert _resolve_runs(store, None, None) == ["cand", "next"]
+    assert _resolve_runs(store, "base", None) == ["base", "next"]
+    assert _resolve_runs(store, "next", None) == ["next", "cand"]
+    assert _resolve_runs(store, None, "cand") == ["next", "cand"]
+    assert _resolve_runs(store, None, "next") == ["cand", "next"]
+
+    single = ResultsStore(str(tmp_path / "single.sqlite"))
+    single.save_run("only", "bench", "2024-01-01T00:00:00", {}, {}, [make_row({}, 0.9, 10.0)])
+    with pytest.raises(ValueError):
+        _resolve_runs(single, "only", None)
+
+
+def test_config_defaults_and_settings(tmp_path):
+    """Configurations are completed with defaults and expanded into search settings."""
+    path = tmp_path / "bench.json"
+    path.write_text(json.dumps({"collections": ["papers"], "hnsw_ef": [32, 64], "quantization": [{"rescore": True}]}))
+
+    config = load_config(str(path))
+
+    assert config["k"] == 10
+    assert benchmark_settings(config) == [{}, {"hnsw_ef": 32}, {"hnsw_ef": 64}, {"rescore": True}]
+
+    path.write_text(json.dumps({"collections": []}))
+    with pytest.raises(ValueError):
+        load_config(str(path))
+
+
+def test_compare_runs_reports_unmatched_rows(tmp_path):
+    """Rows found in one run only are kept; a row missing from the candidate is a regression."""
+    store = ResultsStore(str(tmp_path / "results.sqlite"))
+    store.save_run("base", "bench", "2024-01-01T00:00:00", {}, {},
+                   [make_row({}, 0.9, 10.0), make_row({"hnsw_ef": 64}, 0.95, 20.0)])
+    store.save_run("cand", "bench", "2024-01-02T00:00:00", {}, {},
+                   [make_row({}, 0.9, 10.0), make_row({"hnsw_ef": 128}, 0.97, 25.0)])
+
+    comparison = compare_runs(store, "base", "cand").set_index("setting")
+
+    assert comparison.loc["{}", "match"] == "matched"
+    assert comparison.loc['{"hnsw_ef": 64}', "match"] == "baseline_only"
+    assert comparison.loc['{"hnsw_ef": 64}', "regressions"] == ["missing_in_candidate"]
+    assert comparison.loc['{"hnsw_ef": 128}', "match"] == "candidate_only"
+    assert not comparison.loc['{"hnsw_ef": 128}', "regression"]
+    assert not comparison.loc["{}", "regression"]
+
+
+def test_store_closes_connections(tmp_path, monkeypatch):
+    connections = []
+    connect = sqlite3.connect
+
+    def tracking_connect(*args, **kwargs):
+        connections.append(connect(*args, **kwargs))
+        return connections[-1]
+
+    monkeypatch.setattr(sqlite3, "connect", tracking_connect)
+    store = ResultsStore(str(tmp_path / "results.sqlite"))
+    save_runs(store)
+    store.list_runs()
+
+    assert len(connections) == 4
+    for connection in connections:
+        with pytest.raises(sqlite3.ProgrammingError):
+            connection.execute("SELECT 1")
+
+
+def test_run_benchmark_stores_collection_quantization(tmp_path, monkeypatch):
+    """Result rows record how the collection is quantized, not only the search-time parameters."""
+    local = QdrantClient(":memory:")
+    local.create_collection("papers", vectors_config=models.VectorParams(size=2, distance=models.Distance.COSINE))
+    local.upsert("papers", points=[models.PointStruct(id=i, vector=[1.0, float(i)], payload={"id": str(i)}) for i in range(5)])
+    # The local client does not keep quantization configs, report one like a server would
+    info = local.get_collection("papers")
+    info.config.quantization_config = models.ScalarQuantization(scalar=models.ScalarQuantizationConfig(type=models.ScalarType.INT8))
+    client = MagicMock(wraps=local)
+    client.get_collection.return_value = info
+    monkeypatch.setattr(benchmark, "get_client", lambda **kwargs: client)
+    queries = tmp_path / "queries.json"
+    queries.write_text(json.dumps({"q": [1.0, 2.0]}))
+
+    config = {**benchmark.DEFAULT_CONFIG, "collections": ["papers"], "query_set": str(queries),
+              "k": 2, "ground_truth_cache": None}
+    _, results = benchmark.run_benchmark(config, ResultsStore(str(tmp_path / "results.sqlite")))
+
+    assert results[0]["quantization_config"]["scalar"]["type"] == "int8"
@@ -0,0 +1,82 @@
+import json
+from unittest.mock import MagicMock
+
+from qdrant_client import QdrantClient, models
+
+from qdrant_data_ingestion import DataIngestion, primary_category, CATEGORY_SHARD_KEYS
+from qdrant_evaluation.projection import arxiv_point_id
+from qdrant_evaluation.sharding import evaluate_shard_routing, infer_query_shard_keys
+
+
+def test_primary_category_groups_archives():
+    """The first category decides the shard key, physics archives share one key."""
+    assert primary_category("cs.LG stat.ML") == "cs"
+    assert primary_category("hep-th math.QA") == "physics"
+    assert primary_category("math.CO") == "math"
+    assert primary_category("unknown.XY") == "other"
+    assert primary_category(None) == "other"
+
+
+def test_ingestion_creates_shard_keys_and_routes_points():
+    """A category-sharded collection gets every shard key and points are upserted per shard."""
+    ingestion = DataIngestion(batch_size=10)
+    ingestion.client = MagicMock()
+    ingestion.client.collection_exists.return_value = False
+
+    ingestion.create_collection_if_not_exists("papers", vector_size=2, shard_keys=CATEGORY_SHARD_KEYS)
+    assert ingestion.client.create_collection.call_args.kwargs["sharding_method"] == models.ShardingMethod.CUSTOM
+    assert ingestion.client.create_shard_key.call_count == len(CATEGORY_SHARD_KEYS)
+
+    batch = [
+        ingestion.create_point({"id": "1", "embedding": [1.0, 0.0], "categories": "cs.AI"}),
+        ingestion.create_point({"id": "2", "embedding": [0.0, 1.0], "categories": "quant-ph"}),
+        ingestion.create_point({"id": "3", "embedding": [1.0, 1.0], "categories": "cs.LG"}),
+    ]
+    ingestion.upload_batch("papers", batch, shard_by_category=True)
+
+    uploads = {call.kwargs["shard_key_selector"]: len(call.kwargs["points"]) for call in ingestion.client.upsert.call_args_list}
+    assert uploads == {"cs": 2, "physics": 1}
+
+
+def test_pipelined_sharded_ingestion_verifies_every_shard(tmp_path):
+    """Every shard upsert of a batch is verified, not only the shard of the last point."""
+    path = tmp_path / "papers.json"
+    categories = ["cs.AI", "quant-ph", "cs.LG", "math.CO"]
+    path.write_text("\n".join(json.dumps({"id": f"0704.{i:04d}", "embedding": [1.0, float(i)], "categories": category})
+                              for i, category in enumerate(categories)))
+    ingestion = DataIngestion(batch_size=10)
+    ingestion.client = MagicMock()
+    ingestion.verify_points = MagicMock()
+
+    ingestion.ingest_data(str(path), "papers", vector_size=2, show_progress=False, upload_workers=2,
+                          shard_by_category=True)
+
+    verified = ingestion.verify_points.call_args.args[1]
+    expected = [ingestion.create_point({"id": f"0704.{i:04d}", "embedding": [1.0, 0.0]}).id for i in (2, 1, 3)]
+    assert verified == expected
+    assert ingestion.client.upsert.call_count == 3
+
+
+def test_infer_query_shard_keys_uses_majority():
+    """Queries are routed to the shard of most of their exact neighbours."""
+    shard_keys = {"a": "cs", "b": "cs", "c": "math"}
+    assert infer_query_shard_keys([["a", "c", "b"], ["c"], []], shard_keys) == ["cs", "math", "other"]
+
+
+def test_evaluate_shard_routing_reports_both_modes():
+    """Fan-out and routed rows are reported with the recall ceiling of the routing."""
+    client = QdrantClient(":memory:")
+    client.create_collection("papers", vectors_config=models.VectorParams(size=2, distance=models.Distance.COSINE))
+    client.upsert("papers", points=[
+        models.PointStruct(id=arxiv_point_id(f"0704.{i:04d}"), vector=[1.0, i / 10],
+                           payload={"id": f"0704.{i:04d}", "categories": "cs.LG" if i < 15 else "math.CO"})
+        for i in range(20)
+    ])
+
+    results = evaluate_shard_routing(client, "papers", {"q1": [1.0, 0.2], "q2": [1.0, 3.0]}, k=5)
+
+    fan_out, routed = results
+    assert fan_out["routing"] == "fan_out" and fan_out["avg_precision"] == 1.0
+    assert routed["shard_keys"] == {"cs": 1, "math": 1}
+    assert routed["routing_recall_ceiling"] == 1.0
+    assert fan_out["speedup_factor"] == 1.0
@@ -0,0 +1,163 @@
+from types import SimpleNamespace
+from unittest.mock import MagicMock, patch
+
+import pandas as pd
+import pytest
+from qdrant_client import QdrantClient, models
+
+from qdrant_evaluation.storage import (OPTIMIZER_KEYS, DEFAULT_OPTIMIZER_SETTINGS, storage_grid, storage_label,
+                                      apply_storage_config, evaluate_storage_configs, _original_storage_config)
+
+
+def test_storage_grid_and_labels():
+    """The grid expands all combinations and rejects unknown keys."""
+    grid = storage_grid(default_segment_number=[2, 8], on_disk_vectors=[False, True])
+
+    assert len(grid) == 4
+    assert storage_label(grid[-1]) == "segments=8,vectors_on_disk"
+    assert storage_label({}) == "default"
+    with pytest.raises(ValueError):
+        storage_grid(segments=[2])
+
+
+@patch("qdrant_evaluation.storage.wait_for_collection_green")
+def test_apply_storage_config_waits_until_segments_settle(wait):
+    """Optimizer, HNSW and vector settings are sent in one update and the segment count must stabilize."""
+    client = MagicMock()
+    client.get_collection.side_effect = [
+        SimpleNamespace(config=SimpleNamespace(params=SimpleNamespace(vectors={"full": None, "reduced": None}))),
+        SimpleNamespace(status=models.CollectionStatus.GREEN, segments_count=8),
+        SimpleNamespace(status=models.CollectionStatus.GREEN, segments_count=2),
+        SimpleNamespace(status=models.CollectionStatus.GREEN, segments_count=2),
+    ]
+
+    result = apply_storage_config(client, "papers", {"default_segment_number": 2, "on_disk_vectors": True},
+                                  settle_time=0.0)
+
+    update = client.update_collection.call_args.kwargs
+    assert update["optimizers_config"].default_segment_number == 2
+    assert update["hnsw_config"] is None
+    assert set(update["vectors_config"]) == {"full", "reduced"}
+    assert result["segments_count"] == 2
+    assert wait.call_count == 3
+
+
+@patch("qdrant_evaluation.storage.time.sleep")
+@patch("qdrant_evaluation.storage.time.perf_counter")
+@patch("qdrant_evaluation.storage.wait_for_collection_green")
+def test_apply_storage_config_times_until_segments_first_stable(wait, perf_counter, sleep):
+    """Optimization time ends at the poll that first saw the settled count, not after the confirming wait."""
+    client = MagicMock()
+    client.get_collection.side_effect = [
+        SimpleNamespace(status=models.CollectionStatus.GREEN, segments_count=8),
+        SimpleNamespace(status=models.CollectionStatus.GREEN, segments_count=2),
+        SimpleNamespace(status=models.CollectionStatus.GREEN, segments_count=2),
+    ]
+    perf_counter.side_effect = [0.0, 3.0, 7.0, 20.0]
+
+    result = apply_storage_config(client, "papers", {"default_segment_number": 2}, settle_time=10.0)
+
+    assert result == {"optimization_time_s": 7.0, "segments_count": 2}
+
+
+@patch("qdrant_evaluation.storage.wait_for_collection_green")
+def test_original_on_disk_vectors_restored_per_name(wait):
+    """On-disk flags of named vectors are saved and restored per name."""
+    client = MagicMock()
+    client.get_collection.return_value = SimpleNamespace(
+        status=models.CollectionStatus.GREEN, segments_count=1,
+        config=SimpleNamespace(
+            params=SimpleNamespace(vectors={"full": SimpleNamespace(on_disk=True),
+                                            "reduced": SimpleNamespace(on_disk=None)}),
+            optimizer_config=SimpleNamespace(**{key: None for key in OPTIMIZER_KEYS}),
+            hnsw_config=SimpleNamespace(on_disk=False)
+        )
+    )
+
+    original = _original_storage_config(client.get_collection("papers"))
+    apply_storage_config(client, "papers", original, settle_time=0.0)
+
+    assert original["on_disk_vectors"] == {"full": True, "reduced": False}
+    vectors_config = client.update_collection.call_args.kwargs["vectors_config"]
+    assert {name: diff.on_disk for name, diff in vectors_config.items()} == {"full": True, "reduced": False}
+    assert storage_label({"on_disk_vectors": original["on_disk_vectors"]}) == "vectors_on_disk=full"
+    assert storage_label({"on_disk_vectors": {"full": True, "reduced": True}}) == "vectors_on_disk"
+
+
+def test_evaluate_storage_configs_returns_dataframe():
+    """Every setting yields one row with its settings, quality and latency; the original config is restored."""
+    client = QdrantClient(":memory:")
+    client.create_collection("papers", vectors_config=models.VectorParams(size=2, distance=models.Distance.COSINE))
+    client.upsert("papers", points=[
+        models.PointStruct(id=i, vector=[1.0, i / 10], payload={"id": f"0704.{i:04d}"}) for i in range(20)
+    ])
+
+    with patch("qdrant_evaluation.storage.apply_storage_config", wraps=apply_storage_config) as apply:
+        df = evaluate_storage_configs(
+            client, "papers", {"q1": [1.0, 0.5], "q2": [1.0, 1.5]},
+            storage_settings=[{"default_segment_number": 2}, {"on_disk_vectors": True, "on_disk_hnsw": True}],
+            k=5, warmup=0, telemetry_interval=10.0, settle_time=0.0
+        )
+
+    assert isinstance(df, pd.DataFrame)
+    assert df["storage"].tolist() == ["segments=2", "vectors_on_disk,hnsw_on_disk"]
+    assert df["on_disk_vectors"].tolist() == [False, True]
+    assert (df["avg_precision"] == 1.0).all()
+    assert "p99_query_time_ms" in df.columns and "server_ram_resident_mb_peak" in df.columns
+    assert apply.call_count == 3
+
+
+def papers_collection():
+    client = QdrantClient(":memory:")
+    client.create_collection("papers", vectors_config=models.VectorParams(size=2, distance=models.Distance.COSINE))
+    client.upsert("papers", points=[
+        models.PointStruct(id=i, vector=[1.0, i / 10], payload={"id": f"0704.{i:04d}"}) for i in range(20)
+    ])
+    return client
+
+
+def recording_client(local, info):
+    """Wrap a local client so optimizer updates change the returned collection info, as on a server."""
+    def update_collection(collection_name, optimizers_config=None, hnsw_config=None, vectors_config=None):
+        if optimizers_config is not None:
+            for key, value in optimizers_config.model_dump(exclude_none=True).items():
+                setattr(info.config.optimizer_config, key, value)
+
+    client = MagicMock(wraps=local)
+    client.get_collection.return_value = info
+    client.update_collection.side_effect = update_collection
+    return client
+
+
+def test_evaluate_storage_configs_restores_unset_optimizer_settings():
+    """Unset optimizer settings are restored explicitly, since None in an update means 'no change'."""
+    local = papers_collection()
+    info = local.get_collection("papers")
+    info.config.optimizer_config.max_segment_size = 50000
+    info.config.optimizer_config.memmap_threshold = None
+    info.config.optimizer_config.indexing_threshold = None
+    client = recording_client(local, info)
+
+    evaluate_storage_configs(
+        client, "papers", {"q1": [1.0, 0.5]},
+        storage_settings=[{"default_segment_number": 4, "max_segment_size": 1000, "memmap_threshold": 1000,
+                           "indexing_threshold": 500}],
+        k=5, warmup=0, telemetry_interval=10.0, settle_time=0.0
+    )
+
+    restored = info.config.optimizer_config
+    assert (restored.default_segment_number, restored.max_segment_size) == (0, 50000)
+    assert restored.memmap_threshold == DEFAULT_OPTIMIZER_SETTINGS["memmap_threshold"]
+    assert restored.indexing_threshold == DEFAULT_OPTIMIZER_SETTINGS["indexing_threshold"]
+
+
+def test_evaluate_storage_configs_rejects_unrestorable_max_segment_size():
+    """An unset max_segment_size has no explicit value, so sweeping it would leave the collection modified."""
+    local = papers_collection()
+    client = recording_client(local, local.get_collection("papers"))
+
+    with pytest.raises(ValueError, match="max_segment_size"):
+        evaluate_storage_configs(client, "papers", {"q1": [1.0, 0.5]}, storage_settings=[{"max_segment_size": 1000}],
+                                 k=5, warmup=0, settle_time=0.0)
+
+    client.update_collection.assert_not_called()
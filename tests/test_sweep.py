@@ -0,0 +1,64 @@
+import json
+from types import SimpleNamespace
+from unittest.mock import MagicMock, patch
+
+import pandas as pd
+
+from qdrant_evaluation.sweep import pareto_frontier, run_hnsw_sweep, variant_name
+from qdrant_evaluation.timing import LatencyHistogram
+
+
+def test_variant_name_matches_notebook_naming():
+    """Variant names follow the <collection>_<m>_<ef_construct> convention."""
+    assert variant_name("arxiv_papers", 16, 32) == "arxiv_papers_16_32"
+    assert variant_name("arxiv_papers", 8, 100, {"type": "scalar", "always_ram": True}) == "arxiv_papers_8_100_scalar_ram"
+
+
+def test_pareto_frontier_drops_dominated_rows():
+    """Only rows without a better-or-equal alternative stay on the frontier."""
+    df = pd.DataFrame([
+        {"avg_precision": 0.99, "avg_query_time_ms": 5.0, "estimated_memory_mb": 100},
+        {"avg_precision": 0.90, "avg_query_time_ms": 2.0, "estimated_memory_mb": 100},
+        {"avg_precision": 0.90, "avg_query_time_ms": 3.0, "estimated_memory_mb": 100},
+        {"avg_precision": 0.80, "avg_query_time_ms": 2.0, "estimated_memory_mb": 50},
+    ])
+
+    result = pareto_frontier(df)
+
+    assert result["pareto_optimal"].tolist() == [True, True, False, True]
+
+
+def fake_measure(client, collection_name, vectors, **kwargs):
+    """Pretend every variant returns the ground truth in 1 ms."""
+    histogram = LatencyHistogram()
+    histogram.record_all([0.001] * len(vectors))
+    return [["a"]] * len(vectors), histogram, None
+
+
+@patch("qdrant_evaluation.sweep.build_variant_collection")
+@patch("qdrant_evaluation.sweep.get_ground_truth", return_value=([["a"]], [0.01]))
+@patch("qdrant_evaluation.sweep._measure_search", side_effect=fake_measure)
+def test_sweep_resumes_from_results_file(measure, ground_truth, build, tmp_path):
+    """Rows already in the results file are neither rebuilt nor re-evaluated."""
+    results_path = tmp_path / "sweep.jsonl"
+    results_path.write_text(json.dumps({
+        "collection": "papers_8_32", "m": 8, "ef_construct": 32, "quantization": "none",
+        "hnsw_ef": 16, "estimated_memory_mb": 1.0, "avg_precision": 1.0, "avg_query_time_ms": 1.0
+    }) + "\n")
+    client = MagicMock()
+    client.get_collection.return_value = SimpleNamespace(
+        points_count=100, config=SimpleNamespace(params=SimpleNamespace(vectors=SimpleNamespace(size=4)))
+    )
+
+    df = run_hnsw_sweep(
+        client, "papers", {"query": [0.1, 0.2, 0.3, 0.4]},
+        m_values=[8, 16], ef_construct_values=[32], hnsw_ef_values=[16],
+        results_path=str(results_path)
+    )
+
+    assert build.call_count == 1
+    assert build.call_args.args[2] == "papers_16_32"
+    assert measure.call_count == 1
+    assert sorted(df["collection"]) == ["papers_16_32", "papers_8_32"]
+    assert len(results_path.read_text().splitlines()) == 2
+    assert "pareto_optimal" in df.columns
@@ -0,0 +1,79 @@
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+import pytest
+
+from qdrant_evaluation.telemetry import parse_prometheus, summarize_telemetry, TelemetrySampler, MB
+
+METRICS = """
+# HELP memory_resident_bytes Resident memory
+# TYPE memory_resident_bytes gauge
+memory_resident_bytes 104857600
+rest_responses_total{method="POST",endpoint="/collections/{name}/points/query"} 10
+rest_responses_total{method="GET",endpoint="/metrics"} 5
+process_cpu_seconds_total 12.5
+"""
+
+
+def make_client(resident_values):
+    """Create a mocked client whose resident memory changes with every telemetry call."""
+    client = MagicMock()
+    client.http.service_api.metrics.return_value = METRICS
+    segment = SimpleNamespace(info=SimpleNamespace(ram_usage_bytes=MB, disk_usage_bytes=2 * MB))
+    shard = SimpleNamespace(local=SimpleNamespace(vectors_size_bytes=3 * MB, payloads_size_bytes=MB, segments=[segment, segment]))
+    client.http.service_api.telemetry.side_effect = [
+        SimpleNamespace(result=SimpleNamespace(
+            memory=SimpleNamespace(resident_bytes=value, allocated_bytes=value // 2),
+            collections=SimpleNamespace(collections=[SimpleNamespace(id="papers", shards=[shard])]),
+            hardware=None
+        ))
+        for value in resident_values
+    ]
+    client.get_collection.return_value = SimpleNamespace(status="green", segments_count=2, points_count=100, indexed_vectors_count=100)
+    return client
+
+
+def test_parse_prometheus_sums_labelled_samples():
+    """Comments are skipped and samples with different labels are summed."""
+    metrics = parse_prometheus(METRICS)
+
+    assert metrics["memory_resident_bytes"] == 104857600
+    assert metrics["rest_responses_total"] == 15
+    assert metrics["process_cpu_seconds_total"] == 12.5
+
+
+def test_summarize_telemetry_reports_peak_and_deltas():
+    """Memory is reported before, after and at its peak; CPU as a delta over the wall time."""
+    samples = [
+        {"time": 0.0, "resident_bytes": 100 * MB, "cpu_seconds": 10.0, "status": "green"},
+        {"time": 1.0, "resident_bytes": 300 * MB, "cpu_seconds": 11.0, "status": "yellow", "segments_count": 6},
+        {"time": 2.0, "resident_bytes": 200 * MB, "cpu_seconds": 13.0, "status": "green", "segments_count": 4, "disk_usage_bytes": 8 * MB},
+    ]
+
+    summary = summarize_telemetry(samples)
+
+    assert summary["server_ram_resident_mb_before"] == 100
+    assert summary["server_ram_resident_mb_peak"] == 300
+    assert summary["server_ram_resident_mb_after"] == 200
+    assert summary["server_cpu_seconds"] == 3.0
+    assert summary["server_cpu_utilization"] == 1.5
+    assert summary["collection_segments_count"] == 4
+    assert summary["collection_segments_count_max"] == 6
+    assert summary["collection_optimizing_share"] == 1 / 3
+    assert summary["collection_disk_usage_mb"] == 8
+    assert summary["server_hardware_cpu"] is None
+
+
+def test_sampler_samples_before_and_after():
+    """The sampler takes a sample on entry and exit and sums segment storage of the collection."""
+    client = make_client([100 * MB, 150 * MB])
+
+    with TelemetrySampler(client, "papers", interval=60) as sampler:
+        pass
+
+    summary = sampler.summary()
+    assert len(summary["telemetry_samples"]) == 2
+    assert summary["server_ram_resident_mb_after"] == 150
+    assert summary["collection_ram_usage_mb"] == 2
+    assert summary["collection_disk_usage_mb"] == 4
+    assert summary["collection_vectors_size_mb"] == pytest.approx(3)
@@ -0,0 +1,71 @@
+import random
+import statistics
+
+import pytest
+
+from qdrant_evaluation.evaluator import compute_avg_metrics, results_to_dataframe
+from qdrant_evaluation.timing import LatencyHistogram, timed_runs
+
+
+def test_histogram_percentiles_within_precision():
+    """Percentiles stay within the configured relative error over several magnitudes."""
+    random.seed(7)
+    values = [random.lognormvariate(-6, 1.5) for _ in range(5000)]
+    histogram = LatencyHistogram()
+    histogram.record_all(values)
+
+    ordered = sorted(values)
+    for percentile in (50, 90, 99):
+        expected = ordered[int(percentile / 100 * len(ordered)) - 1]
+        assert histogram.percentile(percentile) == pytest.approx(expected, rel=0.02)
+    assert histogram.max == max(values)
+    assert histogram.mean == pytest.approx(statistics.mean(values))
+    assert histogram.stddev == pytest.approx(statistics.stdev(values))
+
+
+def test_merged_histogram_equals_combined_recording():
+    """Merging two histograms gives the same distribution as recording all values in one."""
+    first, second, combined = LatencyHistogram(), LatencyHistogram(), LatencyHistogram()
+    first.record_all([0.001, 0.002, 0.003])
+    second.record_all([0.010, 0.020])
+    combined.record_all([0.001, 0.002, 0.003, 0.010, 0.020])
+
+    first.merge(second)
+
+    assert first.summary() == pytest.approx(combined.summary())
+
+
+def test_timed_runs_discards_warmup():
+    """Warmup passes run but are not recorded; repetitions are all recorded."""
+    calls = []
+
+    def run_pass():
+        calls.append(len(calls))
+        return [["a"]], [0.5 if len(calls) == 1 else 0.001]
+
+    ids, histogram = timed_runs(run_pass, warmup=1, repetitions=3)
+
+    assert len(calls) == 4
+    assert ids == [["a"]]
+    assert histogram.count == 3
+    assert histogram.max == 0.001
+
+
+def test_distribution_metrics_flow_into_aggregates_and_dataframe():
+    """Averages stay averages while percentiles come from the merged histograms."""
+    fast, slow = LatencyHistogram(), LatencyHistogram()
+    fast.record_all([0.001] * 99)
+    slow.record_all([0.1])
+    data = [
+        {"avg_precision": 1.0, **fast.summary(), "latency_histogram": fast},
+        {"avg_precision": 0.5, **slow.summary(), "latency_histogram": slow},
+    ]
+
+    metrics = compute_avg_metrics(data)
+    df = results_to_dataframe(data)
+
+    assert metrics["avg_precision"] == pytest.approx(0.75)
+    assert metrics["p50_query_time_ms"] == pytest.approx(1.0, rel=0.01)
+    assert metrics["max_query_time_ms"] == pytest.approx(100.0)
+    assert "latency_histogram" not in df.columns
+    assert {"p50_query_time_ms", "p99_query_time_ms", "std_query_time_ms"} <= set(df.columns)
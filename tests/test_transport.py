@@ -0,0 +1,71 @@
+import json
+
+import pytest
+from qdrant_client import models
+from qdrant_client.grpc import QueryResponse, ScoredPoint, Value
+
+from qdrant_evaluation.transport import RestTransport, GrpcTransport, query_with_breakdown, measure_latency_breakdown
+
+
+class FakeTransport:
+    """Transport answering every query with fixed IDs and server time."""
+
+    name = "fake"
+
+    def __init__(self, server_time=0.001):
+        self.server_time = server_time
+        self.requests = []
+
+    def encode(self, collection_name, request):
+        self.requests.append((collection_name, request))
+        return b"request"
+
+    def send(self, encoded):
+        return b"response"
+
+    def decode(self, raw):
+        return ["a", "b"], self.server_time
+
+
+def test_rest_transport_encodes_and_decodes():
+    """REST requests are plain query JSON and responses yield payload IDs and server time."""
+    transport = RestTransport()
+    path, body = transport.encode("papers", models.QueryRequest(query=[1.0, 2.0], limit=2, with_payload=True))
+    raw = json.dumps({"result": {"points": [{"id": 1, "payload": {"id": "x"}}]}, "time": 0.002}).encode()
+
+    assert path == "/collections/papers/points/query"
+    assert json.loads(body) == {"query": [1.0, 2.0], "limit": 2, "with_payload": True}
+    assert transport.decode(raw) == (["x"], 0.002)
+    transport.close()
+
+
+def test_grpc_transport_decodes_payload_ids():
+    """gRPC responses are parsed from bytes into payload IDs and server time."""
+    transport = GrpcTransport()
+    raw = QueryResponse(result=[ScoredPoint(payload={"id": Value(string_value="x")})], time=0.003).SerializeToString()
+
+    assert transport.decode(raw) == (["x"], pytest.approx(0.003))
+    assert transport.encode("papers", models.QueryRequest(query=[1.0], limit=1))
+    transport.close()
+
+
+def test_breakdown_stages_add_up():
+    """Encode, transport and decode add up to the total and network excludes server time."""
+    ids, stages = query_with_breakdown(FakeTransport(server_time=0.0), "papers", [1.0], k=2)
+
+    assert ids == ["a", "b"]
+    assert stages["total_time"] == pytest.approx(stages["encode_time"] + stages["transport_time"] + stages["decode_time"])
+    assert stages["network_time"] == stages["transport_time"]
+
+
+def test_measure_latency_breakdown_records_every_stage():
+    """Every stage is summarized and warmup queries are not recorded."""
+    transport = FakeTransport()
+
+    results = measure_latency_breakdown(transport, "papers", [[1.0], [2.0]], warmup=1, repetitions=2)
+
+    assert len(transport.requests) == 6
+    assert results["latency_histogram"].count == 4
+    assert results["avg_server_time_ms"] == pytest.approx(1.0, rel=0.01)
+    for stage in ("encode_time", "transport_time", "network_time", "decode_time"):
+        assert f"p99_{stage}_ms" in results
@@ -0,0 +1,37 @@
+from unittest.mock import MagicMock, patch
+
+from qdrant_evaluation.timing import LatencyHistogram
+from qdrant_evaluation.tuner import tune_hnsw_ef
+
+GROUND_TRUTH = [list(range(100))]
+
+
+def fake_measure(client, collection_name, vectors, search_params=None, **kwargs):
+    """Return as many correct IDs as the ef value, so precision@100 equals ef / 100."""
+    histogram = LatencyHistogram()
+    histogram.record(search_params.hnsw_ef / 1e5)
+    correct = min(search_params.hnsw_ef, 100)
+    return [list(range(correct))], histogram, None
+
+
+@patch("qdrant_evaluation.tuner.get_ground_truth", return_value=(GROUND_TRUTH, [0.01]))
+@patch("qdrant_evaluation.tuner._measure_search", side_effect=fake_measure)
+def test_tuner_finds_smallest_ef_meeting_target(measure, ground_truth):
+    """Exponential search plus bisection lands on the smallest passing ef."""
+    result = tune_hnsw_ef(MagicMock(), "papers", {"query": [0.1]}, target_precision=0.95, k=100, min_ef=10)
+
+    assert result["hnsw_ef"] == 95
+    assert result["target_met"] is True
+    assert result["avg_precision"] == 0.95
+    assert len(result["evaluated"]) < 15
+
+
+@patch("qdrant_evaluation.tuner.get_ground_truth", return_value=(GROUND_TRUTH, [0.01]))
+@patch("qdrant_evaluation.tuner._measure_search", side_effect=fake_measure)
+def test_tuner_reports_unreachable_target(measure, ground_truth):
+    """If even max_ef misses the target, the largest ef is returned and flagged."""
+    result = tune_hnsw_ef(MagicMock(), "papers", {"query": [0.1]}, target_precision=0.95, k=100, min_ef=10, max_ef=50)
+
+    assert result["hnsw_ef"] == 50
+    assert result["target_met"] is False
+    assert [entry["hnsw_ef"] for entry in result["evaluated"]] == [10, 20, 40, 50]
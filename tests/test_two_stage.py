@@ -0,0 +1,78 @@
+import json
+
+import numpy as np
+import pytest
+from qdrant_client import QdrantClient, models
+
+from qdrant_data_ingestion import DataIngestion, PcaProjection, FULL_VECTOR, REDUCED_VECTOR
+from qdrant_evaluation.two_stage import build_reduced_collection, get_two_stage_points, evaluate_two_stage
+
+
+def low_rank_vectors(n=200, dimension=16, rank=4, seed=0):
+    """Vectors spanning a low-dimensional subspace, so PCA keeps their neighbourhoods."""
+    rng = np.random.default_rng(seed)
+    return (rng.normal(size=(n, rank)) @ rng.normal(size=(rank, dimension))).astype(np.float32)
+
+
+def test_pca_projection_roundtrip(tmp_path):
+    """A fitted projection is normalized, reduces the dimension and survives save and load."""
+    vectors = low_rank_vectors()
+    projection = PcaProjection.fit(vectors, 4)
+
+    reduced = projection.transform(vectors)
+    assert reduced.shape == (200, 4)
+    np.testing.assert_allclose(np.linalg.norm(reduced, axis=1), 1.0, rtol=1e-5)
+
+    projection.save(str(tmp_path / "pca.npz"))
+    loaded = PcaProjection.load(str(tmp_path / "pca.npz"))
+    np.testing.assert_allclose(loaded.transform(vectors[0]), reduced[0], rtol=1e-5)
+
+
+def test_ingestion_stores_reduced_vector(tmp_path):
+    """Ingestion with reduced_vector_size fits the projection and stores both named vectors."""
+    vectors = low_rank_vectors(n=30)
+    data_path = tmp_path / "papers.json"
+    data_path.write_text("\n".join(
+        json.dumps({"id": f"0704.{i:04d}", "embedding": vector.tolist()}) for i, vector in enumerate(vectors)
+    ))
+
+    ingestion = DataIngestion(batch_size=8)
+    ingestion.client = QdrantClient(":memory:")
+    count = ingestion.ingest_data(str(data_path), "papers", vector_size=16, show_progress=False,
+                                  reduced_vector_size=4, pca_sample_size=20, pca_path=str(tmp_path / "pca.npz"))
+
+    assert count == 30
+    point = ingestion.client.scroll("papers", limit=1, with_vectors=True)[0][0]
+    assert len(point.vector[FULL_VECTOR]) == 16
+    assert len(point.vector[REDUCED_VECTOR]) == 4
+    assert PcaProjection.load(str(tmp_path / "pca.npz")).n_components == 4
+
+
+def test_two_stage_matches_full_vector_search(tmp_path):
+    """Rescoring enough reduced-vector candidates with the full vector recovers exact results."""
+    client = QdrantClient(":memory:")
+    vectors = low_rank_vectors()
+    client.create_collection("papers", vectors_config=models.VectorParams(size=16, distance=models.Distance.COSINE))
+    client.upsert("papers", points=[
+        models.PointStruct(id=i, vector=vector.tolist(), payload={"id": f"0704.{i:04d}"}) for i, vector in enumerate(vectors)
+    ])
+
+    projection = build_reduced_collection(client, "papers", "papers_reduced", n_components=4, sample_size=100,
+                                          pca_path=str(tmp_path / "pca.npz"))
+    assert client.count("papers_reduced").count == 200
+
+    with pytest.raises(ValueError):
+        build_reduced_collection(client, "papers", "papers_reduced", n_components=4, pca_path=str(tmp_path / "pca.npz"))
+    with pytest.raises(ValueError):
+        build_reduced_collection(client, "papers", "papers", n_components=4, overwrite=True)
+    assert client.count("papers").count == 200
+
+    ids, _ = get_two_stage_points(client, "papers_reduced", vectors[3].tolist(), projection.transform(vectors[3]).tolist(), k=5)
+    assert ids[0] == "0704.0003"
+
+    queries = {f"q{i}": vector for i, vector in enumerate(low_rank_vectors(n=5, seed=0) + 0.01)}
+    results = evaluate_two_stage(client, "papers_reduced", queries, projection, candidates_values=[200], k=5)
+
+    assert [r["mode"] for r in results] == ["full", "reduced", "two_stage"]
+    assert results[0]["recall_delta"] == 0.0
+    assert results[-1]["avg_recall_at_5"] == 1.0